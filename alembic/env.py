@@ -6,7 +6,8 @@ from sqlalchemy import pool
 from alembic import context
 
 from src.app.adapters.persistence.base import Base
-from src.app.adapters.persistence.models import user_model, token_model
+from src.app.adapters.persistence.models import user_model, token_model, social_account_model
+from src.settings.environment import get_settings
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -23,6 +24,13 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# alembic.ini에 URL이 없으면 애플리케이션 설정(동기 드라이버)을 사용
+if not config.get_main_option("sqlalchemy.url"):
+    config.set_main_option(
+        "sqlalchemy.url",
+        get_settings().database.get_sync_url_connection().replace("%", "%%")
+    )
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -0,0 +1,51 @@
+"""baseline: users, tokens
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+기존에 Base.metadata.create_all로 만들어진 DB는 `alembic stamp 0001` 후 upgrade 합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('email', sa.String(255), nullable=False, unique=True),
+        sa.Column('user_type', sa.String(10), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('last_login', sa.DateTime(), nullable=True),
+        sa.Column('social_accounts', sa.JSON(), nullable=True),
+        sa.Column('state', sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        'tokens',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.user_id'), nullable=False),
+        sa.Column('access_token', sa.String(), nullable=False),
+        sa.Column('refresh_token', sa.String(), nullable=False),
+        sa.Column('access_token_expires', sa.DateTime(), nullable=False),
+        sa.Column('refresh_token_expires', sa.DateTime(), nullable=False),
+        sa.Column('is_revoked', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('revoked_at', sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('tokens')
+    op.drop_table('users')
@@ -0,0 +1,73 @@
+"""user_social_accounts lookup table
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+users.social_accounts(JSON)를 cast 비교로 찾던 조회를 (provider, provider_id) PK 인덱스로 대체.
+기존 데이터는 user_id 순으로 BACKFILL_BATCH_SIZE 건씩 나눠 커밋하며 채운다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 10000
+
+BACKFILL_BATCH = sa.text("""
+    WITH batch AS (
+        SELECT user_id, social_accounts
+        FROM users
+        WHERE user_id > :last_user_id
+        ORDER BY user_id
+        LIMIT :batch_size
+    ), linked AS (
+        INSERT INTO user_social_accounts (provider, provider_id, user_id)
+        SELECT social.key, social.value, batch.user_id
+        FROM batch, json_each_text(batch.social_accounts) AS social
+        WHERE batch.social_accounts IS NOT NULL
+          AND json_typeof(batch.social_accounts) = 'object'
+        ON CONFLICT DO NOTHING
+    )
+    SELECT max(user_id::text)::uuid FROM batch
+""")
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_social_accounts',
+        sa.Column('provider', sa.String(32), primary_key=True),
+        sa.Column('provider_id', sa.String(255), primary_key=True),
+        sa.Column(
+            'user_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('users.user_id', ondelete='CASCADE'),
+            nullable=False,
+        ),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index('ix_user_social_accounts_user_id', 'user_social_accounts', ['user_id'])
+
+    # 배치마다 커밋하여 긴 트랜잭션/락을 피함
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        last_user_id = '00000000-0000-0000-0000-000000000000'
+        while True:
+            last_user_id = bind.execute(
+                BACKFILL_BATCH,
+                {"last_user_id": last_user_id, "batch_size": BACKFILL_BATCH_SIZE},
+            ).scalar()
+            if last_user_id is None:
+                break
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_social_accounts_user_id', table_name='user_social_accounts')
+    op.drop_table('user_social_accounts')
@@ -0,0 +1,59 @@
+"""tokens: store SHA-256 digests and add lookup indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+
+- access_token / refresh_token 을 bytea(SHA-256 digest, 32 bytes)로 변환 (테이블 rewrite)
+- 이전 refresh 로직이 같은 토큰으로 중복 row를 남겼으므로 가장 최근 row만 유지
+- 인덱스는 CONCURRENTLY로 생성하여 쓰기를 막지 않음
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for column in ('access_token', 'refresh_token'):
+        op.execute(f"""
+            DELETE FROM tokens older USING tokens newer
+            WHERE older.{column} = newer.{column} AND older.id < newer.id
+        """)
+        op.alter_column(
+            'tokens', column,
+            type_=sa.LargeBinary(32),
+            postgresql_using=f"sha256(convert_to({column}, 'UTF8'))",
+        )
+
+    with op.get_context().autocommit_block():
+        op.create_index('ux_tokens_access_token', 'tokens', ['access_token'],
+                        unique=True, postgresql_concurrently=True)
+        op.create_index('ux_tokens_refresh_token', 'tokens', ['refresh_token'],
+                        unique=True, postgresql_concurrently=True)
+        op.create_index('ix_tokens_user_id', 'tokens', ['user_id'],
+                        postgresql_concurrently=True)
+        op.create_index('ix_tokens_refresh_token_expires', 'tokens', ['refresh_token_expires'],
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tokens_refresh_token_expires', table_name='tokens', postgresql_concurrently=True)
+        op.drop_index('ix_tokens_user_id', table_name='tokens', postgresql_concurrently=True)
+        op.drop_index('ux_tokens_refresh_token', table_name='tokens', postgresql_concurrently=True)
+        op.drop_index('ux_tokens_access_token', table_name='tokens', postgresql_concurrently=True)
+
+    # digest는 원문으로 되돌릴 수 없으므로 hex 문자열로만 변환
+    for column in ('access_token', 'refresh_token'):
+        op.alter_column(
+            'tokens', column,
+            type_=sa.String(),
+            postgresql_using=f"encode({column}, 'hex')",
+        )
@@ -0,0 +1,101 @@
+"""tokens: range-partition by refresh_token_expires (daily)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+
+- 기존 tokens 를 tokens_legacy 로 이름 변경 후 파티션 테이블 tokens 생성
+- PK / unique 인덱스는 파티션 키(refresh_token_expires)를 포함해야 함
+- 어제 ~ 14일 뒤까지 일 단위 파티션과 default 파티션 생성 (이후는 TokenPartitionManager가 관리)
+- 이미 만료된 지 하루 이상 지난 토큰은 옮기지 않음
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREMAKE_DAYS = 14
+COLUMNS = (
+    "id, user_id, access_token, refresh_token, access_token_expires, "
+    "refresh_token_expires, is_revoked, created_at, revoked_at"
+)
+INDEXES = ('ux_tokens_access_token', 'ux_tokens_refresh_token', 'ix_tokens_user_id', 'ix_tokens_refresh_token_expires')
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE tokens RENAME TO tokens_legacy")
+    op.execute("ALTER TABLE tokens_legacy RENAME CONSTRAINT tokens_pkey TO tokens_legacy_pkey")
+    for index in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    op.execute("""
+        CREATE TABLE tokens (
+            id integer NOT NULL DEFAULT nextval('tokens_id_seq'),
+            user_id uuid NOT NULL REFERENCES users(user_id),
+            access_token bytea NOT NULL,
+            refresh_token bytea NOT NULL,
+            access_token_expires timestamp NOT NULL,
+            refresh_token_expires timestamp NOT NULL,
+            is_revoked boolean,
+            created_at timestamp,
+            revoked_at timestamp,
+            PRIMARY KEY (id, refresh_token_expires)
+        ) PARTITION BY RANGE (refresh_token_expires)
+    """)
+    op.execute("ALTER SEQUENCE tokens_id_seq OWNED BY tokens.id")
+    op.execute("CREATE TABLE tokens_default PARTITION OF tokens DEFAULT")
+
+    today = datetime.now(timezone.utc).date()
+    for offset in range(-1, PREMAKE_DAYS + 1):
+        day = today + timedelta(days=offset)
+        op.execute(
+            f"CREATE TABLE tokens_p{day:%Y%m%d} PARTITION OF tokens "
+            f"FOR VALUES FROM ('{day}') TO ('{day + timedelta(days=1)}')"
+        )
+
+    op.create_index('ux_tokens_access_token', 'tokens', ['access_token', 'refresh_token_expires'], unique=True)
+    op.create_index('ux_tokens_refresh_token', 'tokens', ['refresh_token', 'refresh_token_expires'], unique=True)
+    op.create_index('ix_tokens_user_id', 'tokens', ['user_id'])
+    op.create_index('ix_tokens_refresh_token_expires', 'tokens', ['refresh_token_expires'])
+
+    op.execute(f"""
+        INSERT INTO tokens ({COLUMNS})
+        SELECT {COLUMNS} FROM tokens_legacy
+        WHERE refresh_token_expires >= '{today - timedelta(days=1)}'
+    """)
+    op.execute("DROP TABLE tokens_legacy")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE tokens RENAME TO tokens_partitioned")
+    op.execute("ALTER TABLE tokens_partitioned RENAME CONSTRAINT tokens_pkey TO tokens_partitioned_pkey")
+    for index in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    op.execute("""
+        CREATE TABLE tokens (
+            id integer NOT NULL DEFAULT nextval('tokens_id_seq') PRIMARY KEY,
+            user_id uuid NOT NULL REFERENCES users(user_id),
+            access_token bytea NOT NULL,
+            refresh_token bytea NOT NULL,
+            access_token_expires timestamp NOT NULL,
+            refresh_token_expires timestamp NOT NULL,
+            is_revoked boolean,
+            created_at timestamp,
+            revoked_at timestamp
+        )
+    """)
+    op.execute("ALTER SEQUENCE tokens_id_seq OWNED BY tokens.id")
+    op.execute(f"INSERT INTO tokens ({COLUMNS}) SELECT {COLUMNS} FROM tokens_partitioned")
+    op.execute("DROP TABLE tokens_partitioned")
+
+    op.create_index('ux_tokens_access_token', 'tokens', ['access_token'], unique=True)
+    op.create_index('ux_tokens_refresh_token', 'tokens', ['refresh_token'], unique=True)
+    op.create_index('ix_tokens_user_id', 'tokens', ['user_id'])
+    op.create_index('ix_tokens_refresh_token_expires', 'tokens', ['refresh_token_expires'])
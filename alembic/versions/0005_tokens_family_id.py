@@ -0,0 +1,32 @@
+"""tokens: add family_id for refresh-token rotation
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+
+- 기존 토큰은 각각 독립된 family로 간주하여 gen_random_uuid()로 채움
+- 파티션 부모 테이블에 만든 인덱스는 각 파티션에 전파됨 (CONCURRENTLY 불가)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tokens', sa.Column('family_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.execute("UPDATE tokens SET family_id = gen_random_uuid() WHERE family_id IS NULL")
+    op.alter_column('tokens', 'family_id', nullable=False)
+    op.create_index('ix_tokens_family_id', 'tokens', ['family_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tokens_family_id', table_name='tokens')
+    op.drop_column('tokens', 'family_id')
@@ -0,0 +1,53 @@
+"""
+JWT denylist Bloom filter 오탐률/성능 측정
+
+capacity개의 jti를 넣은 필터에 넣지 않은 jti를 probes개 조회하여 실제 false positive 비율을
+목표치/이론치와 비교하고, 메모리 사용량과 조회 시간(파이썬 set 대비)을 출력합니다.
+용량을 넘겨 채운 경우(2배)의 오탐률 악화도 함께 확인합니다.
+
+    python -m scripts.bench_bloom_filter [capacity=100000] [probes=1000000]
+"""
+import sys
+import time
+from uuid import uuid4
+
+from src.app.infrastructure.cache.bloom_filter import BloomFilter
+
+ERROR_RATES = [0.01, 0.001, 0.0001]
+
+
+def measure(bloom: BloomFilter, probes: list) -> tuple:
+    started = time.perf_counter()
+    false_positives = sum(1 for jti in probes if jti in bloom)
+    elapsed = time.perf_counter() - started
+    return false_positives / len(probes), elapsed / len(probes) * 1e9
+
+
+def main(capacity: int, probes: int) -> None:
+    revoked = [uuid4().hex for _ in range(capacity * 2)]
+    others = [uuid4().hex for _ in range(probes)]
+
+    denylist = set(revoked[:capacity])
+    started = time.perf_counter()
+    for jti in others:
+        jti in denylist
+    set_ns = (time.perf_counter() - started) / probes * 1e9
+    print(f"python set: {set_ns:.0f} ns/lookup, ~{sys.getsizeof(denylist) / 1024 / 1024:.1f} MB (table only)\n")
+
+    print(f"{'target':>8} {'fill':>6} {'k':>3} {'size':>9} {'estimated':>10} {'measured':>10} {'ns/lookup':>10}")
+    for error_rate in ERROR_RATES:
+        bloom = BloomFilter(capacity, error_rate)
+        for fill in (1, 2):
+            for jti in revoked[bloom.count:capacity * fill]:
+                bloom.add(jti)
+            assert all(jti in bloom for jti in revoked[:1000]), "false negative"
+            measured, ns = measure(bloom, others)
+            print(
+                f"{error_rate:>8} {fill:>5}x {bloom.hash_count:>3} {bloom.nbytes / 1024:>7.0f}KB "
+                f"{bloom.estimated_false_positive_rate():>10.5f} {measured:>10.5f} {ns:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [100_000, 1_000_000][len(args):]))
@@ -0,0 +1,80 @@
+"""
+요청 경로 계측 비용 측정 (PrometheusMiddleware + hot path 카운터)
+
+즉시 200을 반환하는 ASGI 앱을 middleware 없이/있이 requests번 호출하여 요청당 추가 지연(µs)과
+카운터 inc / histogram observe 한 번의 비용을 출력합니다. 라운드 중 최솟값을 사용하며,
+middleware 추가 지연이 예산(METRICS_BUDGET_US, 기본 20µs)을 넘으면 exit 1.
+multiprocess 모드(mmap 기록) 비용은 PROMETHEUS_MULTIPROC_DIR=<빈 디렉터리>로 실행하여 확인합니다.
+
+    python -m scripts.bench_metrics [requests=20000] [rounds=5]
+"""
+import asyncio
+import os
+import sys
+import time
+
+from src.app.infrastructure.monitoring import prometheus as metrics
+
+
+class _Route:
+    path = "/api/v1/users/{user_id}"
+
+
+ROUTE = _Route()
+
+
+async def app(scope, receive, send):
+    scope["route"] = ROUTE
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def run(asgi, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        scope = {"type": "http", "method": "GET", "path": "/api/v1/users/1"}
+        await asgi(scope, receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def per_call(func, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+async def main(requests: int, rounds: int) -> int:
+    budget_us = float(os.environ.get("METRICS_BUDGET_US", 20))
+    instrumented = metrics.PrometheusMiddleware(app)
+
+    bare = min([await run(app, requests) for _ in range(rounds)])
+    wrapped = min([await run(instrumented, requests) for _ in range(rounds)])
+    counter = min(per_call(metrics.JWT_VERIFY_VALID.inc, requests) for _ in range(rounds))
+    histogram = metrics.HTTP_REQUEST_DURATION.labels("GET", "/bench")
+    observe = min(per_call(lambda: histogram.observe(0.003), requests) for _ in range(rounds))
+
+    mode = "disabled" if not metrics.METRICS_ENABLED else ("multiprocess" if metrics.MULTIPROC_DIR else "single process")
+    overhead = wrapped - bare
+    print(f"metrics: {mode}")
+    print(f"bare app          {bare:8.2f} us/request")
+    print(f"with middleware   {wrapped:8.2f} us/request  (+{overhead:.2f} us, budget {budget_us:.0f} us)")
+    print(f"counter.inc       {counter:8.2f} us")
+    print(f"histogram.observe {observe:8.2f} us")
+    if overhead > budget_us:
+        print("FAIL: middleware overhead over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    sys.exit(asyncio.run(main(*(args + [20000, 5][len(args):]))))
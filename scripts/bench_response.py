@@ -0,0 +1,134 @@
+"""
+/api/v1/users/me 응답 생성 경로별 초당 요청 수 비교
+
+같은 토큰 검증(get_token_verifier 캐시)을 거친 뒤 응답을 만드는 방식만 바꿔 ASGI 앱을 in-process로 호출합니다 (3회 중 최고치).
+    - before:            Response[UserResponse] 모델 반환 -> response_model 재검증 -> stdlib JSONResponse
+    - create_response:   캐시된 TypeAdapter로 봉투 검증 -> response_model 재검증 -> ORJSONResponse
+    - skip_validation:   create_response(skip_validation=True), 봉투 검증/재직렬화 생략
+    - users/me (raw):    실제 user_router, 검증 캐시에 보관된 직렬화 본문을 그대로 사용
+
+    python -m scripts.bench_response [requests=5000]
+"""
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+from fastapi import Depends, FastAPI
+from fastapi.responses import JSONResponse
+
+from src.app.api.v1.dependencies.token import authenticate
+from src.app.api.v1.endpoints.users import api_key_cookie, user_router
+from src.app.api.v1.schemas.auth import UserResponse
+from src.app.api.v1.schemas.common import Response
+from src.app.api.v1.schemas.response import ORJSONResponse, create_response
+from src.settings.environment import get_settings
+
+PATH = "/api/v1/users/me"
+
+
+def make_token() -> str:
+    payload = {
+        "sub": "1234567890",
+        "email": "user@example.com",
+        "name": "user",
+        "exp": datetime.now(timezone.utc) + timedelta(minutes=180),
+        "iss": "auth-service",
+        "user_id": "11111111-1111-1111-1111-111111111111",
+        "user_type": "USER",
+    }
+    return jwt.encode(payload, get_settings().secret.secret_key, algorithm=get_settings().secret.algorithm)
+
+
+def to_user(claims: dict) -> UserResponse:
+    return UserResponse(
+        user_id=str(claims.get("user_id")),
+        email=claims.get("email"),
+        name=claims.get("name"),
+        user_type=str(claims.get("user_type")),
+        social_accounts={"google": claims.get("sub")}
+    )
+
+
+def envelope_app(response_class, skip_validation: bool = False) -> FastAPI:
+    app = FastAPI(default_response_class=response_class)
+
+    @app.get(PATH, response_model=Response[UserResponse])
+    async def get_me(token: str = Depends(api_key_cookie)):
+        verified = await authenticate(token)
+        if response_class is JSONResponse:
+            # 기존 create_response: 매번 Response 모델 생성 후 FastAPI가 재검증/직렬화
+            return Response(
+                timestamp=datetime.now(timezone.utc),
+                status_code=200,
+                message="User information retrieved",
+                data=to_user(verified.claims)
+            )
+        return create_response(
+            to_user(verified.claims),
+            message="User information retrieved",
+            skip_validation=skip_validation
+        )
+
+    return app
+
+
+def router_app() -> FastAPI:
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.include_router(user_router)
+    return app
+
+
+async def call(app: FastAPI, token: str) -> int:
+    """HTTP 클라이언트 비용이 섞이지 않도록 ASGI 인터페이스를 직접 호출"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": PATH, "raw_path": PATH.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"cookie", f"access_token={token}".encode())],
+        "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(app: FastAPI, token: str, requests: int, rounds: int = 3) -> float:
+    for _ in range(200):
+        assert await call(app, token) == 200
+    best = 0.0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(requests):
+            await call(app, token)
+        best = max(best, requests / (time.perf_counter() - started))
+    return best
+
+
+async def main(requests: int) -> None:
+    token = make_token()
+    variants = [
+        ("before", envelope_app(JSONResponse)),
+        ("create_response", envelope_app(ORJSONResponse)),
+        ("skip_validation", envelope_app(ORJSONResponse, skip_validation=True)),
+        ("users/me (raw)", router_app()),
+    ]
+    baseline = None
+    print(f"{'variant':<18}{'req/s':>10}{'speedup':>10}")
+    for name, app in variants:
+        rps = await measure(app, token, requests)
+        baseline = baseline or rps
+        print(f"{name:<18}{rps:>10.0f}{rps / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
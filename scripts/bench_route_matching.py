@@ -0,0 +1,88 @@
+"""
+요청 수가 늘어도 route 매칭 비용이 일정한지 확인
+
+create_app()으로 조립한 앱에 windows x requests 만큼 요청을 보내며 구간별 평균 지연과 route 수를 출력합니다.
+매칭되지 않는 경로(404)는 route table 전체를 훑으므로 table 크기에 가장 민감합니다.
+비교용 legacy는 이전 AuthApplication.__call__처럼 구간마다 DispatcherLoader를 다시 실행하여
+route table이 계속 커지는 경우입니다.
+
+    python -m scripts.bench_route_matching [windows=10] [requests=2000]
+"""
+import asyncio
+import sys
+import time
+
+from fastapi import FastAPI
+
+from src.main import create_app
+from src.settings.dispatch import DispatcherLoader
+
+PATHS = ["/api/v1/auth", "/not-found"]
+
+
+async def call(app: FastAPI, path: str) -> int:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def legacy_app() -> FastAPI:
+    app = FastAPI()
+    DispatcherLoader.execute(app)
+    return app
+
+
+def redispatch(app: FastAPI) -> None:
+    # 이전 동작 재현: 호출될 때마다 router를 다시 등록
+    app.state.dispatched = False
+    DispatcherLoader.execute(app)
+
+
+async def run(name: str, app: FastAPI, windows: int, requests: int, grow: bool) -> list:
+    for path in PATHS:
+        await call(app, path)
+    results = []
+    for window in range(windows):
+        if grow and window:
+            redispatch(app)
+        row = [len(app.routes)]
+        for path in PATHS:
+            started = time.perf_counter()
+            for _ in range(requests):
+                await call(app, path)
+            row.append((time.perf_counter() - started) / requests * 1e6)
+        results.append(row)
+    print(f"\n[{name}]")
+    print(f"{'window':>6}{'routes':>8}" + "".join(f"{path + ' (us)':>22}" for path in PATHS))
+    for window, (routes, *latencies) in enumerate(results):
+        print(f"{window:>6}{routes:>8}" + "".join(f"{latency:>22.1f}" for latency in latencies))
+    return results
+
+
+async def main(windows: int, requests: int) -> None:
+    app = create_app()
+    print(f"assembly: {app.state.assembly}")
+    frozen = await run("create_app (frozen)", app, windows, requests, grow=False)
+    legacy = await run("legacy (re-dispatch per call)", legacy_app(), windows, requests, grow=True)
+    for name, rows in (("create_app", frozen), ("legacy", legacy)):
+        first, last = rows[0][2], rows[-1][2]
+        print(f"{name}: 404 matching cost last/first window = {last / first:.2f}x")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(main(*(args + [10, 2000][len(args):])))
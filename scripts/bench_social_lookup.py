@@ -0,0 +1,85 @@
+"""
+소셜 계정 조회 비교: users.social_accounts JSON 비교 vs user_social_accounts PK 인덱스
+
+별도 스키마(bench_social)에 사용자를 채운 뒤 임의의 social_id로 조회 시간을 측정하고 스키마를 삭제합니다.
+
+    python -m scripts.bench_social_lookup [users=1000000] [lookups=200]
+"""
+import asyncio
+import random
+import sys
+import time
+
+from sqlalchemy import text
+
+from src.app.adapters.persistence.session import AsyncRelationDataBaseTemplate
+
+SCHEMA = "bench_social"
+
+SETUP = [
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    f"""CREATE TABLE {SCHEMA}.users (
+        user_id uuid PRIMARY KEY,
+        email varchar(255) UNIQUE NOT NULL,
+        social_accounts json
+    )""",
+    f"""INSERT INTO {SCHEMA}.users
+        SELECT gen_random_uuid(), 'user' || g || '@example.com', json_build_object('google', 'g' || g)
+        FROM generate_series(1, :users) g""",
+    f"""CREATE TABLE {SCHEMA}.user_social_accounts (
+        provider varchar(32),
+        provider_id varchar(255),
+        user_id uuid NOT NULL REFERENCES {SCHEMA}.users(user_id) ON DELETE CASCADE,
+        PRIMARY KEY (provider, provider_id)
+    )""",
+    f"""INSERT INTO {SCHEMA}.user_social_accounts
+        SELECT 'google', social_accounts ->> 'google', user_id FROM {SCHEMA}.users""",
+    f"ANALYZE {SCHEMA}.users",
+    f"ANALYZE {SCHEMA}.user_social_accounts",
+]
+
+JSON_LOOKUP = text(f"""
+    SELECT * FROM {SCHEMA}.users
+    WHERE CAST((social_accounts -> 'google') AS VARCHAR) = :social_id
+""")
+
+INDEXED_LOOKUP = text(f"""
+    SELECT u.* FROM {SCHEMA}.users u
+    JOIN {SCHEMA}.user_social_accounts s ON s.user_id = u.user_id
+    WHERE s.provider = 'google' AND s.provider_id = :social_id
+""")
+
+
+async def measure(conn, label: str, stmt, social_ids: list) -> None:
+    start = time.perf_counter()
+    for social_id in social_ids:
+        await conn.execute(stmt, {"social_id": social_id})
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22} {elapsed / len(social_ids) * 1000:>10.3f} ms/lookup")
+
+    plan = await conn.execute(text("EXPLAIN " + str(stmt)), {"social_id": social_ids[0]})
+    print("  " + "\n  ".join(row[0] for row in plan))
+
+
+async def main(users: int, lookups: int) -> None:
+    engine = AsyncRelationDataBaseTemplate.get_engine()
+    try:
+        async with engine.begin() as conn:
+            print(f"seeding {users:,} users ...")
+            for stmt in SETUP:
+                await conn.execute(text(stmt), {"users": users})
+
+        social_ids = [f"g{random.randint(1, users)}" for _ in range(lookups)]
+        async with engine.connect() as conn:
+            await measure(conn, "JSON cast (before)", JSON_LOOKUP, social_ids[: max(lookups // 20, 5)])
+            await measure(conn, "PK index (after)", INDEXED_LOOKUP, social_ids)
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(main(*(args + [1_000_000, 200][len(args):])))
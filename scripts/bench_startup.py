@@ -0,0 +1,80 @@
+"""
+워커 기동 시 스키마 준비 비용 비교: Base.metadata.create_all vs alembic head 확인
+
+workers개의 워커가 동시에 기동하는 상황을 워커별 엔진(NullPool)으로 재현하여
+모드별 전체 소요 시간, 워커당 평균 시간, 실행된 SQL 수를 출력합니다.
+DB는 이미 최신 revision이어야 합니다 (create_all이 DDL 없이 catalog 조회만 하도록).
+
+    python -m scripts.bench_startup [workers=8] [rounds=5]
+"""
+import asyncio
+import sys
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.app.adapters.persistence.base import Base
+from src.app.adapters.persistence.models import social_account_model, token_model, user_model  # noqa: F401
+from src.app.adapters.persistence.schema_check import check_schema, current_revisions, expected_heads
+from src.settings.environment import get_settings
+
+
+def make_engine(counter: list):
+    engine = create_async_engine(get_settings().database.get_async_url_connection(), poolclass=NullPool)
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count(*args):
+        counter[0] += 1
+
+    return engine
+
+
+async def boot_create_all(engine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def boot_check_schema(engine) -> None:
+    await check_schema(engine, mode="strict")
+
+
+async def measure(boot, workers: int, rounds: int) -> tuple:
+    wall, per_worker, statements = [], [], 0
+    for _ in range(rounds):
+        counters = [[0] for _ in range(workers)]
+        engines = [make_engine(counter) for counter in counters]
+
+        async def worker(engine):
+            started = time.perf_counter()
+            await boot(engine)
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        durations = await asyncio.gather(*(worker(engine) for engine in engines))
+        wall.append(time.perf_counter() - started)
+        per_worker.append(sum(durations) / workers)
+        statements = sum(counter[0] for counter in counters) // workers
+        for engine in engines:
+            await engine.dispose()
+    return min(wall) * 1000, min(per_worker) * 1000, statements
+
+
+async def main(workers: int, rounds: int) -> None:
+    engine = create_async_engine(get_settings().database.get_async_url_connection(), poolclass=NullPool)
+    current = await current_revisions(engine)
+    await engine.dispose()
+    if current != expected_heads():
+        raise SystemExit(f"database revision {current} != head {expected_heads()}; run `poetry run migrate` first")
+
+    print(f"workers={workers} rounds={rounds} (best of rounds)")
+    print(f"{'mode':<14}{'wall ms':>10}{'worker ms':>12}{'SQL/worker':>12}")
+    for name, boot in (("create_all", boot_create_all), ("check_schema", boot_check_schema)):
+        wall, per_worker, statements = await measure(boot, workers, rounds)
+        print(f"{name:<14}{wall:>10.1f}{per_worker:>12.1f}{statements:>12}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(main(*(args + [8, 5][len(args):])))
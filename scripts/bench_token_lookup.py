@@ -0,0 +1,120 @@
+"""
+토큰 조회 비교: 인덱스 없는 text 컬럼 vs SHA-256 digest(bytea) + unique 인덱스
+
+별도 스키마(bench_tokens)에 토큰을 채운 뒤 access_token / refresh_token 조회, 만료 토큰 범위 스캔
+시간과 테이블/인덱스 크기를 측정하고 스키마를 삭제합니다.
+
+    python -m scripts.bench_token_lookup [tokens=10000000] [lookups=200]
+"""
+import asyncio
+import hashlib
+import random
+import sys
+import time
+
+from sqlalchemy import text
+
+from src.app.adapters.persistence.session import AsyncRelationDataBaseTemplate
+
+SCHEMA = "bench_tokens"
+
+SETUP = [
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    f"""CREATE TABLE {SCHEMA}.tokens_text (
+        id bigserial PRIMARY KEY,
+        user_id uuid NOT NULL,
+        access_token varchar NOT NULL,
+        refresh_token varchar NOT NULL,
+        refresh_token_expires timestamp NOT NULL
+    )""",
+    f"""INSERT INTO {SCHEMA}.tokens_text (user_id, access_token, refresh_token, refresh_token_expires)
+        SELECT gen_random_uuid(), 'access-' || g, 'refresh-' || g,
+               now() + ((g % 60) - 30) * interval '1 day'
+        FROM generate_series(1, :tokens) g""",
+    f"""CREATE TABLE {SCHEMA}.tokens_hashed (
+        id bigserial PRIMARY KEY,
+        user_id uuid NOT NULL,
+        access_token bytea NOT NULL,
+        refresh_token bytea NOT NULL,
+        refresh_token_expires timestamp NOT NULL
+    )""",
+    f"""INSERT INTO {SCHEMA}.tokens_hashed (user_id, access_token, refresh_token, refresh_token_expires)
+        SELECT user_id, sha256(convert_to(access_token, 'UTF8')), sha256(convert_to(refresh_token, 'UTF8')),
+               refresh_token_expires
+        FROM {SCHEMA}.tokens_text""",
+    f"CREATE UNIQUE INDEX ux_bench_access ON {SCHEMA}.tokens_hashed (access_token)",
+    f"CREATE UNIQUE INDEX ux_bench_refresh ON {SCHEMA}.tokens_hashed (refresh_token)",
+    f"CREATE INDEX ix_bench_user_id ON {SCHEMA}.tokens_hashed (user_id)",
+    f"CREATE INDEX ix_bench_expires ON {SCHEMA}.tokens_hashed (refresh_token_expires)",
+    f"ANALYZE {SCHEMA}.tokens_text",
+    f"ANALYZE {SCHEMA}.tokens_hashed",
+]
+
+CASES = [
+    ("access text (before)", f"SELECT * FROM {SCHEMA}.tokens_text WHERE access_token = :access", "access"),
+    ("access digest (after)", f"SELECT * FROM {SCHEMA}.tokens_hashed WHERE access_token = :access_digest", "access"),
+    ("refresh text (before)", f"SELECT * FROM {SCHEMA}.tokens_text WHERE refresh_token = :refresh", "refresh"),
+    ("refresh digest (after)", f"SELECT * FROM {SCHEMA}.tokens_hashed WHERE refresh_token = :refresh_digest", "refresh"),
+]
+
+EXPIRED_COUNT = [
+    ("expired text (before)", f"SELECT count(*) FROM {SCHEMA}.tokens_text WHERE refresh_token_expires < now() - interval '29 days'"),
+    ("expired index (after)", f"SELECT count(*) FROM {SCHEMA}.tokens_hashed WHERE refresh_token_expires < now() - interval '29 days'"),
+]
+
+SIZES = text(f"""
+    SELECT c.relname, pg_size_pretty(pg_relation_size(c.oid))
+    FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = '{SCHEMA}' AND c.relkind IN ('r', 'i')
+    ORDER BY c.relname
+""")
+
+
+def make_params(n: int) -> dict:
+    access, refresh = f"access-{n}", f"refresh-{n}"
+    return {
+        "access": access,
+        "refresh": refresh,
+        "access_digest": hashlib.sha256(access.encode()).digest(),
+        "refresh_digest": hashlib.sha256(refresh.encode()).digest(),
+    }
+
+
+async def measure(conn, label: str, stmt: str, params: list) -> None:
+    start = time.perf_counter()
+    for param in params:
+        await conn.execute(text(stmt), param)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {elapsed / len(params) * 1000:>10.3f} ms/query")
+
+
+async def main(tokens: int, lookups: int) -> None:
+    engine = AsyncRelationDataBaseTemplate.get_engine()
+    try:
+        async with engine.begin() as conn:
+            print(f"seeding {tokens:,} tokens ...")
+            for stmt in SETUP:
+                await conn.execute(text(stmt), {"tokens": tokens})
+
+        params = [make_params(random.randint(1, tokens)) for _ in range(lookups)]
+        # 순차 스캔 쪽은 표본을 줄여서 측정
+        slow = params[: max(lookups // 20, 5)]
+        async with engine.connect() as conn:
+            for label, stmt, _ in CASES:
+                await measure(conn, label, stmt, slow if "before" in label else params)
+            for label, stmt in EXPIRED_COUNT:
+                await measure(conn, label, stmt, [{}] * 5)
+
+            print("\nrelation sizes")
+            for name, size in await conn.execute(SIZES):
+                print(f"  {name:<28} {size:>10}")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(main(*(args + [10_000_000, 200][len(args):])))
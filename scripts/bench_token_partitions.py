@@ -0,0 +1,130 @@
+"""
+tokens 보존 정책 부하 테스트: 일 단위 파티션 DROP vs 단일 테이블 batch DELETE
+
+별도 스키마(bench_partitions)에서 하루 단위 시뮬레이션을 돌립니다. 매일 토큰을 발급(refresh 만료 7일)한 뒤
+각 방식으로 만료분을 정리하고, 테이블 크기와 정리 시간을 출력한 뒤 스키마를 삭제합니다.
+파티션 쪽은 만료 파티션이 통째로 사라지므로 일정 기간 이후 크기가 일정하게 유지됩니다.
+
+    python -m scripts.bench_token_partitions [tokens_per_day=200000] [days=21]
+"""
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from src.app.adapters.persistence.session import AsyncRelationDataBaseTemplate
+from src.app.adapters.persistence.token_partitions import TokenPartitionManager
+
+SCHEMA = "bench_partitions"
+REFRESH_DAYS = 7
+BATCH_SIZE = 5000
+
+COLUMNS = """
+    id bigserial,
+    user_id uuid NOT NULL,
+    access_token bytea NOT NULL,
+    refresh_token bytea NOT NULL,
+    access_token_expires timestamp NOT NULL,
+    refresh_token_expires timestamp NOT NULL,
+    is_revoked boolean,
+    created_at timestamp,
+    revoked_at timestamp
+"""
+
+SETUP = [
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    f"CREATE TABLE {SCHEMA}.tokens_plain ({COLUMNS}, PRIMARY KEY (id))",
+    f"CREATE INDEX ON {SCHEMA}.tokens_plain (refresh_token_expires)",
+    f"CREATE UNIQUE INDEX ON {SCHEMA}.tokens_plain (refresh_token)",
+    f"""CREATE TABLE {SCHEMA}.tokens ({COLUMNS}, PRIMARY KEY (id, refresh_token_expires))
+        PARTITION BY RANGE (refresh_token_expires)""",
+    f"CREATE TABLE {SCHEMA}.tokens_default PARTITION OF {SCHEMA}.tokens DEFAULT",
+    f"CREATE INDEX ON {SCHEMA}.tokens (refresh_token_expires)",
+    f"CREATE UNIQUE INDEX ON {SCHEMA}.tokens (refresh_token, refresh_token_expires)",
+]
+
+ISSUE = """
+    INSERT INTO {schema}.{table} (user_id, access_token, refresh_token, access_token_expires,
+                                  refresh_token_expires, is_revoked, created_at)
+    SELECT gen_random_uuid(), sha256(convert_to('a' || :day || '-' || g, 'UTF8')),
+           sha256(convert_to('r' || :day || '-' || g, 'UTF8')),
+           issued + interval '30 minutes', issued + interval '{refresh_days} days', false, issued
+    FROM generate_series(1, :tokens) g,
+         LATERAL (SELECT CAST(:now AS timestamp) + (g % 86400) * interval '1 second') t(issued)
+"""
+
+DELETE_BATCH = text(f"""
+    DELETE FROM {SCHEMA}.tokens_plain WHERE id IN (
+        SELECT id FROM {SCHEMA}.tokens_plain
+        WHERE refresh_token_expires < :before AND access_token_expires < :before
+        LIMIT {BATCH_SIZE}
+    )
+""")
+
+PLAIN_SIZE = text(f"SELECT count(*), pg_total_relation_size('{SCHEMA}.tokens_plain') FROM {SCHEMA}.tokens_plain")
+PARTITIONED_SIZE = text(f"""
+    SELECT (SELECT count(*) FROM {SCHEMA}.tokens),
+           coalesce(sum(pg_total_relation_size(i.inhrelid)), 0)
+    FROM pg_inherits i WHERE i.inhparent = '{SCHEMA}.tokens'::regclass
+""")
+
+
+def mb(size: int) -> str:
+    return f"{size / 1024 / 1024:8.1f} MB"
+
+
+async def main(tokens_per_day: int, days: int) -> None:
+    engine = AsyncRelationDataBaseTemplate.get_engine()
+    manager = TokenPartitionManager(table="tokens", schema=SCHEMA)
+    start_day = datetime.now(timezone.utc).date()
+    try:
+        async with engine.begin() as conn:
+            for stmt in SETUP:
+                await conn.execute(text(stmt))
+
+        print(f"{'day':>4} | {'plain rows':>10} {'plain size':>11} {'delete s':>9} | "
+              f"{'part rows':>10} {'part size':>11} {'drop s':>7}")
+        for offset in range(days):
+            today = start_day + timedelta(days=offset)
+            now = datetime.combine(today, datetime.min.time())
+            params = {"day": str(offset), "tokens": tokens_per_day, "now": now}
+
+            async with engine.begin() as conn:
+                await manager.maintain(conn, today=today)
+                for table in ("tokens_plain", "tokens"):
+                    await conn.execute(
+                        text(ISSUE.format(schema=SCHEMA, table=table, refresh_days=REFRESH_DAYS)), params
+                    )
+
+            # 단일 테이블: 만료 row를 batch DELETE
+            started = time.perf_counter()
+            while True:
+                async with engine.begin() as conn:
+                    deleted = (await conn.execute(DELETE_BATCH, {"before": now})).rowcount
+                if deleted < BATCH_SIZE:
+                    break
+            delete_seconds = time.perf_counter() - started
+
+            # 파티션: 만료 파티션 DROP
+            started = time.perf_counter()
+            async with engine.begin() as conn:
+                await manager.maintain(conn, today=today)
+            drop_seconds = time.perf_counter() - started
+
+            async with engine.connect() as conn:
+                plain_rows, plain_size = (await conn.execute(PLAIN_SIZE)).one()
+                part_rows, part_size = (await conn.execute(PARTITIONED_SIZE)).one()
+            print(f"{offset:>4} | {plain_rows:>10,} {mb(plain_size)} {delete_seconds:>9.3f} | "
+                  f"{part_rows:>10,} {mb(part_size)} {drop_seconds:>7.3f}")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(main(*(args + [200_000, 21][len(args):])))
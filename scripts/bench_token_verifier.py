@@ -0,0 +1,66 @@
+"""
+/users/me, /users/verify 경로의 JWT 검증 비용 비교 (초당 검증 횟수)
+
+    python -m scripts.bench_token_verifier
+"""
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+
+from src.app.api.v1.dependencies.token import render_user_response
+from src.app.api.v1.schemas.auth import UserResponse
+from src.app.infrastructure.security.token_verifier import TokenVerifier
+from src.settings.environment import get_settings
+
+ITERATIONS = 50_000
+
+
+def make_token() -> str:
+    payload = {
+        "sub": "1234567890",
+        "email": "user@example.com",
+        "name": "user",
+        "exp": datetime.now(timezone.utc) + timedelta(minutes=180),
+        "iss": "auth-service",
+        "user_id": "11111111-1111-1111-1111-111111111111",
+        "user_type": "USER",
+    }
+    return jwt.encode(payload, get_settings().secret.secret_key, algorithm=get_settings().secret.algorithm)
+
+
+def baseline(token: str) -> bytes:
+    """기존 핸들러와 동일: 매 요청 decode + UserResponse 생성/직렬화"""
+    payload = jwt.decode(token,
+                         get_settings().secret.secret_key,
+                         algorithms=[get_settings().secret.algorithm])
+    return UserResponse(
+        user_id=str(payload.get("user_id")),
+        email=payload.get("email"),
+        name=payload.get("name"),
+        user_type=str(payload.get("user_type")),
+        social_accounts={"google": payload.get("sub")}
+    ).model_dump_json().encode()
+
+
+def run(label: str, func, token: str) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func(token)
+    elapsed = time.perf_counter() - start
+    rate = ITERATIONS / elapsed
+    print(f"{label:<28} {rate:>12,.0f} verifications/s")
+    return rate
+
+
+def main():
+    token = make_token()
+    verifier = TokenVerifier(render=render_user_response)
+
+    base = run("jwt.decode + pydantic", baseline, token)
+    cached = run("TokenVerifier (cache hit)", lambda t: verifier.verify(t).body, token)
+    print(f"speedup: x{cached / base:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+워커 cold-start import 비용 회귀 확인
+
+새 인터프리터에서 `python -X importtime -c "import src.main"`을 runs번 실행하여
+src.main의 누적 import 시간이 예산을 넘거나, 기동 경로에 있으면 안 되는 모듈
+(alembic, uvicorn 등 필요할 때만 로드하는 의존성)이 import되면 실패(exit 1)합니다.
+예산은 실행 중 최솟값과 비교합니다 (다른 프로세스로 인한 지연은 더해지기만 하므로).
+가장 무거운 top-level 패키지 목록을 함께 출력합니다. 시간 예산은 이 스크립트가 CI gate이며,
+tests/test_importtime.py는 기본으로 금지 모듈만 확인합니다 (IMPORT_BUDGET_MS를 지정하면 시간도 확인).
+
+    python -m scripts.check_importtime [budget_ms=IMPORT_BUDGET_MS|1800] [runs=5]
+"""
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Tuple
+
+TARGET = "src.main"
+# 기동 import 경로에서 제외해야 하는 모듈 (migrate/개발 서버/제거된 의존성)
+FORBIDDEN = ("alembic", "mako", "uvicorn", "kombu", "icecream", "loguru")
+# 기본 예산. 같은 호스트에서 7회씩 4번 측정한 최솟값이 980~1470 ms로 흔들려 최댓값에 약 20% 여유를 둠
+DEFAULT_BUDGET_MS = 1800.0
+
+
+@dataclass
+class ImportTimeReport:
+    totals_ms: List[float] = field(default_factory=list)
+    # top-level 패키지 -> 실행별 self 시간(µs)
+    packages: Dict[str, List[int]] = field(default_factory=lambda: defaultdict(list))
+    imported: Set[str] = field(default_factory=set)
+
+    @property
+    def best_ms(self) -> float:
+        return min(self.totals_ms)
+
+    @property
+    def forbidden(self) -> List[str]:
+        return sorted(name for name in self.imported if name.split(".")[0] in FORBIDDEN)
+
+
+def run_once() -> List[Tuple[int, int, str]]:
+    """(self µs, cumulative µs, 모듈 이름) 목록"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        capture_output=True, text=True, env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr[-2000:])
+        raise SystemExit(f"import {TARGET} failed")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def budget_ms() -> float:
+    return float(os.environ.get("IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS))
+
+
+def measure(runs: int = 5) -> ImportTimeReport:
+    report = ImportTimeReport()
+    for _ in range(runs):
+        rows = run_once()
+        report.totals_ms.append(next(cumulative for _, cumulative, name in rows if name == TARGET) / 1000)
+        per_package: Dict[str, int] = defaultdict(int)
+        for self_us, _, name in rows:
+            per_package[name.split(".")[0]] += self_us
+            report.imported.add(name)
+        for package, self_us in per_package.items():
+            report.packages[package].append(self_us)
+    return report
+
+
+def main() -> int:
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else budget_ms()
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    report = measure(runs)
+    totals = report.totals_ms
+    print(f"import {TARGET}: min {report.best_ms:.1f} ms (median {statistics.median(totals):.1f}, "
+          f"max {max(totals):.1f}) budget {budget:.0f} ms")
+    print("top packages (median self time):")
+    top = sorted(report.packages.items(), key=lambda item: statistics.median(item[1]), reverse=True)[:10]
+    for package, samples in top:
+        print(f"  {package:<24} {statistics.median(samples) / 1000:8.1f} ms")
+
+    if report.forbidden:
+        print(f"FAIL: imported on the startup path: {', '.join(report.forbidden[:10])}")
+        return 1
+    if report.best_ms > budget:
+        print(f"FAIL: over budget by {report.best_ms - budget:.1f} ms")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+엔드포인트별 SQL round-trip 수 회귀 확인
+
+create_app()으로 조립한 앱에 사용자 생성 -> 소셜 계정 추가 요청을 보내고, 개발 모드 응답 헤더
+(X-DB-Statements / X-DB-Time-Ms)로 요청당 문장 수를 읽어 예산을 넘으면 exit 1.
+사용자 캐시가 켜진 기본 설정 기준이며, 실행 후 생성한 사용자는 삭제합니다.
+
+    python -m scripts.check_query_counts
+"""
+import asyncio
+import os
+import sys
+import uuid
+
+# 응답 헤더로 문장 수를 받기 위해 개발 모드로 조립 (설정을 읽기 전에 지정)
+os.environ["PROJECT_STATE"] = "DEV"
+
+import httpx
+from sqlalchemy import text
+
+from src.app.adapters.persistence.session import AsyncRelationDataBaseTemplate
+from src.main import create_app
+
+# (method, route) -> 허용하는 최대 문장 수 (현재 측정값 기준. 줄이면 함께 낮출 것)
+BUDGETS = {
+    # 이메일 중복 확인, INSERT, 소셜 계정 동기화, 재조회
+    ("POST", "/api/v1/users"): 4,
+    # 소셜 계정 중복 확인, 사용자 조회, UPDATE, 소셜 계정 동기화(DELETE/INSERT), 재조회
+    ("POST", "/api/v1/users/{user_id}/social-accounts"): 6,
+}
+
+
+def report(method: str, route: str, response: httpx.Response) -> bool:
+    statements = int(response.headers["x-db-statements"])
+    budget = BUDGETS[(method, route)]
+    ok = statements <= budget and response.status_code < 400
+    print(f"{'ok  ' if ok else 'FAIL'} {method:<5} {route:<45} {response.status_code} "
+          f"statements={statements} (budget {budget}) db={response.headers['x-db-time-ms']}ms")
+    return ok
+
+
+async def main() -> int:
+    app = create_app()
+    email = f"query-count-{uuid.uuid4().hex[:12]}@example.com"
+    transport = httpx.ASGITransport(app=app)
+    results = []
+    user_id = None
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/api/v1/users", json={"name": "query count", "email": email})
+            results.append(report("POST", "/api/v1/users", response))
+            user_id = response.json()["data"]["user_id"]
+
+            response = await client.post(
+                f"/api/v1/users/{user_id}/social-accounts",
+                json={"provider": "google", "provider_id": f"g-{uuid.uuid4().hex}"},
+            )
+            results.append(report("POST", "/api/v1/users/{user_id}/social-accounts", response))
+    finally:
+        if user_id:
+            async with AsyncRelationDataBaseTemplate.get_session() as session:
+                await session.execute(text("DELETE FROM users WHERE user_id = :user_id"), {"user_id": user_id})
+        await AsyncRelationDataBaseTemplate.get_engine().dispose()
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
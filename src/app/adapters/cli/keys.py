@@ -0,0 +1,87 @@
+"""
+JWT 서명 키 묶음 관리 CLI
+
+    poetry run keys list
+    poetry run keys generate [--alg RS256|EdDSA] [--activate]
+    poetry run keys rotate [--alg RS256|EdDSA]
+    poetry run keys retire <kid>
+    poetry run keys jwks
+
+권장 순환 절차 (소비자의 JWKS 캐시 max-age = JWKS_MAX_AGE):
+    1) generate           -> next 키가 JWKS에 공개됨 (서명에는 아직 미사용)
+    2) JWKS_MAX_AGE 이상 대기 후 rotate -> next 키로 서명 시작, 새 next 키 생성
+    3) 이전 키로 서명된 토큰이 모두 만료된 뒤 retire <이전 kid>
+실행 중인 워커는 키 파일 변경(mtime)을 감지하여 재시작 없이 반영합니다.
+"""
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from src.app.infrastructure.security.key_ring import SUPPORTED_ALGORITHMS, KeyRing
+from src.settings.environment import get_settings
+
+
+def _print_keys(key_ring: KeyRing) -> None:
+    signing = key_ring.signing_key
+    for key in key_ring.list():
+        marker = "*" if key is signing else " "
+        print(f"{marker} {key.kid}  {key.algorithm:<6} {key.status:<8} created={key.created_at} activated={key.activated_at}")
+    if not key_ring.keys:
+        print(f"(no keys in {key_ring.path}; tokens are signed with the shared {get_settings().secret.algorithm} secret)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    default_alg = get_settings().secret.jwt_key_algorithm
+    parser = argparse.ArgumentParser(prog="keys", description="JWT signing key ring management")
+    parser.add_argument("--path", default=None, help="key ring file (default: JWT_KEYRING_PATH)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list keys (* = current signing key)")
+
+    generate = commands.add_parser("generate", help="generate a key published as 'next'")
+    generate.add_argument("--alg", choices=SUPPORTED_ALGORITHMS, default=default_alg)
+    generate.add_argument("--activate", action="store_true", help="start signing with it immediately")
+
+    rotate = commands.add_parser("rotate", help="promote the oldest 'next' key and generate a new 'next' key")
+    rotate.add_argument("--alg", choices=SUPPORTED_ALGORITHMS, default=default_alg)
+
+    retire = commands.add_parser("retire", help="remove a key from JWKS and verification")
+    retire.add_argument("kid")
+
+    commands.add_parser("jwks", help="print the public JWKS document")
+
+    args = parser.parse_args(argv)
+    key_ring = KeyRing(args.path)
+
+    if args.command == "list":
+        _print_keys(key_ring)
+        return 0
+    if args.command == "jwks":
+        print(json.dumps(key_ring.jwks(), indent=2))
+        return 0
+
+    try:
+        if args.command == "generate":
+            key = key_ring.generate(args.alg, activate=args.activate)
+            print(f"generated {key.kid} ({key.algorithm}, {key.status})")
+        elif args.command == "rotate":
+            key = key_ring.rotate(args.alg)
+            print(f"signing with {key.kid} ({key.algorithm})")
+        elif args.command == "retire":
+            key = key_ring.retire(args.kid)
+            print(f"retired {key.kid}")
+    except KeyError as e:
+        print(f"unknown kid: {e.args[0]}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+
+    key_ring.save()
+    _print_keys(key_ring)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+DB 스키마 migration CLI (애플리케이션 기동과 분리된 배포 단계)
+
+    poetry run migrate              # alembic upgrade head + tokens 날짜 파티션 준비
+    poetry run migrate <revision>   # 지정 revision까지 upgrade
+    poetry run migrate --sql        # 실행할 SQL만 출력 (offline)
+    poetry run migrate --check      # DB revision과 코드 head 비교 (불일치 시 exit 1)
+
+워커는 기동 시 alembic_version만 확인하므로(SCHEMA_CHECK_MODE) 배포 시 워커 시작 전에 실행해야 합니다.
+파티션 생성/만료 DROP은 워커 기동 경로에서 하지 않고, 여기(배포 시)와 TokenCleanupJob(주기 실행)에서 수행합니다.
+"""
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+
+from alembic import command
+
+from src.app.adapters.persistence.schema_check import alembic_config, current_revisions, expected_heads
+from src.app.adapters.persistence.session import AsyncRelationDataBaseTemplate
+from src.app.adapters.persistence.token_partitions import TokenPartitionManager
+
+
+async def _current() -> tuple:
+    engine = AsyncRelationDataBaseTemplate.get_engine()
+    try:
+        return await current_revisions(engine)
+    finally:
+        await engine.dispose()
+
+
+async def _maintain_partitions() -> dict:
+    try:
+        return await TokenPartitionManager().run()
+    finally:
+        await AsyncRelationDataBaseTemplate.shutdown()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="migrate", description="Apply database migrations")
+    parser.add_argument("revision", nargs="?", default="head")
+    parser.add_argument("--sql", action="store_true", help="print SQL instead of executing (offline mode)")
+    parser.add_argument("--check", action="store_true", help="compare database revision with the code head")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        current, heads = asyncio.run(_current()), expected_heads()
+        print(f"database: {list(current) or 'none'}  head: {list(heads)}")
+        return 0 if current == heads else 1
+
+    command.upgrade(alembic_config(), args.revision, sql=args.sql)
+    if not args.sql:
+        # 파티션 테이블이 아니면(0004 이전 revision) 아무것도 하지 않음
+        partitions = asyncio.run(_maintain_partitions())
+        print(f"token partitions created: {partitions['created'] or 'none'}  dropped: {partitions['dropped'] or 'none'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import UUID
+from src.app.adapters.persistence.base import Base
+
+
+class SocialAccountModel(Base):
+    """
+    (provider, provider_id) -> user_id 조회용 테이블.
+    users.social_accounts(JSON)는 엔티티 조립용으로 그대로 유지하고,
+    소셜 계정으로 사용자를 찾는 경로만 이 테이블의 PK 인덱스를 사용한다.
+    """
+    __tablename__ = "user_social_accounts"
+    provider = Column(String(32), primary_key=True)
+    provider_id = Column(String(255), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_user_social_accounts_user_id", "user_id"),
+    )
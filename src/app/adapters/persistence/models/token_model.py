@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, ForeignKey
+from sqlalchemy import Column, LargeBinary, DateTime, Boolean, Integer, ForeignKey, Index, DDL, event
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime, timezone
 
@@ -7,12 +7,34 @@ from ..base import Base
 class TokenModel(Base):
     __tablename__ = "tokens"
 
-    id = Column(Integer, primary_key=True)
+    # refresh_token_expires 기준 range 파티션 테이블이므로 PK/unique 인덱스에 파티션 키를 포함
+    id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False)
-    access_token = Column(String, nullable=False)
-    refresh_token = Column(String, nullable=False)
+    # rotate로 이어진 토큰 묶음. 재사용 감지 시 family 단위로 폐기
+    family_id = Column(UUID(as_uuid=True), nullable=False)
+    # 토큰 원문 대신 SHA-256 digest(32 bytes)를 저장
+    access_token = Column(LargeBinary(32), nullable=False)
+    refresh_token = Column(LargeBinary(32), nullable=False)
     access_token_expires = Column(DateTime, nullable=False)
-    refresh_token_expires = Column(DateTime, nullable=False)
+    refresh_token_expires = Column(DateTime, primary_key=True, nullable=False)
     is_revoked = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
-    revoked_at = Column(DateTime, nullable=True) 
\ No newline at end of file
+    revoked_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ux_tokens_access_token", "access_token", "refresh_token_expires", unique=True),
+        Index("ux_tokens_refresh_token", "refresh_token", "refresh_token_expires", unique=True),
+        Index("ix_tokens_user_id", "user_id"),
+        Index("ix_tokens_family_id", "family_id"),
+        Index("ix_tokens_refresh_token_expires", "refresh_token_expires"),
+        {"postgresql_partition_by": "RANGE (refresh_token_expires)"},
+    )
+
+
+# 날짜 파티션은 TokenPartitionManager가 생성하며, 범위 밖 row는 default 파티션이 받음
+event.listen(
+    TokenModel.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS %(table)s_default PARTITION OF %(table)s DEFAULT"),
+)
+
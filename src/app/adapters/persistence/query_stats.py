@@ -0,0 +1,158 @@
+# app/adapters/persistence/query_stats.py
+"""
+요청 단위 SQL 계측.
+- 엔진의 before/after_cursor_execute 이벤트에서 현재 요청의 QueryStats(contextvar)에
+  문장 수, DB 시간, 문장 형태별 실행 횟수를 누적한다
+- contextvar가 비어 있는 곳(백그라운드 작업, 요청 밖 스크립트)에서는 시간 측정도 하지 않음
+- 같은 형태의 문장이 임계값 이상 반복되면(N+1) 문장 형태를 나열하여 경고
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.app.infrastructure.logging.logger import StructuredLogger, db_logger
+from src.app.infrastructure.monitoring import prometheus as metrics
+from src.settings.environment import get_settings
+
+_LOGGER = StructuredLogger(db_logger)
+_START_KEY = "query_stats_start"
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    db_seconds: float = 0.0
+    # 바인딩 파라미터가 자리표시자로 남은 문장 문자열 -> 실행 횟수
+    shapes: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.statements += 1
+        self.db_seconds += elapsed
+        self.shapes[statement] = self.shapes.get(statement, 0) + 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold번 이상 실행된 문장 형태 (많은 순)"""
+        shapes = [(" ".join(shape.split()), count) for shape, count in self.shapes.items() if count >= threshold]
+        return sorted(shapes, key=lambda item: item[1], reverse=True)
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """블록 안에서 실행된 SQL을 집계. 스크립트에서 서비스 호출의 round-trip 수를 확인할 때 사용"""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current.get()
+    if stats is None:
+        return
+    starts = conn.info.get(_START_KEY)
+    # 문장 실행 도중에 추적이 시작된 경우 시작 시각이 없음
+    elapsed = time.perf_counter() - starts.pop() if starts else 0.0
+    stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context) -> None:
+    # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각을 여기서 꺼냄
+    # (남겨 두면 같은 커넥션의 다음 문장이 이 시각으로 측정됨). 실패한 문장도 round-trip으로 집계
+    connection = exception_context.connection
+    starts = connection.info.get(_START_KEY) if connection is not None else None
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    stats = _current.get()
+    if stats is not None and exception_context.statement is not None:
+        stats.record(exception_context.statement, elapsed)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """AsyncEngine은 sync_engine을 전달 (이벤트는 동기 엔진에서 발생)"""
+    if not event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    """
+    요청마다 QueryStats를 contextvar에 두고, 끝나면 route별 문장 수/DB 시간을 메트릭으로 기록하는 pure ASGI middleware.
+    - 개발 모드(PROJECT_STATE=DEV)에서는 응답 헤더 X-DB-Statements / X-DB-Time-Ms로도 반환
+      (응답 시작 시점까지의 값. 응답 후 dependency 정리 단계의 commit은 메트릭에만 포함)
+    - 한 요청에서 같은 형태의 문장이 RDB_REPEATED_STATEMENT_THRESHOLD번 이상 실행되면 경고 로그
+    """
+
+    def __init__(self, app, threshold: Optional[int] = None, debug_headers: Optional[bool] = None):
+        self.app = app
+        settings = get_settings()
+        self.threshold = settings.database.rdb_repeated_statement_threshold if threshold is None else threshold
+        self.debug_headers = settings.deploy.is_dev() if debug_headers is None else debug_headers
+        self._children: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-statements", str(stats.statements).encode()))
+                headers.append((b"x-db-time-ms", f"{stats.db_seconds * 1000:.2f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers if self.debug_headers else send)
+        finally:
+            _current.reset(token)
+            self._report(scope, stats)
+
+    def _report(self, scope, stats: QueryStats) -> None:
+        method = scope["method"]
+        path = getattr(scope.get("route"), "path", None) or metrics.UNMATCHED_ROUTE
+        children = self._children.get((method, path))
+        if children is None:
+            children = self._children[(method, path)] = (
+                metrics.DB_STATEMENTS_PER_REQUEST.labels(method, path),
+                metrics.DB_TIME_PER_REQUEST.labels(method, path),
+            )
+        children[0].observe(stats.statements)
+        children[1].observe(stats.db_seconds)
+
+        if self.threshold and stats.statements >= self.threshold:
+            repeated = stats.repeated(self.threshold)
+            if repeated:
+                metrics.DB_REPEATED_STATEMENT_REQUESTS.labels(method, path).inc()
+                _LOGGER.warning(
+                    "Repeated SQL statements in one request",
+                    method=method,
+                    route=path,
+                    statements=stats.statements,
+                    db_ms=round(stats.db_seconds * 1000, 2),
+                    repeated=[{"count": count, "statement": shape[:300]} for shape, count in repeated],
+                )
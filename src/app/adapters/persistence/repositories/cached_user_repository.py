@@ -0,0 +1,302 @@
+# app/adapters/persistence/repositories/cached_user_repository.py
+import asyncio
+import json
+from dataclasses import replace
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from src.app.core.domain.entities.user import UserEntity
+from src.app.core.domain.value_objects import UserState
+from src.app.core.ports.user_port import UserRepositoryPort
+from src.app.infrastructure.cache.local_cache import LocalTTLCache
+from src.app.infrastructure.cache.redis_client import RedisCache
+from src.app.infrastructure.monitoring import prometheus as metrics
+from src.common.logger import UVICORN_LOGGER
+from src.settings.environment import get_settings
+
+
+def _copy(user: Optional[UserEntity]) -> Optional[UserEntity]:
+    # 서비스 계층이 엔티티를 직접 변경하므로 캐시된 객체는 항상 복사본으로 내보냄
+    if user is None:
+        return None
+    return replace(user, social_accounts=dict(user.social_accounts or {}))
+
+
+def _dump_user(user: UserEntity) -> str:
+    return json.dumps({
+        "user_id": str(user.user_id),
+        "name": user.name,
+        "email": user.email,
+        "user_type": user.user_type,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+        "last_login": user.last_login.isoformat() if user.last_login else None,
+        "state": user.state,
+        "social_accounts": user.social_accounts or {},
+    })
+
+
+def _load_user(data: str) -> UserEntity:
+    record = json.loads(data)
+    return UserEntity(
+        user_id=UUID(record["user_id"]),
+        name=record["name"],
+        email=record["email"],
+        user_type=record["user_type"],
+        created_at=datetime.fromisoformat(record["created_at"]) if record["created_at"] else None,
+        updated_at=datetime.fromisoformat(record["updated_at"]) if record["updated_at"] else None,
+        last_login=datetime.fromisoformat(record["last_login"]) if record["last_login"] else None,
+        state=record["state"],
+        social_accounts=record["social_accounts"],
+    )
+
+
+class UserCache:
+    """
+    프로세스 단위로 공유되는 2단계 사용자 캐시.
+    - 1단계: 프로세스 내 TTL+LRU (짧은 TTL로 워커 간 불일치 시간을 제한)
+    - 2단계: Redis (선택)
+    user:id:{user_id} 에 엔티티를, user:email:{email} / user:social:{provider}:{id} 에는
+    user_id만 저장하여 무효화 대상을 id 키 하나로 모은다.
+    """
+    ID_KEY = "user:id:{}"
+    EMAIL_KEY = "user:email:{}"
+    SOCIAL_KEY = "user:social:{}:{}"
+
+    _instance: Optional["UserCache"] = None
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: float = 5.0,
+        redis: Optional[RedisCache] = None,
+        redis_ttl: int = 300,
+    ):
+        self.local = LocalTTLCache(maxsize=maxsize, ttl=ttl)
+        self.redis = redis
+        self.redis_ttl = redis_ttl
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # 로드가 진행 중인 동안 무효화된 키 -> 무효화 순번. 로드 시작 이후 무효화된 키의 결과는 저장하지 않음
+        self._invalidations: Dict[str, int] = {}
+        self._generation = 0
+
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @classmethod
+    def get_instance(cls) -> "UserCache":
+        if cls._instance is None:
+            settings = get_settings().cache
+            cls._instance = cls(
+                maxsize=settings.user_cache_maxsize,
+                ttl=settings.user_cache_ttl,
+                redis=RedisCache() if settings.user_cache_redis_enabled else None,
+                redis_ttl=settings.user_cache_redis_ttl,
+            )
+        return cls._instance
+
+    def stats(self) -> Dict[str, float]:
+        hits = self.local_hits + self.redis_hits
+        total = hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_ratio": hits / total if total else 0.0,
+            "local_size": len(self.local),
+        }
+
+    async def lookup(self, key: str, loader: Callable[[], Awaitable[Optional[UserEntity]]]) -> Optional[UserEntity]:
+        """캐시에서 조회하고, 없으면 loader로 한 번만 로드(single-flight)한 뒤 저장합니다."""
+        user = await self._get(key)
+        if user is not None:
+            return _copy(user)
+
+        self.misses += 1
+        metrics.USER_CACHE_MISS.inc()
+        user = await self._single_flight(key, loader)
+        return _copy(user)
+
+    async def store(self, user: Optional[UserEntity]) -> None:
+        if user is None:
+            return
+        entries = {key: str(user.user_id) for key in self._pointer_keys(user)}
+        id_key = self.ID_KEY.format(user.user_id)
+
+        cached = _copy(user)
+        self.local.set(id_key, cached)
+        for key, user_id in entries.items():
+            self.local.set(key, user_id)
+
+        if self.redis:
+            try:
+                pipe = self.redis.pipeline()
+                pipe.set(id_key, _dump_user(cached), ex=self.redis_ttl)
+                for key, user_id in entries.items():
+                    pipe.set(key, user_id, ex=self.redis_ttl)
+                await pipe.execute()
+            except RedisError as e:
+                UVICORN_LOGGER.warning(f"User cache redis store failed: {e!r}")
+
+    async def invalidate(self, *users: Optional[UserEntity], user_id: Optional[UUID] = None) -> None:
+        keys = set()
+        if user_id is not None:
+            keys.add(self.ID_KEY.format(user_id))
+            # 로컬에 남아있는 이전 상태의 email/social 포인터도 함께 제거
+            users = users + (self.local.get(self.ID_KEY.format(user_id)),)
+        for user in users:
+            if user is None:
+                continue
+            keys.add(self.ID_KEY.format(user.user_id))
+            keys.update(self._pointer_keys(user))
+
+        self._generation += 1
+        if self._inflight:
+            for key in keys:
+                self._invalidations[key] = self._generation
+
+        for key in keys:
+            self.local.delete(key)
+        if self.redis and keys:
+            try:
+                await self.redis.delete(*keys)
+            except RedisError as e:
+                UVICORN_LOGGER.warning(f"User cache redis invalidate failed: {e!r}")
+
+    async def _get(self, key: str) -> Optional[UserEntity]:
+        if key.startswith("user:id:"):
+            return await self._get_entity(key)
+
+        # email/social 키는 user_id 포인터 -> id 키로 엔티티 조회
+        user_id = self.local.get(key)
+        if user_id is None and self.redis:
+            try:
+                user_id = await self.redis.get(key)
+            except RedisError:
+                user_id = None
+        if user_id is None:
+            return None
+
+        user = await self._get_entity(self.ID_KEY.format(user_id))
+        # 포인터가 오래된 경우(이메일/소셜 계정 변경) miss로 처리
+        if user is None or key not in self._pointer_keys(user):
+            return None
+        return user
+
+    async def _get_entity(self, id_key: str) -> Optional[UserEntity]:
+        user = self.local.get(id_key)
+        if user is not None:
+            self.local_hits += 1
+            metrics.USER_CACHE_LOCAL_HIT.inc()
+            return user
+
+        if self.redis:
+            try:
+                data = await self.redis.get(id_key)
+            except RedisError as e:
+                UVICORN_LOGGER.warning(f"User cache redis get failed: {e!r}")
+                data = None
+            if data:
+                self.redis_hits += 1
+                metrics.USER_CACHE_REDIS_HIT.inc()
+                user = _load_user(data)
+                self.local.set(id_key, user)
+                return user
+        return None
+
+    async def _single_flight(self, key: str, loader: Callable[[], Awaitable[Optional[UserEntity]]]) -> Optional[UserEntity]:
+        future = self._inflight.get(key)
+        if future is not None:
+            # 같은 키로 진행 중인 조회가 있으면 그 결과를 기다림
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            user = await loader()
+            # DB 조회 중에 update/invalidate가 끼어들었다면 읽은 값이 이미 오래되었으므로 캐시에 넣지 않음
+            if not self._invalidated_since(generation, key, user):
+                await self.store(user)
+            future.set_result(user)
+            return user
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 "never retrieved" 경고 방지
+            raise
+        finally:
+            del self._inflight[key]
+            if not self._inflight:
+                self._invalidations.clear()
+
+    def _invalidated_since(self, generation: int, key: str, user: Optional[UserEntity]) -> bool:
+        keys = [key]
+        if user is not None:
+            keys.append(self.ID_KEY.format(user.user_id))
+            keys.extend(self._pointer_keys(user))
+        return any(self._invalidations.get(k, 0) > generation for k in keys)
+
+    def _pointer_keys(self, user: UserEntity) -> List[str]:
+        keys = [self.EMAIL_KEY.format(user.email)]
+        for provider, social_id in (user.social_accounts or {}).items():
+            keys.append(self.SOCIAL_KEY.format(provider, social_id))
+        return keys
+
+
+class CachedUserRepository(UserRepositoryPort):
+    """UserRepositoryPort 앞단의 read-through 캐시. 변경 연산은 캐시를 무효화합니다."""
+
+    def __init__(self, repository: UserRepositoryPort, cache: UserCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def create(self, user: UserEntity) -> UserEntity:
+        created = await self.repository.create(user)
+        await self.cache.invalidate(created)
+        await self.cache.store(created)
+        return created
+
+    async def get_by_id(self, user_id: UUID) -> Optional[UserEntity]:
+        return await self.cache.lookup(
+            UserCache.ID_KEY.format(user_id),
+            lambda: self.repository.get_by_id(user_id),
+        )
+
+    async def get_by_email(self, email: str) -> Optional[UserEntity]:
+        return await self.cache.lookup(
+            UserCache.EMAIL_KEY.format(email),
+            lambda: self.repository.get_by_email(email),
+        )
+
+    async def get_by_social_account(self, provider: str, social_id: str) -> Optional[UserEntity]:
+        return await self.cache.lookup(
+            UserCache.SOCIAL_KEY.format(provider, social_id),
+            lambda: self.repository.get_by_social_account(provider, social_id),
+        )
+
+    async def update(self, user: UserEntity) -> UserEntity:
+        updated = await self.repository.update(user)
+        await self.cache.invalidate(user, updated, user_id=user.user_id)
+        await self.cache.store(updated)
+        return _copy(updated)
+
+    async def delete(self, user_id: UUID) -> bool:
+        deleted = await self.repository.delete(user_id)
+        await self.cache.invalidate(user_id=user_id)
+        return deleted
+
+    async def find_or_create_by_social_account(self, user: UserEntity, provider: str, social_id: str) -> UserEntity:
+        result = await self.repository.find_or_create_by_social_account(user, provider, social_id)
+        await self.cache.invalidate(result, user_id=result.user_id)
+        await self.cache.store(result)
+        return _copy(result)
+
+    async def list_by_state(self, state: UserState) -> List[UserEntity]:
+        return await self.repository.list_by_state(state)
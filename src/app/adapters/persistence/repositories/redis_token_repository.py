@@ -0,0 +1,274 @@
+# app/adapters/persistence/repositories/redis_token_repository.py
+import json
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Sequence
+from uuid import UUID, uuid4
+
+from src.app.core.domain.entities.token import TokenEntity
+from src.app.core.ports.token_port import TokenRepositoryPort
+from src.app.infrastructure.cache.redis_client import RedisCache
+from src.app.infrastructure.security.hashing import hash_token
+from src.app.adapters.persistence.repositories.token_write_behind import TokenWriteBehind
+
+
+def _to_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    if dt is None:
+        return None
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+
+def _ttl_seconds(expires: datetime, now: datetime) -> int:
+    return int((_to_utc(expires) - now).total_seconds())
+
+
+# 기존 refresh 레코드가 살아있고 폐기되지 않은 경우에만 폐기 + 새 토큰 저장 (check-and-set)
+# 스크립트가 건드리는 키는 모두 KEYS로 전달 (기존 access/user/family 키는 호출부가 먼저 GET한 레코드로 조합)
+# KEYS: old refresh, new access, new refresh, old access, user, [family]
+# ARGV: revoked_at, new record(json), access ttl, refresh ttl, new refresh hash, GET으로 읽은 기존 레코드
+# 기존 레코드가 읽은 값과 다르면(그 사이 폐기/만료) 교체하지 않음
+# 반환: {0} 없음/만료, {1, record} 성공, {2, record} 이미 폐기됨(재사용)
+ROTATE_SCRIPT = """
+local raw = redis.call('GET', KEYS[1])
+if not raw then
+    return {0}
+end
+if raw ~= ARGV[6] then
+    return {2, raw}
+end
+local old = cjson.decode(raw)
+if old['is_revoked'] then
+    return {2, raw}
+end
+old['is_revoked'] = true
+old['revoked_at'] = ARGV[1]
+local revoked = cjson.encode(old)
+redis.call('SET', KEYS[1], revoked, 'KEEPTTL')
+redis.call('SET', KEYS[4], revoked, 'XX', 'KEEPTTL')
+
+local new = cjson.decode(ARGV[2])
+new['user_id'] = old['user_id']
+new['family_id'] = old['family_id']
+local record = cjson.encode(new)
+local access_ttl = tonumber(ARGV[3])
+local refresh_ttl = tonumber(ARGV[4])
+if access_ttl > 0 then
+    redis.call('SET', KEYS[2], record, 'EX', access_ttl)
+end
+if refresh_ttl > 0 then
+    redis.call('SET', KEYS[3], record, 'EX', refresh_ttl)
+    redis.call('SADD', KEYS[5], ARGV[5])
+    redis.call('EXPIRE', KEYS[5], refresh_ttl)
+    if KEYS[6] then
+        redis.call('SADD', KEYS[6], ARGV[5])
+        redis.call('EXPIRE', KEYS[6], refresh_ttl)
+    end
+end
+return {1, record}
+"""
+
+class RedisTokenRepository(TokenRepositoryPort):
+    """
+    살아있는 토큰을 Redis에 보관하는 TokenRepositoryPort 구현.
+    - token:access:{sha256}, token:refresh:{sha256} 키에 토큰 정보를 저장하고
+      각각 access/refresh 만료 시각에 맞춘 TTL을 건다
+    - 검증 경로의 조회는 Redis GET 한 번으로 끝난다 (DB 왕복 없음)
+    - write_behind가 주어지면 감사 목적으로 Postgres에 비동기로 기록한다
+    - rotate는 Lua 스크립트로 폐기 여부 확인과 교체를 원자적으로 처리하고,
+      token:family:{family_id} 집합으로 family 단위 폐기를 지원한다
+
+    토큰 원문은 저장하지 않으므로, 조회에 사용하지 않은 쪽 토큰은
+    엔티티에 digest(hex)로 채워진다.
+    """
+    ACCESS_KEY = "token:access:{}"
+    REFRESH_KEY = "token:refresh:{}"
+    USER_KEY = "token:user:{}"
+    FAMILY_KEY = "token:family:{}"
+
+    def __init__(self, cache: RedisCache, write_behind: Optional[TokenWriteBehind] = None):
+        self.cache = cache
+        self.write_behind = write_behind
+        self._rotate = cache.register_script(ROTATE_SCRIPT)
+
+    async def create(self, token: TokenEntity) -> TokenEntity:
+        if token.family_id is None:
+            token.family_id = uuid4()
+        now = datetime.now(timezone.utc)
+        access_ttl = _ttl_seconds(token.access_token_expires, now)
+        refresh_ttl = _ttl_seconds(token.refresh_token_expires, now)
+        access_hash = hash_token(token.access_token).hex()
+        refresh_hash = hash_token(token.refresh_token).hex()
+        record = self._dump(token, access_hash, refresh_hash)
+        user_key = self.USER_KEY.format(token.user_id)
+
+        pipe = self.cache.pipeline()
+        if access_ttl > 0:
+            pipe.set(self.ACCESS_KEY.format(access_hash), record, ex=access_ttl)
+        if refresh_ttl > 0:
+            pipe.set(self.REFRESH_KEY.format(refresh_hash), record, ex=refresh_ttl)
+            pipe.sadd(user_key, refresh_hash)
+            # refresh 수명이 일정하므로 마지막으로 발급된 토큰이 가장 늦게 만료됨
+            pipe.expire(user_key, refresh_ttl)
+            family_key = self.FAMILY_KEY.format(token.family_id)
+            pipe.sadd(family_key, refresh_hash)
+            pipe.expire(family_key, refresh_ttl)
+        await pipe.execute()
+
+        if self.write_behind:
+            self.write_behind.enqueue(lambda repo: repo.create(token))
+        return token
+
+    async def get_by_access_token(self, access_token: str) -> Optional[TokenEntity]:
+        data = await self.cache.get(self.ACCESS_KEY.format(hash_token(access_token).hex()))
+        return self._load(data, access_token=access_token) if data else None
+
+    async def get_by_refresh_token(self, refresh_token: str) -> Optional[TokenEntity]:
+        data = await self.cache.get(self.REFRESH_KEY.format(hash_token(refresh_token).hex()))
+        return self._load(data, refresh_token=refresh_token) if data else None
+
+    async def rotate(
+        self,
+        refresh_token: str,
+        new_access_token: str,
+        new_refresh_token: str,
+        access_token_expires: datetime,
+        refresh_token_expires: datetime,
+    ) -> Optional[TokenEntity]:
+        # 스크립트가 쓰는 기존 access/user/family 키를 KEYS로 넘기기 위해 기존 레코드를 먼저 읽음
+        old_refresh_key = self.REFRESH_KEY.format(hash_token(refresh_token).hex())
+        raw = await self.cache.get(old_refresh_key)
+        if not raw:
+            return None
+        old = json.loads(raw)
+        if old["is_revoked"]:
+            return None
+
+        now = datetime.now(timezone.utc)
+        access_hash = hash_token(new_access_token).hex()
+        refresh_hash = hash_token(new_refresh_token).hex()
+        # user_id / family_id는 스크립트에서 기존 레코드 값으로 채움
+        template = TokenEntity(
+            user_id=UUID(int=0),
+            access_token=new_access_token,
+            refresh_token=new_refresh_token,
+            access_token_expires=access_token_expires,
+            refresh_token_expires=refresh_token_expires,
+            created_at=now,
+        )
+        status, *payload = await self._rotate(
+            keys=[
+                old_refresh_key,
+                self.ACCESS_KEY.format(access_hash),
+                self.REFRESH_KEY.format(refresh_hash),
+                self.ACCESS_KEY.format(old["access_hash"]),
+                self.USER_KEY.format(old["user_id"]),
+                *([self.FAMILY_KEY.format(old["family_id"])] if old.get("family_id") else []),
+            ],
+            args=[
+                now.isoformat(),
+                self._dump(template, access_hash, refresh_hash),
+                _ttl_seconds(access_token_expires, now),
+                _ttl_seconds(refresh_token_expires, now),
+                refresh_hash,
+                raw,
+            ],
+        )
+        if status != 1:
+            return None
+
+        rotated = self._load(payload[0], access_token=new_access_token, refresh_token=new_refresh_token)
+        if self.write_behind:
+            self.write_behind.enqueue(
+                lambda repo: repo.rotate(
+                    refresh_token, new_access_token, new_refresh_token,
+                    access_token_expires, refresh_token_expires,
+                )
+            )
+        return rotated
+
+    async def revoke_token_family(self, family_id: UUID) -> None:
+        await self._revoke_refresh_hashes(await self.cache.smembers(self.FAMILY_KEY.format(family_id)))
+        if self.write_behind:
+            self.write_behind.enqueue(lambda repo: repo.revoke_token_family(family_id))
+
+    async def revoke_all_user_tokens(self, user_id: UUID) -> None:
+        await self._revoke_refresh_hashes(await self.cache.smembers(self.USER_KEY.format(user_id)))
+        if self.write_behind:
+            self.write_behind.enqueue(lambda repo: repo.revoke_all_user_tokens(user_id))
+
+    async def revoke_tokens_for_users(self, user_ids: Sequence[UUID]) -> int:
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return 0
+        pipe = self.cache.pipeline()
+        for user_id in user_ids:
+            pipe.smembers(self.USER_KEY.format(user_id))
+        refresh_hashes = set().union(*await pipe.execute())
+        revoked = await self._revoke_refresh_hashes(refresh_hashes)
+
+        if self.write_behind:
+            self.write_behind.enqueue(lambda repo: repo.revoke_tokens_for_users(user_ids))
+        return revoked
+
+    async def _revoke_refresh_hashes(self, refresh_hashes: Iterable[str]) -> int:
+        refresh_hashes = list(refresh_hashes)
+        if not refresh_hashes:
+            return 0
+        records = await self.cache.mget([self.REFRESH_KEY.format(h) for h in refresh_hashes])
+        revoked_at = datetime.now(timezone.utc).isoformat()
+
+        revoked = 0
+        pipe = self.cache.pipeline()
+        for refresh_hash, data in zip(refresh_hashes, records):
+            if not data:
+                continue
+            record = json.loads(data)
+            if record["is_revoked"]:
+                continue
+            revoked += 1
+            record["is_revoked"] = True
+            record["revoked_at"] = revoked_at
+            payload = json.dumps(record)
+            # 이미 만료된 키를 TTL 없이 되살리지 않도록 XX + KEEPTTL
+            pipe.set(self.REFRESH_KEY.format(refresh_hash), payload, xx=True, keepttl=True)
+            pipe.set(self.ACCESS_KEY.format(record["access_hash"]), payload, xx=True, keepttl=True)
+        await pipe.execute()
+        return revoked
+
+    async def cleanup_expired_tokens(self, before_date: datetime) -> int:
+        # 만료는 Redis TTL이 처리하므로 정리할 대상이 없음
+        return 0
+
+    async def delete_expired_tokens_batch(self, before_date: datetime, limit: int) -> int:
+        return 0
+
+    def _dump(self, token: TokenEntity, access_hash: str, refresh_hash: str) -> str:
+        return json.dumps({
+            "user_id": str(token.user_id),
+            "access_hash": access_hash,
+            "refresh_hash": refresh_hash,
+            "access_token_expires": _to_utc(token.access_token_expires).isoformat(),
+            "refresh_token_expires": _to_utc(token.refresh_token_expires).isoformat(),
+            "is_revoked": token.is_revoked,
+            "created_at": _to_utc(token.created_at).isoformat() if token.created_at else None,
+            "revoked_at": _to_utc(token.revoked_at).isoformat() if token.revoked_at else None,
+            "family_id": str(token.family_id) if token.family_id else None,
+        })
+
+    def _load(
+        self,
+        data: str,
+        access_token: Optional[str] = None,
+        refresh_token: Optional[str] = None,
+    ) -> TokenEntity:
+        record = json.loads(data)
+        return TokenEntity(
+            user_id=UUID(record["user_id"]),
+            access_token=access_token or record["access_hash"],
+            refresh_token=refresh_token or record["refresh_hash"],
+            access_token_expires=datetime.fromisoformat(record["access_token_expires"]),
+            refresh_token_expires=datetime.fromisoformat(record["refresh_token_expires"]),
+            is_revoked=record["is_revoked"],
+            created_at=datetime.fromisoformat(record["created_at"]) if record["created_at"] else None,
+            revoked_at=datetime.fromisoformat(record["revoked_at"]) if record["revoked_at"] else None,
+            family_id=UUID(record["family_id"]) if record.get("family_id") else None,
+        )
@@ -0,0 +1,148 @@
+# app/adapters/persistence/repositories/token_cleanup.py
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+
+from src.app.adapters.persistence.session import AsyncRelationDataBaseTemplate
+from src.app.adapters.persistence.token_partitions import TokenPartitionManager
+from src.app.adapters.persistence.repositories.token_repository import TokenRepository
+from src.common.logger import UVICORN_LOGGER
+from src.settings.environment import get_settings
+
+# 모든 레플리카가 공유하는 advisory lock 키 (임의의 고정 64bit 값)
+CLEANUP_LOCK_KEY = 0x746F6B656E5F636C  # "token_cl"
+
+
+@dataclass
+class CleanupStats:
+    runs: int = 0
+    skipped_locked: int = 0
+    batches: int = 0
+    deleted_total: int = 0
+    deleted_last_run: int = 0
+    pauses: int = 0
+    partitions_created: int = 0
+    partitions_dropped: int = 0
+    errors: int = 0
+    last_batch_seconds: float = 0.0
+    last_run_seconds: float = 0.0
+    last_run_at: Optional[str] = None
+
+
+class TokenCleanupJob:
+    """
+    만료 토큰을 batch 단위로 삭제하는 백그라운드 작업.
+    - 주기마다 pg_try_advisory_lock을 잡은 워커 하나만 실행 (다른 레플리카는 건너뜀)
+    - 먼저 파티션을 관리(미래 파티션 생성, 만료 파티션 DROP)하고 남은 row(default 파티션 등)를 batch 삭제
+    - batch마다 커밋하므로 중단되더라도 다음 실행에서 남은 분량부터 이어서 처리
+    - batch 지연이 한도를 넘으면 DB 부하로 보고 잠시 쉬었다가 계속
+    """
+    _instance: Optional["TokenCleanupJob"] = None
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        max_batch_latency: Optional[float] = None,
+        pause: Optional[float] = None,
+    ):
+        settings = get_settings().token
+        self.interval = interval or settings.token_cleanup_interval
+        self.batch_size = batch_size or settings.token_cleanup_batch_size
+        self.max_batch_latency = max_batch_latency or settings.token_cleanup_max_batch_latency
+        self.pause = pause or settings.token_cleanup_pause
+        self.stats = CleanupStats()
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def get_instance(cls) -> "TokenCleanupJob":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def startup(cls) -> None:
+        instance = cls.get_instance()
+        if instance._task is None:
+            instance._task = asyncio.create_task(instance._run())
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        instance = cls._instance
+        if instance is None or instance._task is None:
+            return
+        instance._task.cancel()
+        try:
+            await instance._task
+        except asyncio.CancelledError:
+            pass
+        instance._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                self.stats.errors += 1
+                UVICORN_LOGGER.error(f"Token cleanup failed: {e!r}")
+            await asyncio.sleep(self.interval)
+
+    async def run_once(self, before_date: Optional[datetime] = None) -> int:
+        """lock을 잡지 못하면 -1, 아니면 이번 실행에서 삭제한 건수를 반환"""
+        engine = AsyncRelationDataBaseTemplate.get_engine()
+        # 세션 단위 advisory lock은 트랜잭션 밖의 전용 커넥션에서 유지
+        async with engine.connect() as lock_conn:
+            lock_conn = await lock_conn.execution_options(isolation_level="AUTOCOMMIT")
+            acquired = await lock_conn.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": CLEANUP_LOCK_KEY}
+            )
+            if not acquired:
+                self.stats.skipped_locked += 1
+                return -1
+            try:
+                partitions = await TokenPartitionManager().run()
+                self.stats.partitions_created += len(partitions["created"])
+                self.stats.partitions_dropped += len(partitions["dropped"])
+                return await self._delete_batches(before_date or datetime.now(timezone.utc))
+            finally:
+                await lock_conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": CLEANUP_LOCK_KEY}
+                )
+
+    async def _delete_batches(self, before_date: datetime) -> int:
+        started = time.perf_counter()
+        deleted_run = 0
+        self.stats.runs += 1
+        while True:
+            batch_started = time.perf_counter()
+            async with AsyncRelationDataBaseTemplate.get_session() as session:
+                deleted = await TokenRepository(session).delete_expired_tokens_batch(before_date, self.batch_size)
+            elapsed = time.perf_counter() - batch_started
+
+            self.stats.batches += 1
+            self.stats.deleted_total += deleted
+            self.stats.last_batch_seconds = elapsed
+            deleted_run += deleted
+            if deleted < self.batch_size:
+                break
+            if elapsed > self.max_batch_latency:
+                self.stats.pauses += 1
+                UVICORN_LOGGER.warning(
+                    f"Token cleanup batch took {elapsed:.3f}s, pausing {self.pause}s (deleted so far={deleted_run})"
+                )
+                await asyncio.sleep(self.pause)
+
+        self.stats.deleted_last_run = deleted_run
+        self.stats.last_run_seconds = time.perf_counter() - started
+        self.stats.last_run_at = datetime.now(timezone.utc).isoformat()
+        UVICORN_LOGGER.info(
+            f"Token cleanup deleted {deleted_run} tokens in {self.stats.last_run_seconds:.3f}s"
+        )
+        return deleted_run
+
+    def stats_dict(self) -> dict:
+        return {**asdict(self.stats), "running": self._task is not None}
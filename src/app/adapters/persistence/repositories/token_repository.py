@@ -1,79 +1,196 @@
 # app/adapters/persistence/token_repository.py
-from typing import Optional
+from typing import Optional, Sequence
 from datetime import datetime, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, insert, literal, tuple_, any_, bindparam, Boolean, DateTime, LargeBinary
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 
-from app.core.domain.entities.token import TokenEntity
-from app.core.ports.token_port import TokenRepositoryPort
+from src.app.core.domain.entities.token import TokenEntity
+from src.app.core.ports.token_port import TokenRepositoryPort
+from src.app.infrastructure.security.hashing import hash_token
 
 # 아래는 예시로 사용될 TokenModel (ORM)
 # 실제로는 models/token_model.py 등 별도 파일에서 import
-from app.adapters.persistence.models.token_model import TokenModel
+from src.app.adapters.persistence.models.token_model import TokenModel
+
+
+def _to_db(dt: Optional[datetime]) -> Optional[datetime]:
+    """tokens 컬럼은 timestamp without time zone(UTC)이므로 aware datetime을 naive UTC로 변환"""
+    if dt is None or dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _from_db(dt: Optional[datetime]) -> Optional[datetime]:
+    return dt.replace(tzinfo=timezone.utc) if dt is not None and dt.tzinfo is None else dt
+
 
 class TokenRepository(TokenRepositoryPort):
+    """
+    토큰은 SHA-256 digest로만 저장/조회한다.
+    원문을 복원할 수 없으므로 조회에 사용하지 않은 쪽 토큰은 엔티티에 digest(hex)로 채워진다.
+    """
     def __init__(self, session: AsyncSession):
         self.session = session
 
     async def create(self, token: TokenEntity) -> TokenEntity:
         db_token = TokenModel(
             user_id=token.user_id,
-            access_token=token.access_token,
-            refresh_token=token.refresh_token,
-            access_token_expires=token.access_token_expires,
-            refresh_token_expires=token.refresh_token_expires,
+            family_id=token.family_id or uuid4(),
+            access_token=hash_token(token.access_token),
+            refresh_token=hash_token(token.refresh_token),
+            access_token_expires=_to_db(token.access_token_expires),
+            refresh_token_expires=_to_db(token.refresh_token_expires),
             is_revoked=token.is_revoked,
-            created_at=token.created_at,
-            revoked_at=token.revoked_at,
+            created_at=_to_db(token.created_at),
+            revoked_at=_to_db(token.revoked_at),
         )
         self.session.add(db_token)
         await self.session.commit()
-        await self.session.refresh(db_token)
-        return self._to_entity(db_token)
+        return self._to_entity(db_token, access_token=token.access_token, refresh_token=token.refresh_token)
 
     async def get_by_access_token(self, access_token: str) -> Optional[TokenEntity]:
-        stmt = select(TokenModel).where(TokenModel.access_token == access_token)
+        stmt = select(TokenModel).where(TokenModel.access_token == hash_token(access_token))
         result = await self.session.execute(stmt)
         db_token = result.scalar_one_or_none()
-        return self._to_entity(db_token) if db_token else None
+        return self._to_entity(db_token, access_token=access_token) if db_token else None
 
     async def get_by_refresh_token(self, refresh_token: str) -> Optional[TokenEntity]:
-        stmt = select(TokenModel).where(TokenModel.refresh_token == refresh_token)
+        stmt = select(TokenModel).where(TokenModel.refresh_token == hash_token(refresh_token))
         result = await self.session.execute(stmt)
         db_token = result.scalar_one_or_none()
-        return self._to_entity(db_token) if db_token else None
+        return self._to_entity(db_token, refresh_token=refresh_token) if db_token else None
+
+    async def rotate(
+        self,
+        refresh_token: str,
+        new_access_token: str,
+        new_refresh_token: str,
+        access_token_expires: datetime,
+        refresh_token_expires: datetime,
+    ) -> Optional[TokenEntity]:
+        # 한 문장으로 기존 토큰 폐기 + 새 토큰 발급:
+        #   WITH rotated AS (UPDATE ... WHERE is_revoked = false RETURNING user_id, family_id)
+        #   INSERT INTO tokens (...) SELECT ... FROM rotated RETURNING *
+        # 동시에 같은 토큰으로 요청하면 row lock 이후 조건을 다시 평가하므로 하나만 성공
+        now = _to_db(datetime.now(timezone.utc))
+        rotated = (
+            update(TokenModel)
+            .where(
+                TokenModel.refresh_token == hash_token(refresh_token),
+                TokenModel.is_revoked.is_not(True),
+                TokenModel.refresh_token_expires > now,
+            )
+            .values(is_revoked=True, revoked_at=now)
+            .returning(TokenModel.user_id, TokenModel.family_id)
+            .cte("rotated")
+        )
+        issued = (
+            insert(TokenModel)
+            .from_select(
+                [
+                    TokenModel.user_id, TokenModel.family_id,
+                    TokenModel.access_token, TokenModel.refresh_token,
+                    TokenModel.access_token_expires, TokenModel.refresh_token_expires,
+                    TokenModel.is_revoked, TokenModel.created_at,
+                ],
+                select(
+                    rotated.c.user_id, rotated.c.family_id,
+                    literal(hash_token(new_access_token), LargeBinary),
+                    literal(hash_token(new_refresh_token), LargeBinary),
+                    literal(_to_db(access_token_expires), DateTime),
+                    literal(_to_db(refresh_token_expires), DateTime),
+                    literal(False, Boolean),
+                    literal(now, DateTime),
+                ),
+            )
+            .returning(TokenModel)
+        )
+        db_token = await self.session.scalar(
+            select(TokenModel).from_statement(issued).execution_options(populate_existing=True)
+        )
+        await self.session.commit()
+        if db_token is None:
+            return None
+        return self._to_entity(db_token, access_token=new_access_token, refresh_token=new_refresh_token)
+
+    async def revoke_token_family(self, family_id: UUID) -> None:
+        stmt = (
+            update(TokenModel)
+            .where(TokenModel.family_id == family_id, TokenModel.is_revoked.is_not(True))
+            .values(is_revoked=True, revoked_at=_to_db(datetime.now(timezone.utc)))
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
 
     async def revoke_all_user_tokens(self, user_id: UUID) -> None:
+        await self.revoke_tokens_for_users([user_id])
+
+    async def revoke_tokens_for_users(self, user_ids: Sequence[UUID]) -> int:
+        # IN (...) 대신 배열 파라미터 하나로 보내 유저 수와 관계없이 같은 statement(plan 재사용)
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return 0
         stmt = (
             update(TokenModel)
-            .where(TokenModel.user_id == user_id)
+            .where(
+                TokenModel.user_id == any_(bindparam("user_ids", user_ids, type_=ARRAY(PG_UUID(as_uuid=True)))),
+                TokenModel.is_revoked.is_not(True),
+            )
             .values(
                 is_revoked=True,
-                revoked_at=datetime.now(timezone.utc)
+                revoked_at=_to_db(datetime.now(timezone.utc))
             )
+            .execution_options(synchronize_session=False)
         )
-        await self.session.execute(stmt)
+        result = await self.session.execute(stmt)
         await self.session.commit()
+        return result.rowcount
 
-    async def cleanup_expired_tokens(self, before_date: datetime) -> int:
-        # 예시: access_token_expires, refresh_token_expires 모두 before_date 이전이면 삭제
+    async def cleanup_expired_tokens(self, before_date: datetime, batch_size: int = 5000) -> int:
+        # 한 번의 DELETE로 테이블 전체를 잠그지 않도록 batch 단위로 나누어 커밋
+        total = 0
+        while True:
+            deleted = await self.delete_expired_tokens_batch(before_date, batch_size)
+            total += deleted
+            if deleted < batch_size:
+                return total
+
+    async def delete_expired_tokens_batch(self, before_date: datetime, limit: int) -> int:
+        # access_token_expires, refresh_token_expires 모두 before_date 이전이면 삭제
+        # 다른 트랜잭션이 잡고 있는 row는 건너뛰고 다음 batch에서 처리
+        before_date = _to_db(before_date)
+        expired_keys = (
+            select(TokenModel.id, TokenModel.refresh_token_expires)
+            .where(
+                (TokenModel.refresh_token_expires < before_date) &
+                (TokenModel.access_token_expires < before_date)
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
         stmt = delete(TokenModel).where(
-            (TokenModel.access_token_expires < before_date) &
-            (TokenModel.refresh_token_expires < before_date)
+            tuple_(TokenModel.id, TokenModel.refresh_token_expires).in_(expired_keys)
         )
         result = await self.session.execute(stmt)
         await self.session.commit()
         return result.rowcount
 
-    def _to_entity(self, model: TokenModel) -> TokenEntity:
+    def _to_entity(
+        self,
+        model: TokenModel,
+        access_token: Optional[str] = None,
+        refresh_token: Optional[str] = None,
+    ) -> TokenEntity:
         return TokenEntity(
             user_id=model.user_id,
-            access_token=model.access_token,
-            refresh_token=model.refresh_token,
-            access_token_expires=model.access_token_expires,
-            refresh_token_expires=model.refresh_token_expires,
+            access_token=access_token or model.access_token.hex(),
+            refresh_token=refresh_token or model.refresh_token.hex(),
+            access_token_expires=_from_db(model.access_token_expires),
+            refresh_token_expires=_from_db(model.refresh_token_expires),
             is_revoked=model.is_revoked,
-            created_at=model.created_at,
-            revoked_at=model.revoked_at,
+            created_at=_from_db(model.created_at),
+            revoked_at=_from_db(model.revoked_at),
+            family_id=model.family_id,
         )
\ No newline at end of file
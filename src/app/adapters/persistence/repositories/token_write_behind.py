@@ -0,0 +1,81 @@
+# app/adapters/persistence/repositories/token_write_behind.py
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+from src.app.adapters.persistence.session import AsyncRelationDataBaseTemplate
+from src.app.adapters.persistence.repositories.token_repository import TokenRepository
+from src.app.core.ports.token_port import TokenRepositoryPort
+from src.common.logger import UVICORN_LOGGER
+from src.settings.environment import get_settings
+
+TokenWrite = Callable[[TokenRepositoryPort], Awaitable]
+
+
+class TokenWriteBehind:
+    """
+    토큰 변경 사항을 요청 경로 밖에서 Postgres에 기록하는 write-behind 큐.
+    - 큐가 가득 차면 요청을 막지 않고 해당 기록을 버린 뒤 dropped를 증가
+    - 워커는 한 세션에서 최대 batch_size 건을 처리
+    """
+    _instance: Optional["TokenWriteBehind"] = None
+
+    def __init__(self, maxsize: Optional[int] = None, batch_size: Optional[int] = None):
+        self.queue: asyncio.Queue[TokenWrite] = asyncio.Queue(
+            maxsize=maxsize or get_settings().token.token_write_behind_queue_size
+        )
+        self.batch_size = batch_size or get_settings().token.token_write_behind_batch_size
+        self.dropped = 0
+        self._worker: Optional[asyncio.Task] = None
+
+    @classmethod
+    def get_instance(cls) -> "TokenWriteBehind":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def startup(cls) -> None:
+        instance = cls.get_instance()
+        if instance._worker is None:
+            instance._worker = asyncio.create_task(instance._run())
+
+    @classmethod
+    async def shutdown(cls, timeout: float = 5.0) -> None:
+        instance = cls._instance
+        if instance is None or instance._worker is None:
+            return
+        # 남은 기록을 제한 시간 내에서 최대한 반영
+        try:
+            await asyncio.wait_for(instance.queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            UVICORN_LOGGER.warning(f"Token write-behind shutdown with {instance.queue.qsize()} pending writes")
+        instance._worker.cancel()
+        try:
+            await instance._worker
+        except asyncio.CancelledError:
+            pass
+        cls._instance = None
+
+    def enqueue(self, write: TokenWrite) -> None:
+        try:
+            self.queue.put_nowait(write)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            UVICORN_LOGGER.warning(f"Token write-behind queue full, dropped={self.dropped}")
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            try:
+                async with AsyncRelationDataBaseTemplate.get_session() as session:
+                    repository = TokenRepository(session)
+                    for write in batch:
+                        await write(repository)
+            except Exception as e:
+                UVICORN_LOGGER.error(f"Token write-behind failed for {len(batch)} writes: {e!r}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
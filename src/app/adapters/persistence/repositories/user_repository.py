@@ -1,14 +1,17 @@
 from typing import Optional, List
 from uuid import UUID
-from sqlalchemy import select, cast, String
+from sqlalchemy import select, delete, cast, func, literal, literal_column, tuple_, JSON
+from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.core.domain.entities.user import UserEntity
 from src.app.core.domain.value_objects import UserState
 from src.app.core.ports.user_port import UserRepositoryPort
 from src.app.adapters.persistence.models.user_model import UserModel
+from src.app.adapters.persistence.models.social_account_model import SocialAccountModel
 from datetime import datetime, timezone
 from src.app.adapters.persistence.mappers.user_mapper import UserMapper
-from sqlalchemy.dialects.postgresql import JSONB
+from src.common.exception import SocialAccountConflictException
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 
 class UserRepository(UserRepositoryPort):
     def __init__(self, session: AsyncSession):
@@ -18,6 +21,8 @@ class UserRepository(UserRepositoryPort):
     async def create(self, user: UserEntity):
         user_model = self.mapper.to_model(user)
         self.session.add(user_model)
+        await self.session.flush()
+        await self._sync_social_accounts(user.user_id, user.social_accounts)
         await self.session.commit()
         await self.session.refresh(user_model)
         return self.mapper.to_entity(user_model)
@@ -38,8 +43,11 @@ class UserRepository(UserRepositoryPort):
 
     async def get_by_social_account(self, provider: str, social_id: str):
         result = await self.session.execute(
-            select(UserModel).where(
-                cast(UserModel.social_accounts[provider], String) == social_id
+            select(UserModel)
+            .join(SocialAccountModel, SocialAccountModel.user_id == UserModel.user_id)
+            .where(
+                SocialAccountModel.provider == provider,
+                SocialAccountModel.provider_id == social_id
             )
         )
         db_user = result.scalar_one_or_none()
@@ -61,6 +69,7 @@ class UserRepository(UserRepositoryPort):
         db_user.social_accounts = user.social_accounts
         db_user.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
         db_user.last_login = datetime.now(timezone.utc).replace(tzinfo=None)
+        await self._sync_social_accounts(user.user_id, user.social_accounts)
         await self.session.commit()
         await self.session.refresh(db_user)
         return self.mapper.to_entity(db_user)
@@ -76,6 +85,99 @@ class UserRepository(UserRepositoryPort):
             return True
         return False
 
+    async def find_or_create_by_social_account(self, user: UserEntity, provider: str, social_id: str):
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        stmt = pg_insert(UserModel).values(
+            user_id=user.user_id,
+            name=user.name,
+            email=user.email,
+            user_type=user.user_type,
+            created_at=now,
+            updated_at=now,
+            last_login=now,
+            state=user.state,
+            social_accounts={provider: social_id},
+        )
+        # 기존 row가 있으면 소셜 계정만 병합 (|| 는 오른쪽 값이 우선이므로 기존 연결 정보 유지)
+        merged_social_accounts = func.jsonb_build_object(provider, social_id).op("||")(
+            func.coalesce(cast(UserModel.social_accounts, JSONB), literal_column("'{}'::jsonb"))
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserModel.email],
+            set_={
+                "social_accounts": cast(merged_social_accounts, JSON),
+                "updated_at": now,
+                "last_login": now,
+            },
+        ).returning(UserModel.__table__)
+        upserted = stmt.cte("upserted")
+
+        # 같은 statement 안에서 조회 테이블에도 연결 (다른 provider_id가 이미 연결된 경우 제외)
+        link_social_account = self._link_or_skip_conflict(
+            pg_insert(SocialAccountModel).from_select(
+                ["provider", "provider_id", "user_id"],
+                select(literal(provider), literal(social_id), upserted.c.user_id).where(
+                    cast(upserted.c.social_accounts, JSONB)[provider].astext == social_id
+                ),
+            )
+        ).cte("linked")
+
+        result = await self.session.execute(
+            select(
+                aliased(UserModel, upserted),
+                select(func.count()).select_from(link_social_account).scalar_subquery(),
+            )
+            .execution_options(populate_existing=True)
+        )
+        db_user, linked = result.one()
+        # 이메일의 기존 row에 같은 provider의 다른 계정이 이미 연결된 경우 (병합 시 기존 값이 유지됨)
+        if (db_user.social_accounts or {}).get(provider) != social_id:
+            await self.session.rollback()
+            raise SocialAccountConflictException(f"This user is already linked to another {provider} account")
+        # 조회 테이블에서 이 소셜 계정이 다른 사용자를 가리키는 경우 (두 저장소가 어긋나지 않도록 전체 취소)
+        if not linked:
+            await self.session.rollback()
+            raise SocialAccountConflictException(f"This {provider} account is already linked to another user")
+        await self.session.commit()
+        return self.mapper.to_entity(db_user)
+
+    async def _sync_social_accounts(self, user_id: UUID, social_accounts: Optional[dict]) -> None:
+        """users.social_accounts와 user_social_accounts 조회 테이블을 같은 트랜잭션에서 맞춥니다."""
+        pairs = list((social_accounts or {}).items())
+        stale = delete(SocialAccountModel).where(SocialAccountModel.user_id == user_id)
+        if pairs:
+            stale = stale.where(
+                tuple_(SocialAccountModel.provider, SocialAccountModel.provider_id).not_in(pairs)
+            )
+        await self.session.execute(stale)
+
+        if pairs:
+            result = await self.session.execute(
+                self._link_or_skip_conflict(
+                    pg_insert(SocialAccountModel).values([
+                        {"provider": provider, "provider_id": provider_id, "user_id": user_id}
+                        for provider, provider_id in pairs
+                    ])
+                )
+            )
+            linked = {(row.provider, row.provider_id) for row in result}
+            conflicts = [provider for provider, provider_id in pairs if (provider, provider_id) not in linked]
+            if conflicts:
+                await self.session.rollback()
+                raise SocialAccountConflictException(f"This {conflicts[0]} account is already linked to another user")
+
+    @staticmethod
+    def _link_or_skip_conflict(stmt):
+        """
+        user_social_accounts 연결 INSERT. 이미 같은 사용자에게 연결된 row는 no-op update로 RETURNING에 포함하고,
+        다른 사용자에게 연결된 row는 갱신하지 않아 RETURNING에서 빠지므로 호출부가 충돌을 감지할 수 있다.
+        """
+        return stmt.on_conflict_do_update(
+            index_elements=[SocialAccountModel.provider, SocialAccountModel.provider_id],
+            set_={"user_id": stmt.excluded.user_id},
+            where=SocialAccountModel.user_id == stmt.excluded.user_id,
+        ).returning(SocialAccountModel.provider, SocialAccountModel.provider_id)
+
     async def list_by_state(self, state: UserState):
         result = await self.session.execute(
             select(UserModel).where(UserModel.state == state.value)
@@ -0,0 +1,77 @@
+# app/adapters/persistence/schema_check.py
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.app.adapters.persistence.session import AsyncRelationDataBaseTemplate
+from src.common.exception import SchemaVersionMismatchError
+from src.common.logger import UVICORN_LOGGER
+from src.settings.environment import get_settings
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+PROJECT_ROOT = Path(__file__).resolve().parents[4]
+
+
+class SchemaCheckMode(str, Enum):
+    STRICT = "strict"  # 불일치 시 기동 거부
+    WARN = "warn"      # 불일치 시 경고만 남기고 기동
+    OFF = "off"
+
+
+def alembic_config() -> "Config":
+    """작업 디렉터리와 무관하게 저장소의 alembic.ini / alembic 디렉터리를 사용"""
+    # alembic(mako 템플릿 등)은 기동 import 경로에서 제외하고 확인/migrate 시점에만 로드
+    from alembic.config import Config
+    config = Config(str(PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    return config
+
+
+@lru_cache(maxsize=None)
+def expected_heads() -> Tuple[str, ...]:
+    """코드에 포함된 migration의 head revision (DB 접근 없이 파일만 읽음)"""
+    from alembic.script import ScriptDirectory
+    return tuple(sorted(ScriptDirectory.from_config(alembic_config()).get_heads()))
+
+
+async def current_revisions(engine: AsyncEngine) -> Tuple[str, ...]:
+    """DB에 적용된 revision. alembic_version 한 번 조회 (테이블이 없으면 빈 값)"""
+    try:
+        async with engine.connect() as conn:
+            rows = await conn.execute(text("SELECT version_num FROM alembic_version"))
+            return tuple(sorted(row[0] for row in rows))
+    except ProgrammingError:
+        return ()
+
+
+async def check_schema(engine: Optional[AsyncEngine] = None, mode: Optional[str] = None) -> bool:
+    """
+    기동 시 스키마 확인. create_all처럼 테이블마다 catalog를 조회하지 않고
+    alembic_version 한 행만 읽어 코드의 head revision과 비교한다.
+    스키마 생성/변경은 `poetry run migrate`로 배포 단계에서 한 번만 수행.
+    """
+    mode = SchemaCheckMode(mode or get_settings().database.schema_check_mode)
+    if mode is SchemaCheckMode.OFF:
+        return True
+
+    heads = expected_heads()
+    current = await current_revisions(engine or AsyncRelationDataBaseTemplate.get_engine())
+    if current == heads:
+        return True
+
+    message = (
+        f"Database schema revision {list(current) or 'none'} does not match migration head {list(heads)}; "
+        f"run `poetry run migrate`"
+    )
+    if mode is SchemaCheckMode.STRICT:
+        UVICORN_LOGGER.error(message)
+        raise SchemaVersionMismatchError(message)
+    UVICORN_LOGGER.warning(message)
+    return False
@@ -1,16 +1,60 @@
 from __future__ import annotations
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import AsyncGenerator
 from contextlib import asynccontextmanager
 from functools import wraps
 
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy import text
 
 from src.common.logger import UVICORN_LOGGER
 from src.common.exception import DatabaseConnectionError
-from src.settings.environment import DataBaseEnviornment
+from src.app.infrastructure.monitoring import prometheus as metrics
+from src.app.adapters.persistence.query_stats import instrument_engine
+from src.settings.environment import get_settings
+
+
+@dataclass
+class PoolWaitStats:
+    """풀에서 커넥션을 얻기까지 걸린 시간(신규 연결 생성 포함) 누적 통계"""
+    acquired: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.acquired += 1
+        self.wait_seconds_total += elapsed
+        if elapsed > self.wait_seconds_max:
+            self.wait_seconds_max = elapsed
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 checkout 대기 시간을 기록하는 QueuePool"""
+    wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.timeouts += 1
+            metrics.DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        elapsed = time.perf_counter() - start
+        self.wait_stats.record(elapsed)
+        metrics.DB_POOL_CHECKOUT_WAIT.observe(elapsed)
+        metrics.DB_POOL_CHECKED_OUT.inc()
+        return connection
+
+    def _do_return_conn(self, record):
+        metrics.DB_POOL_CHECKED_OUT.dec()
+        super()._do_return_conn(record)
 
 
 class AsyncRelationDataBaseTemplate:
@@ -22,11 +66,41 @@ class AsyncRelationDataBaseTemplate:
     def get_engine(cls):
         if cls._engine is None:
             cls._engine = create_async_engine(
-                DataBaseEnviornment.get_async_url_connection(),
-                echo=True
+                get_settings().database.get_async_url_connection(),
+                poolclass=InstrumentedAsyncQueuePool,
+                **get_settings().database.get_engine_options()
             )
+            if get_settings().database.rdb_query_stats:
+                instrument_engine(cls._engine.sync_engine)
         return cls._engine
 
+    @classmethod
+    async def shutdown(cls) -> None:
+        """풀의 커넥션을 모두 닫음. 이후 get_engine()은 엔진을 새로 만든다"""
+        if cls._engine is not None:
+            await cls._engine.dispose()
+            cls._engine = None
+            cls._session_factory = None
+
+    @classmethod
+    def pool_stats(cls) -> dict:
+        """커넥션 풀 사용 현황. 워커 수 x max_connections가 Postgres max_connections를 넘지 않도록 산정할 때 사용"""
+        pool = cls.get_engine().pool
+        wait_stats = InstrumentedAsyncQueuePool.wait_stats
+        return {
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "max_connections": pool.size() + pool._max_overflow,
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "acquired": wait_stats.acquired,
+            "timeouts": wait_stats.timeouts,
+            "wait_seconds_total": wait_stats.wait_seconds_total,
+            "wait_seconds_avg": wait_stats.wait_seconds_total / wait_stats.acquired if wait_stats.acquired else 0.0,
+            "wait_seconds_max": wait_stats.wait_seconds_max,
+        }
+
     @classmethod
     def get_session_factory(cls):
         if cls._session_factory is None:
@@ -42,14 +116,18 @@ class AsyncRelationDataBaseTemplate:
     async def get_session(cls) -> AsyncGenerator[AsyncSession, None]:
         """비동기 데이터베이스 세션 컨텍스트 매니저"""
         session: AsyncSession = cls.get_session_factory()()
+        started = time.perf_counter()
+        outcome = "commit"
         try:
             yield session
             await session.commit()
         except Exception as e:
+            outcome = "rollback"
             await session.rollback()
             raise e
         finally:
             await session.close()
+            metrics.DB_SESSION_DURATION.labels(outcome).observe(time.perf_counter() - started)
 
     @classmethod
     def db_session(cls, func):
@@ -0,0 +1,124 @@
+# app/adapters/persistence/token_partitions.py
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.app.adapters.persistence.session import AsyncRelationDataBaseTemplate
+from src.common.logger import UVICORN_LOGGER
+from src.settings.environment import get_settings
+
+# 여러 워커가 동시에 파티션을 만들지 않도록 직렬화하는 advisory lock 키
+PARTITION_LOCK_KEY = 0x746F6B656E5F7074  # "token_pt"
+
+
+class TokenPartitionManager:
+    """
+    refresh_token_expires 기준 일 단위 range 파티션 관리.
+    - 파티션 이름: {table}_pYYYYMMDD, 범위 [해당일 00:00, 다음날 00:00) (UTC)
+    - 앞으로 premake_days 일치 파티션을 미리 생성 (default 파티션에 row가 쌓이지 않도록)
+    - 상한이 오늘 - retention_days 이전인 파티션은 DROP (row 단위 DELETE 없이 O(1))
+    """
+
+    def __init__(
+        self,
+        table: str = "tokens",
+        schema: str = "public",
+        premake_days: Optional[int] = None,
+        retention_days: Optional[int] = None,
+    ):
+        self.table = table
+        self.schema = schema
+        self.premake_days = int(
+            get_settings().token.token_partition_premake_days if premake_days is None else premake_days
+        )
+        self.retention_days = int(
+            get_settings().token.token_partition_retention_days if retention_days is None else retention_days
+        )
+
+    @property
+    def prefix(self) -> str:
+        return f"{self.table}_p"
+
+    def partition_name(self, day: date) -> str:
+        return f"{self.prefix}{day:%Y%m%d}"
+
+    async def is_partitioned(self, conn: AsyncConnection) -> bool:
+        relkind = await conn.scalar(
+            text("""
+                SELECT c.relkind::text FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = :schema AND c.relname = :table
+            """),
+            {"schema": self.schema, "table": self.table},
+        )
+        return relkind == "p"
+
+    async def list_partitions(self, conn: AsyncConnection) -> Dict[date, str]:
+        result = await conn.execute(
+            text("""
+                SELECT c.relname FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                JOIN pg_class p ON p.oid = i.inhparent
+                JOIN pg_namespace n ON n.oid = p.relnamespace
+                WHERE n.nspname = :schema AND p.relname = :table
+            """),
+            {"schema": self.schema, "table": self.table},
+        )
+        partitions = {}
+        for (name,) in result:
+            if not name.startswith(self.prefix):
+                continue
+            try:
+                partitions[datetime.strptime(name[len(self.prefix):], "%Y%m%d").date()] = name
+            except ValueError:
+                continue
+        return partitions
+
+    async def ensure_partitions(self, conn: AsyncConnection, today: Optional[date] = None) -> List[str]:
+        today = today or datetime.now(timezone.utc).date()
+        existing = await self.list_partitions(conn)
+        created = []
+        for offset in range(-1, self.premake_days + 1):
+            day = today + timedelta(days=offset)
+            if day in existing:
+                continue
+            name = self.partition_name(day)
+            try:
+                # default 파티션에 해당 범위 row가 있으면 실패하므로 savepoint로 격리
+                async with conn.begin_nested():
+                    await conn.execute(text(
+                        f'CREATE TABLE "{self.schema}"."{name}" PARTITION OF "{self.schema}"."{self.table}" '
+                        f"FOR VALUES FROM ('{day}') TO ('{day + timedelta(days=1)}')"
+                    ))
+                created.append(name)
+            except Exception as e:
+                UVICORN_LOGGER.warning(f"Failed to create partition {name}: {e!r}")
+        return created
+
+    async def drop_expired_partitions(self, conn: AsyncConnection, today: Optional[date] = None) -> List[str]:
+        today = today or datetime.now(timezone.utc).date()
+        cutoff = today - timedelta(days=self.retention_days)
+        dropped = []
+        for day, name in sorted((await self.list_partitions(conn)).items()):
+            # 파티션 상한(day + 1) 이전에 refresh 토큰이 모두 만료되었으므로 access 토큰도 만료 상태
+            if day + timedelta(days=1) > cutoff:
+                break
+            await conn.execute(text(f'DROP TABLE "{self.schema}"."{name}"'))
+            dropped.append(name)
+        return dropped
+
+    async def maintain(self, conn: AsyncConnection, today: Optional[date] = None) -> Dict[str, List[str]]:
+        if not await self.is_partitioned(conn):
+            return {"created": [], "dropped": []}
+        await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+        created = await self.ensure_partitions(conn, today)
+        dropped = await self.drop_expired_partitions(conn, today)
+        if created or dropped:
+            UVICORN_LOGGER.info(f"Token partitions created={created} dropped={dropped}")
+        return {"created": created, "dropped": dropped}
+
+    async def run(self, today: Optional[date] = None) -> Dict[str, List[str]]:
+        async with AsyncRelationDataBaseTemplate.get_engine().begin() as conn:
+            return await self.maintain(conn, today)
@@ -0,0 +1,11 @@
+from fastapi import Request
+
+from src.app.core.ports.logger_port import LoggerPort
+from src.app.infrastructure.logging.logger import StructuredLogger, auth_logger
+
+_AUTH_LOGGER = StructuredLogger(auth_logger)
+
+
+def get_auth_logger(request: Request) -> LoggerPort:
+    """요청 경로/메서드를 문맥으로 묶은 auth 로거 (문맥 병합은 실제로 기록될 때만 수행)"""
+    return _AUTH_LOGGER.bind(method=request.method, path=request.scope["path"])
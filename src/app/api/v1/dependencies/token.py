@@ -0,0 +1,84 @@
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from fastapi import Depends, HTTPException, Request
+
+from src.app.adapters.persistence.repositories.redis_token_repository import RedisTokenRepository
+from src.app.adapters.persistence.repositories.token_repository import TokenRepository
+from src.app.adapters.persistence.repositories.token_write_behind import TokenWriteBehind
+from src.app.adapters.persistence.session import get_session
+from src.app.api.v1.schemas.auth import UserResponse
+from src.app.core.ports.token_port import TokenRepositoryPort
+from src.app.core.domain.value_objects import UserType
+from src.app.core.services.token_service import TokenService
+from src.app.infrastructure.cache.redis_client import RedisCache
+from src.app.infrastructure.cache.revocation_bus import RevocationBus, RevocationMessage, RevocationType
+from src.app.infrastructure.security.jwt_denylist import JwtDenylist
+from src.app.infrastructure.security.token_verifier import TokenVerifier, VerifiedToken
+from src.common.exception import InvalidTokenException, TokenExpiredException
+from src.settings.environment import get_settings
+
+
+def render_user_response(claims: Dict[str, Any]) -> bytes:
+    return UserResponse(
+        user_id=str(claims.get("user_id")),
+        email=claims.get("email"),
+        name=claims.get("name"),
+        user_type=str(claims.get("user_type")),
+        social_accounts={"google": claims.get("sub")}
+    ).model_dump_json().encode()
+
+
+@lru_cache(maxsize=None)
+def get_token_verifier() -> TokenVerifier:
+    """프로세스 당 하나의 TokenVerifier(검증 캐시 공유)를 반환합니다."""
+    return TokenVerifier(render=render_user_response)
+
+
+async def authenticate(token: Optional[str]) -> VerifiedToken:
+    """
+    Authorization 헤더/쿠키의 access_token을 검증하고, 실패 시 401을 발생시킵니다.
+    로그아웃 등으로 폐기된 jti는 denylist(Bloom filter 우선)로 거릅니다.
+    """
+    if not token:
+        raise HTTPException(status_code=401, detail="No access token cookie found")
+
+    try:
+        verified = get_token_verifier().verify(token.replace("Bearer ", ""))
+    except TokenExpiredException:
+        raise HTTPException(status_code=401, detail="Access token expired")
+    except InvalidTokenException:
+        raise HTTPException(status_code=401, detail="Invalid access token")
+
+    if await JwtDenylist.get_instance().is_revoked(verified.claims.get("jti")):
+        raise HTTPException(status_code=401, detail="Access token revoked")
+    return verified
+
+
+def apply_revocation(message: RevocationMessage) -> None:
+    """다른 워커가 발행한 폐기 메시지를 이 프로세스의 검증 캐시에 반영합니다."""
+    if message.type == RevocationType.USER:
+        get_token_verifier().revoke_users(message.user_ids, message.revoked_at)
+
+
+async def require_admin(request: Request) -> VerifiedToken:
+    """Authorization 헤더 또는 access_token 쿠키의 토큰이 관리자 토큰인지 확인합니다."""
+    verified = await authenticate(request.headers.get("Authorization") or request.cookies.get("access_token"))
+    if verified.claims.get("user_type") != UserType.ADMIN.value:
+        raise HTTPException(status_code=403, detail="Admin privileges required")
+    return verified
+
+
+async def get_token_repository(
+    session = Depends(get_session)
+) -> TokenRepositoryPort:
+    if get_settings().token.use_redis():
+        write_behind = TokenWriteBehind.get_instance() if get_settings().token.token_write_behind else None
+        return RedisTokenRepository(RedisCache(), write_behind)
+    return TokenRepository(session)
+
+
+async def get_token_service(
+    token_repository: TokenRepositoryPort = Depends(get_token_repository)
+) -> TokenService:
+    return TokenService(token_repository, revocation_publisher=RevocationBus.get_instance())
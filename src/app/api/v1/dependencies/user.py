@@ -1,10 +1,14 @@
 from fastapi import Depends
 from src.app.core.services.user_service import UserService
+from src.app.adapters.persistence.repositories.cached_user_repository import CachedUserRepository, UserCache
 from src.app.adapters.persistence.repositories.user_repository import UserRepository
 from src.app.adapters.persistence.session import get_session
+from src.settings.environment import get_settings
 
 async def get_user_service(
     session = Depends(get_session)
 ) -> UserService:
     user_repository = UserRepository(session)
-    return UserService(user_repository)
\ No newline at end of file
+    if get_settings().cache.user_cache_enabled:
+        user_repository = CachedUserRepository(user_repository, UserCache.get_instance())
+    return UserService(user_repository)
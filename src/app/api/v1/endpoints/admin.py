@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends
+
+from src.app.api.v1.dependencies.logger import get_auth_logger
+from src.app.api.v1.dependencies.token import get_token_service, require_admin
+from src.app.api.v1.schemas.admin import RevokeUserTokensRequest, RevokeUserTokensResponse
+from src.app.api.v1.schemas.common import Response
+from src.app.api.v1.schemas.response import create_response
+from src.app.core.ports.logger_port import LoggerPort
+from src.app.core.services.token_service import TokenService
+
+admin_router = APIRouter(
+    prefix="/api/v1/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@admin_router.post(
+    path="/users/revoke-tokens",
+    response_model=Response[RevokeUserTokensResponse],
+    summary="사용자 토큰 일괄 폐기",
+    description="여러 사용자의 토큰을 한 번의 UPDATE로 폐기하고 모든 워커에 폐기 사실을 전파합니다.",
+)
+async def revoke_user_tokens(
+    request: RevokeUserTokensRequest,
+    token_service: TokenService = Depends(get_token_service),
+    logger: LoggerPort = Depends(get_auth_logger),
+):
+    revoked = await token_service.revoke_tokens_for_users(request.user_ids)
+    logger.info("Revoked user tokens", users=len(request.user_ids), revoked_tokens=revoked)
+    return create_response(
+        data=RevokeUserTokensResponse(users=len(request.user_ids), revoked_tokens=revoked),
+        message="User tokens revoked",
+        skip_validation=True,
+    )
@@ -1,22 +1,27 @@
-import jwt
-import requests
 from fastapi import APIRouter, HTTPException, status, Request, Depends
 from fastapi.responses import RedirectResponse
+from redis.exceptions import RedisError
 from datetime import datetime, timezone, timedelta
+from uuid import uuid4
+from src.app.api.v1.dependencies.token import authenticate, get_token_verifier
 from src.app.api.v1.dependencies.user import get_user_service
 from src.app.api.v1.schemas.response import create_response, create_error_response
 from src.app.api.v1.schemas.common import Response
+from src.app.core.ports.http_client_port import HttpClientPort
+from src.app.core.ports.id_token_port import IdTokenVerifierPort
 from src.app.core.services.user_service import UserService
-from src.settings.environment import GoogleEnvironment,SecretKeyEnvironment
+from src.app.infrastructure.http.http_client import get_http_client
+from src.app.infrastructure.security.google_id_token import get_id_token_verifier
+from src.app.infrastructure.security.jwt_denylist import JwtDenylist
+from src.app.infrastructure.security.key_ring import KeyRing
+from src.common.exception import ExternalServiceException, InvalidTokenException, TokenExpiredException
+from src.common.logger import UVICORN_LOGGER
+from src.settings.environment import get_settings
 from urllib.parse import urlencode
-from icecream import ic
+from src.common.trace import trace
 
 auth_google_router = APIRouter(prefix="/api/v1/auth/google", tags=["auth"])
 
-GOOGLE_CLIENT_ID = GoogleEnvironment.GOOGLE_CLIENT_ID.value
-GOOGLE_CLIENT_SECRET = GoogleEnvironment.GOOGLE_CLIENT_SECRET.value
-GOOGLE_REDIRECT_URI = GoogleEnvironment.GOOGLE_REDIRECT_URI.value
-FRONTEND_REDIRECT_URL = GoogleEnvironment.FRONTEND_REDIRECT_URL.value
 
 @auth_google_router.get("/login")
 def google_login():
@@ -25,9 +30,10 @@ def google_login():
        - 백엔드가 구글 OAuth 승인 URL 생성
        - 곧바로 구글로 Redirect
     """
+    google = get_settings().google
     params = {
-        "client_id": GOOGLE_CLIENT_ID,
-        "redirect_uri": GOOGLE_REDIRECT_URI,
+        "client_id": google.google_client_id,
+        "redirect_uri": google.google_redirect_uri,
         "response_type": "code",
         "scope": "openid email profile",
         "state": "kr",  # 임의의 state (CSRF 방지용)
@@ -37,92 +43,105 @@ def google_login():
 
 
 @auth_google_router.get("/callback")
-async def google_callback(code: str, state: str, user_service: UserService = Depends(get_user_service)):
+async def google_callback(
+    code: str,
+    state: str,
+    user_service: UserService = Depends(get_user_service),
+    http_client: HttpClientPort = Depends(get_http_client),
+    id_token_verifier: IdTokenVerifierPort = Depends(get_id_token_verifier),
+):
     """
     2) 구글이 여기로 Authorization Code를 전달해줌.
        - code -> access_token (Google) 교환
-       - userinfo 획득 -> DB 처리 (생략 or 구현)
+       - id_token 검증(실패 시 userinfo 조회) -> DB 처리
        - JWT access token 생성 후 쿠키에 저장
        - 프론트엔드로 리다이렉트
     """
+    google = get_settings().google
     if not code:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No code provided")
-    if not GOOGLE_CLIENT_ID or not GOOGLE_CLIENT_SECRET:
+    if not google.google_client_id or not google.google_client_secret:
         raise HTTPException(status_code=500, detail="Google OAuth credentials not set")
 
     # -- (1) code -> access_token, id_token 교환 --
-    token_url = "https://oauth2.googleapis.com/token"
     data = {
         "code": code,
-        "client_id": GOOGLE_CLIENT_ID,
-        "client_secret": GOOGLE_CLIENT_SECRET,
-        "redirect_uri": GOOGLE_REDIRECT_URI,
+        "client_id": google.google_client_id,
+        "client_secret": google.google_client_secret,
+        "redirect_uri": google.google_redirect_uri,
         "grant_type": "authorization_code",
     }
-    token_res = requests.post(token_url, data=data)
+    token_res = await http_client.post(google.google_token_url, data=data)
     if token_res.status_code != 200:
         raise HTTPException(status_code=400, detail="Failed to exchange token with Google")
     token_data = token_res.json()
     access_token = token_data.get("access_token")
-    if not access_token:
+    id_token = token_data.get("id_token")
+    if not access_token and not id_token:
         raise HTTPException(status_code=400, detail="No access_token in token response")
 
-    # -- (2) 구글 사용자 정보 조회 --
-    userinfo_url = "https://www.googleapis.com/oauth2/v2/userinfo"
-    headers = {"Authorization": f"Bearer {access_token}"}
-    userinfo_res = requests.get(userinfo_url, headers=headers)
-    if userinfo_res.status_code != 200:
-        raise HTTPException(status_code=400, detail="Failed to get user info from Google")
-    userinfo = userinfo_res.json()
+    # -- (2) 구글 사용자 정보 확인 --
+    #     - id_token 서명을 캐시된 JWKS로 로컬 검증 (userinfo 왕복 생략)
+    #     - 검증이 불가능할 때만 userinfo API로 fallback
+    userinfo = None
+    if id_token:
+        try:
+            claims = await id_token_verifier.verify(id_token)
+            userinfo = {
+                "id": claims.get("sub"),
+                "email": claims.get("email"),
+                "name": claims.get("name", ""),
+            }
+        except (InvalidTokenException, ExternalServiceException) as e:
+            if not google.google_userinfo_fallback:
+                raise HTTPException(status_code=400, detail="Invalid id_token from Google")
+            UVICORN_LOGGER.warning(f"id_token verification failed, falling back to userinfo: {e!r}")
+
+    if userinfo is None:
+        if not access_token or not google.google_userinfo_fallback:
+            raise HTTPException(status_code=400, detail="No access_token in token response")
+        headers = {"Authorization": f"Bearer {access_token}"}
+        userinfo_res = await http_client.get(google.google_userinfo_url, headers=headers)
+        if userinfo_res.status_code != 200:
+            raise HTTPException(status_code=400, detail="Failed to get user info from Google")
+        userinfo = userinfo_res.json()
 
     google_id = userinfo.get("id")
     email = userinfo.get("email")
     name = userinfo.get("name", "")
 
-    # -- (3) 내부 DB에서 사용자 조회/생성 --
-    user = await user_service.get_user_by_email(email)
-
-    ic("get_user_by_email", user)
-
-    if not user:
-        # 새로운 유저 생성 (name, email)
-        user = await user_service.create_user(
-            name=name, 
-            email=email
-        )
-        # 구글 소셜 계정 정보를 추가
-        user = await user_service.add_social_account(
-            user_id=user.user_id, 
-            provider="google", 
-            provider_id=google_id
-        )
-    else:
-        # 이미 존재하는 유저인데, 구글 계정이 없다면 추가
-        if not await user_service.has_social_account(user.user_id, "google"):
-            user = await user_service.add_social_account(
-                user_id=user.user_id,
-                provider="google",
-                provider_id=google_id
-            )
-
-    ic("social_account", user)
+    # -- (3) 내부 DB에서 사용자 조회/생성 + 구글 계정 연결 (단일 upsert) --
+    user = await user_service.find_or_create_by_social_account(
+        name=name,
+        email=email,
+        provider="google",
+        provider_id=google_id
+    )
+
+    trace("auth.google.social_account", user=user)
             
     # -- (4) JWT Access Token 발급 --
     #     - 유효기간 30분 예시
-    expire = datetime.now(timezone.utc) + timedelta(minutes=180)
+    #     - iat: 관리자 일괄 폐기 시 폐기 시각 이전 발급분을 거르는 기준
+    #     - jti: 로그아웃 시 이 토큰만 폐기하기 위한 식별자
+    issued_at = datetime.now(timezone.utc)
+    expire = issued_at + timedelta(minutes=180)
     payload = {
         "sub": google_id,
         "email": email,
         "name": name,
+        "iat": issued_at,
+        "jti": uuid4().hex,
         "exp": expire,
         "iss": "auth-service",
         "user_id": str(user.user_id),
         "user_type": str(user.user_type)
     }
-    jwt_access_token = jwt.encode(payload, SecretKeyEnvironment.get_secret_key(), algorithm=SecretKeyEnvironment.get_algorithm())
+    #     - 키 묶음의 현재 서명 키(kid 헤더 포함)로 서명, 키가 없으면 HS256 공유 비밀키
+    jwt_access_token = KeyRing.get_instance().encode(payload)
 
     # -- (5) JWT를 Cookie에 셋팅 후, 프론트엔드로 리다이렉트 --
-    redirect_resp = RedirectResponse(url=FRONTEND_REDIRECT_URL, status_code=302)
+    redirect_resp = RedirectResponse(url=google.frontend_redirect_url, status_code=302)
     redirect_resp.set_cookie(
         key="access_token",
         value=jwt_access_token,
@@ -137,20 +156,11 @@ async def google_callback(code: str, state: str, user_service: UserService = Dep
 
 
 @auth_google_router.get("/verify")
-def verify_cookie(request: Request):
+async def verify_cookie(request: Request):
     """
     사용자의 쿠키에 있는 'access_token'이 유효한지 확인하는 엔드포인트
     """
-    token = request.cookies.get("access_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="No access token cookie found")
-
-    try:
-        payload = jwt.decode(token, SecretKeyEnvironment.get_secret_key(), SecretKeyEnvironment.get_algorithm())
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=401, detail="Access token expired")
-    except jwt.InvalidTokenError:
-        raise HTTPException(status_code=401, detail="Invalid access token")
+    payload = (await authenticate(request.cookies.get("access_token"))).claims
 
     # 토큰이 유효하면 payload 내부 정보를 반환(예시)
     return {
@@ -164,10 +174,25 @@ def verify_cookie(request: Request):
 
 
 @auth_google_router.get("/logout")
-def logout():
+async def logout(request: Request):
     """
-    쿠키를 삭제하여 로그아웃 처리
+    토큰의 jti를 폐기 목록에 올리고 쿠키를 삭제하여 로그아웃 처리
+    (쿠키가 유출되었더라도 만료 전까지 재사용 불가)
     """
-    redirect_resp = RedirectResponse(url=FRONTEND_REDIRECT_URL, status_code=302)
+    google = get_settings().google
+    token = request.cookies.get("access_token")
+    if token:
+        try:
+            claims = get_token_verifier().verify(token).claims
+        except (InvalidTokenException, TokenExpiredException):
+            claims = {}
+        if claims.get("jti") and claims.get("exp"):
+            try:
+                await JwtDenylist.get_instance().revoke(claims["jti"], float(claims["exp"]))
+            except (RedisError, OSError) as e:
+                # 폐기 목록 기록에 실패해도 쿠키 삭제와 redirect는 진행
+                UVICORN_LOGGER.error(f"Failed to revoke token on logout: {e!r}")
+
+    redirect_resp = RedirectResponse(url=google.frontend_redirect_url, status_code=302)
     redirect_resp.delete_cookie(key="access_token")
     return redirect_resp
\ No newline at end of file
@@ -0,0 +1,62 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends
+
+from src.app.adapters.persistence.repositories.cached_user_repository import UserCache
+from src.app.adapters.persistence.repositories.token_cleanup import TokenCleanupJob
+from src.app.adapters.persistence.session import AsyncRelationDataBaseTemplate
+from src.app.api.v1.dependencies.token import require_admin
+from src.app.api.v1.schemas.common import Response
+from src.app.api.v1.schemas.response import create_response
+from src.app.infrastructure.logging.logger import LogPipeline
+from src.app.infrastructure.security.jwt_denylist import JwtDenylist
+
+# 풀 크기/캐시/폐기 목록/로깅 큐 상태는 운영 정보이므로 관리자만 조회
+diagnostics_router = APIRouter(
+    prefix="/api/v1/diagnostics",
+    tags=["diagnostics"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@diagnostics_router.get(
+    path="/pool",
+    response_model=Response[Dict[str, Any]],
+    summary="DB 커넥션 풀 현황",
+    description="워커 프로세스의 커넥션 풀 사용량과 checkout 대기 시간을 조회합니다.",
+)
+async def get_pool_stats():
+    return create_response(data=AsyncRelationDataBaseTemplate.pool_stats())
+
+
+@diagnostics_router.get(
+    path="/cache",
+    response_model=Response[Dict[str, Any]],
+    summary="사용자 캐시 현황",
+    description="워커 프로세스의 사용자 캐시 hit/miss, JWT 폐기 목록(Bloom filter) 통계를 조회합니다.",
+)
+async def get_cache_stats():
+    return create_response(data={
+        "user": UserCache.get_instance().stats(),
+        "jwt_denylist": JwtDenylist.get_instance().stats(),
+    })
+
+
+@diagnostics_router.get(
+    path="/token-cleanup",
+    response_model=Response[Dict[str, Any]],
+    summary="만료 토큰 정리 작업 현황",
+    description="워커 프로세스의 만료 토큰 batch 삭제 진행 통계를 조회합니다.",
+)
+async def get_token_cleanup_stats():
+    return create_response(data=TokenCleanupJob.get_instance().stats_dict())
+
+
+@diagnostics_router.get(
+    path="/logging",
+    response_model=Response[Dict[str, Any]],
+    summary="로깅 큐 현황",
+    description="비동기 로깅 큐 적재량과 back-pressure로 버려진 레코드 수를 조회합니다.",
+)
+async def get_logging_stats():
+    return create_response(data=LogPipeline.get_instance().stats())
@@ -0,0 +1,30 @@
+import hashlib
+import json
+
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+
+from src.app.infrastructure.security.key_ring import KeyRing
+from src.settings.environment import get_settings
+
+# 표준 위치(/.well-known)에 두어야 하므로 /api/v1 prefix를 붙이지 않음
+jwks_router = APIRouter(tags=["auth"])
+
+
+@jwks_router.get(
+    path="/.well-known/jwks.json",
+    summary="JWT 검증용 공개키 (JWKS)",
+    description="현재 서명 키와 다음 순환 키의 공개키를 반환합니다. 소비자는 kid로 키를 선택하여 로컬에서 검증합니다.",
+)
+async def get_jwks(request: Request):
+    key_ring = KeyRing.get_instance()
+    key_ring.reload_if_changed()
+    body = json.dumps(key_ring.jwks(), separators=(",", ":"), sort_keys=True).encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {
+        "Cache-Control": f"public, max-age={get_settings().secret.jwks_max_age}",
+        "ETag": etag,
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
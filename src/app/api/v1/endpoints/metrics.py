@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from src.app.infrastructure.monitoring.prometheus import CONTENT_TYPE_LATEST, render_metrics
+
+# Prometheus scrape 경로는 관례상 /metrics (API 문서에는 노출하지 않음)
+metrics_router = APIRouter(tags=["monitoring"])
+
+
+@metrics_router.get(path="/metrics", include_in_schema=False)
+def get_metrics():
+    # multiprocess 모드에서는 워커별 파일을 읽어 합산하므로 이벤트 루프 밖(threadpool)에서 실행
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
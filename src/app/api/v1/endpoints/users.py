@@ -1,4 +1,3 @@
-import jwt
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.security import APIKeyHeader, APIKeyCookie
@@ -7,15 +6,14 @@ from src.app.api.v1.schemas.auth import (
     AddSocialAccountRequest,
     UserResponse
 )
+from src.app.api.v1.dependencies.logger import get_auth_logger
+from src.app.api.v1.dependencies.token import authenticate
 from src.app.api.v1.dependencies.user import get_user_service
-from src.app.api.v1.schemas.response import create_response, create_error_response
+from src.app.api.v1.schemas.response import create_response, create_error_response, create_raw_response
 from src.app.api.v1.schemas.common import Response
+from src.app.core.ports.logger_port import LoggerPort
 from src.app.core.services.user_service import UserService
 from src.app.core.domain.value_objects import UserState
-from src.app.infrastructure.logging.logger import auth_logger
-from src.settings.environment import SecretKeyEnvironment
-
-from icecream import ic
 
 
 user_router = APIRouter(prefix="/api/v1/users", tags=["users"])
@@ -31,7 +29,8 @@ api_key_cookie = APIKeyCookie(name="access_token", auto_error=False)
 )
 async def create_user(
     request: CreateUserRequest,
-    user_service: UserService = Depends(get_user_service)
+    user_service: UserService = Depends(get_user_service),
+    logger: LoggerPort = Depends(get_auth_logger)
 ):
     """새로운 사용자를 생성합니다."""
     try:
@@ -42,12 +41,12 @@ async def create_user(
             email=user.email,
             user_type=user.user_type,
             social_accounts=user.social_accounts
-        ))
+        ), skip_validation=True)
     except HTTPException as e:
-        auth_logger.error(f"Error creating user: {e.detail}")
+        logger.error("Error creating user", error=e.detail)
         return create_error_response(e.detail, e.status_code)
     except Exception as e:
-        auth_logger.error(f"Unexpected error creating user: {e}")
+        logger.error("Unexpected error creating user", error=str(e))
         return create_error_response(str(e), 500)
 
 @user_router.get(
@@ -58,34 +57,12 @@ async def create_user(
 )
 async def get_me(request: Request, token:str = Depends(api_key_header)):
     """
-    쿠키에 있는 access_token을 꺼내어 JWT decode
+    Authorization 헤더의 access_token을 검증(캐시된 결과 재사용)하여
     사용자 정보(email, name 등)를 반환
     """
-    try:
-        ic(token)
-        if token is None:
-            raise HTTPException(status_code=401, detail="No access token cookie found")
-        # remove 'Bearer ' from the token
-        token = token.replace("Bearer ", "")
-        payload = jwt.decode(token, 
-                             SecretKeyEnvironment.get_secret_key(), 
-                             algorithms=[SecretKeyEnvironment.get_algorithm()])
-        
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=401, detail="Access token expired")
-    except jwt.InvalidTokenError:
-        raise HTTPException(status_code=401, detail="Invalid access token")
-
-    ic(payload)
-
-    return create_response(
-        data=UserResponse(
-            user_id=str(payload.get("user_id")),
-            email=payload.get("email"),
-            name=payload.get("name"),
-            user_type=str(payload.get("user_type")),
-            social_accounts={"google": payload.get("sub")}
-        ),
+    verified = await authenticate(token)
+    return create_raw_response(
+        verified.body,
         message="User information retrieved",
         status_code=200
     )
@@ -98,33 +75,12 @@ async def get_me(request: Request, token:str = Depends(api_key_header)):
 )
 async def get_me(request: Request, token:str = Depends(api_key_cookie)):
     """
-    쿠키에 있는 access_token을 꺼내어 JWT decode
+    쿠키에 있는 access_token을 검증(캐시된 결과 재사용)하여
     사용자 정보(email, name 등)를 반환
     """
-    try:
-        if not token:
-            raise HTTPException(status_code=401, detail="No access token cookie found")
-        
-        token = token.replace("Bearer ", "")
-        payload = jwt.decode(token, 
-                             SecretKeyEnvironment.get_secret_key(), 
-                             algorithms=[SecretKeyEnvironment.get_algorithm()])
-        
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=401, detail="Access token expired")
-    except jwt.InvalidTokenError:
-        raise HTTPException(status_code=401, detail="Invalid access token")
-
-    ic(payload)
-
-    return create_response(
-        data=UserResponse(
-            user_id=str(payload.get("user_id")),
-            email=payload.get("email"),
-            name=payload.get("name"),
-            user_type=str(payload.get("user_type")),
-            social_accounts={"google": payload.get("sub")}
-        ),
+    verified = await authenticate(token)
+    return create_raw_response(
+        verified.body,
         message="User information retrieved",
         status_code=200
     )
@@ -139,7 +95,8 @@ async def get_me(request: Request, token:str = Depends(api_key_cookie)):
 async def add_social_account(
     user_id: UUID,
     request: AddSocialAccountRequest,
-    user_service: UserService = Depends(get_user_service)
+    user_service: UserService = Depends(get_user_service),
+    logger: LoggerPort = Depends(get_auth_logger)
 ):
     """사용자에게 소셜 계정을 추가합니다."""
     try:
@@ -150,12 +107,12 @@ async def add_social_account(
             email=user.email,
             user_type=str(user.user_type),
             social_accounts=user.social_accounts
-        ))
+        ), skip_validation=True)
     except HTTPException as e:
-        auth_logger.error(f"Error adding social account: {e.detail}")
+        logger.error("Error adding social account", user_id=str(user_id), error=e.detail)
         return create_error_response(e.detail, e.status_code)
     except Exception as e:
-        auth_logger.error(f"Unexpected error adding social account: {e}")
+        logger.error("Unexpected error adding social account", user_id=str(user_id), error=str(e))
         return create_error_response(str(e), 500)
 
 @user_router.patch(
@@ -167,12 +124,13 @@ async def add_social_account(
 async def change_user_state(
     user_id: UUID,
     state: UserState,
-    user_service: UserService = Depends(get_user_service)
+    user_service: UserService = Depends(get_user_service),
+    logger: LoggerPort = Depends(get_auth_logger)
 ):
-    auth_logger.info("Changing user state", user_id=str(user_id), new_state=state.name)
+    logger.info("Changing user state", user_id=str(user_id), new_state=state.name)
     try:
         user = await user_service.change_user_state(user_id, state)
-        auth_logger.info("User state changed", user_id=str(user.user_id), new_state=user.state.name)
+        logger.info("User state changed", user_id=str(user.user_id), new_state=UserState(user.state).name)
         return create_response(
             data=UserResponse(
                 user_id=str(user.user_id),
@@ -182,13 +140,14 @@ async def change_user_state(
                 social_accounts=user.social_accounts
             ),
             message="User state changed",
-            status_code=200
+            status_code=200,
+            skip_validation=True
         )
     except HTTPException as e:
-        auth_logger.error("Failed to change user state", error=str(e))
+        logger.error("Failed to change user state", error=str(e))
         raise e
     except Exception as e:
-        auth_logger.error("Unexpected error during changing user state", error=str(e))
+        logger.error("Unexpected error during changing user state", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
     
 
@@ -196,7 +155,8 @@ async def change_user_state(
 async def remove_social_account(
     user_id: UUID,
     provider: str,
-    user_service: UserService = Depends(get_user_service)
+    user_service: UserService = Depends(get_user_service),
+    logger: LoggerPort = Depends(get_auth_logger)
 ):
     """사용자의 소셜 계정을 제거합니다."""
     try:
@@ -207,11 +167,11 @@ async def remove_social_account(
             email=user.email,
             user_type=str(user.user_type),
             social_accounts=user.social_accounts
-        ))
+        ), skip_validation=True)
     except HTTPException as e:
-        auth_logger.error(f"Error removing social account: {e.detail}")
+        logger.error("Error removing social account", user_id=str(user_id), provider=provider, error=e.detail)
         return create_error_response(e.detail, e.status_code)
     except Exception as e:
-        auth_logger.error(f"Unexpected error removing social account: {e}")
+        logger.error("Unexpected error removing social account", user_id=str(user_id), provider=provider, error=str(e))
         return create_error_response(str(e), 500)
     
\ No newline at end of file
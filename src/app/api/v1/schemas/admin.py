@@ -0,0 +1,13 @@
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class RevokeUserTokensRequest(BaseModel):
+    user_ids: List[UUID] = Field(min_length=1, max_length=10000)
+
+
+class RevokeUserTokensResponse(BaseModel):
+    users: int
+    revoked_tokens: int
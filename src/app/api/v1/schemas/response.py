@@ -1,20 +1,69 @@
 from datetime import datetime, timezone
-from typing import Optional, Any, TypeVar
+from functools import lru_cache
+from typing import Optional, Any, Tuple, TypeVar, Union
+import orjson
+from fastapi import Response as HttpResponse
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
 from src.app.api.v1.schemas.common import Response, ErrorResponse, PaginationResponse
 
 T = TypeVar('T')
 
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 기본 응답 클래스 (stdlib json 대비 수 배 빠름)"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=None)
+def _envelope(data_type: type) -> Tuple[type, TypeAdapter]:
+    """data 타입별 Response[T] 모델과 TypeAdapter를 한 번만 생성하여 재사용"""
+    model = Response[data_type]
+    return model, TypeAdapter(model)
+
+
 def create_response(
     data: Optional[T] = None,
     message: str = "Success",
+    status_code: int = 200,
+    skip_validation: bool = False
+) -> Union[Response[T], HttpResponse]:
+    """
+    data를 Response 봉투에 담아 반환합니다.
+    skip_validation=True: 핸들러가 이미 검증된 모델을 넘기는 경우 봉투를 검증 없이 구성하고
+    pydantic-core로 바로 JSON bytes를 만들어 반환합니다 (response_model 재검증/재직렬화 생략).
+    """
+    model, adapter = _envelope(Any if data is None else type(data))
+    fields = {
+        "timestamp": datetime.now(timezone.utc),
+        "status_code": status_code,
+        "message": message,
+        "data": data,
+    }
+    if skip_validation:
+        return HttpResponse(
+            content=adapter.dump_json(model.model_construct(**fields)),
+            status_code=status_code,
+            media_type="application/json"
+        )
+    return adapter.validate_python(fields)
+
+def create_raw_response(
+    data_json: bytes,
+    message: str = "Success",
     status_code: int = 200
-) -> Response[T]:
-    return Response(
-        timestamp=datetime.now(timezone.utc),
-        status_code=status_code,
-        message=message,
-        data=data
+) -> HttpResponse:
+    """이미 직렬화된 data(JSON bytes)를 Response 봉투에 담아 재검증 없이 반환합니다."""
+    timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    body = (
+        b'{"timestamp":"' + timestamp.encode() + b'",'
+        b'"status_code":' + str(status_code).encode() + b','
+        b'"message":' + orjson.dumps(message) + b','
+        b'"data":' + data_json + b'}'
     )
+    return HttpResponse(content=body, status_code=status_code, media_type="application/json")
 
 def create_error_response(
     message: str,
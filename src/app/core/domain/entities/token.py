@@ -13,6 +13,8 @@ class TokenEntity:
     is_revoked: bool = False
     created_at: datetime = datetime.now(timezone.utc)
     revoked_at: Optional[datetime] = None
+    # 같은 로그인에서 rotate로 이어진 토큰들의 묶음 (재사용 감지 시 통째로 폐기)
+    family_id: Optional[UUID] = None
 
     def revoke(self) -> None:
         """토큰을 폐기 상태로 만듭니다."""
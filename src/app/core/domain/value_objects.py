@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
-class UserState(Enum):
+# 쿼리 파라미터("2")로 받을 수 있도록 IntEnum (DB/엔티티에는 정수 값으로 저장)
+class UserState(IntEnum):
     DISABLED = 0
     ACTIVE = 1
     HIDDEN = 2
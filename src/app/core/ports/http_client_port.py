@@ -0,0 +1,40 @@
+# app/core/ports/http_client_port.py
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    status_code: int
+    content: bytes
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    def json(self) -> Any:
+        """응답 본문을 JSON으로 파싱합니다."""
+        return json.loads(self.content)
+
+
+class HttpClientPort(ABC):
+    @abstractmethod
+    async def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> HttpResponse:
+        """GET 요청 후 응답 반환 (timeout은 호출 단위로 지정 가능)"""
+        pass
+
+    @abstractmethod
+    async def post(
+        self,
+        url: str,
+        data: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> HttpResponse:
+        """form 데이터로 POST 요청 후 응답 반환"""
+        pass
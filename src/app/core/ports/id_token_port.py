@@ -0,0 +1,13 @@
+# app/core/ports/id_token_port.py
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class IdTokenVerifierPort(ABC):
+    @abstractmethod
+    async def verify(self, id_token: str) -> Dict[str, Any]:
+        """
+        OpenID Connect id_token의 서명/클레임을 검증하고 claims를 반환.
+        유효하지 않으면 InvalidTokenException 발생.
+        """
+        pass
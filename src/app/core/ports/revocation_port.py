@@ -0,0 +1,14 @@
+# app/core/ports/revocation_port.py
+from abc import ABC, abstractmethod
+from typing import Sequence
+from uuid import UUID
+
+
+class RevocationPublisherPort(ABC):
+    @abstractmethod
+    async def publish_user_revocation(self, user_ids: Sequence[UUID], revoked_at: float) -> None:
+        """
+        revoked_at(epoch seconds) 이전에 발급된 해당 사용자들의 토큰이 폐기되었음을 모든 워커에 알림.
+        전달 실패가 폐기 자체를 되돌리지는 않는다.
+        """
+        pass
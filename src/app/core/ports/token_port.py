@@ -1,9 +1,9 @@
 # app/core/ports/token_port.py
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 from datetime import datetime
-from app.core.domain.entities.token import TokenEntity
+from src.app.core.domain.entities.token import TokenEntity
 
 class TokenRepositoryPort(ABC):
     @abstractmethod
@@ -21,12 +21,42 @@ class TokenRepositoryPort(ABC):
         """refresh_token으로 TokenEntity 조회"""
         pass
 
+    @abstractmethod
+    async def rotate(
+        self,
+        refresh_token: str,
+        new_access_token: str,
+        new_refresh_token: str,
+        access_token_expires: datetime,
+        refresh_token_expires: datetime,
+    ) -> Optional[TokenEntity]:
+        """
+        유효한 refresh_token을 폐기하고 같은 family의 새 토큰 쌍을 원자적으로 발급.
+        refresh_token이 없거나 이미 폐기/만료된 경우 None
+        """
+        pass
+
+    @abstractmethod
+    async def revoke_token_family(self, family_id: UUID) -> None:
+        """같은 family의 토큰을 모두 무효화"""
+        pass
+
     @abstractmethod
     async def revoke_all_user_tokens(self, user_id: UUID) -> None:
         """특정 유저의 토큰을 모두 무효화"""
         pass
 
+    @abstractmethod
+    async def revoke_tokens_for_users(self, user_ids: Sequence[UUID]) -> int:
+        """여러 유저의 토큰을 한 번에 무효화하고 무효화된 토큰 수를 반환"""
+        pass
+
     @abstractmethod
     async def cleanup_expired_tokens(self, before_date: datetime) -> int:
         """만료된 토큰들 정리"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def delete_expired_tokens_batch(self, before_date: datetime, limit: int) -> int:
+        """만료된 토큰을 최대 limit 건만 삭제하고 삭제 건수를 반환"""
+        pass
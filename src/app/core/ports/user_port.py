@@ -30,6 +30,14 @@ class UserRepositoryPort(ABC):
     async def get_by_social_account(self, provider: str, social_id: str) -> Optional[UserEntity]:
         pass
 
+    @abstractmethod
+    async def find_or_create_by_social_account(self, user: UserEntity, provider: str, social_id: str) -> UserEntity:
+        """
+        email 기준으로 사용자를 원자적으로 조회/생성하고 소셜 계정을 연결.
+        이미 연결된 provider 정보는 덮어쓰지 않는다.
+        """
+        pass
+
     @abstractmethod
     async def list_by_state(self, state: UserState) -> List[UserEntity]:
         pass
\ No newline at end of file
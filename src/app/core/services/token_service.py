@@ -1,22 +1,26 @@
 from datetime import datetime, timezone, timedelta
+from typing import Optional, Sequence
 from uuid import UUID, uuid4
 from src.common.exception import (
     InvalidTokenException,
     TokenExpiredException,
-    UnauthorizedException
+    TokenReuseDetectedException
 )
 from src.app.core.domain.entities.token import TokenEntity
 from src.app.core.ports.token_port import TokenRepositoryPort
-from icecream import ic
+from src.app.core.ports.revocation_port import RevocationPublisherPort
+from src.common.trace import trace
 
 class TokenService:
     def __init__(
         self, 
         token_repository: TokenRepositoryPort,
         access_token_expire_minutes: int = 30,
-        refresh_token_expire_days: int = 7
+        refresh_token_expire_days: int = 7,
+        revocation_publisher: Optional[RevocationPublisherPort] = None
     ):
         self.token_repository = token_repository
+        self.revocation_publisher = revocation_publisher
         self.access_token_expire_minutes = access_token_expire_minutes
         self.refresh_token_expire_days = refresh_token_expire_days
 
@@ -30,36 +34,52 @@ class TokenService:
             refresh_token=self._generate_token(),
             access_token_expires=now + timedelta(minutes=self.access_token_expire_minutes),
             refresh_token_expires=now + timedelta(days=self.refresh_token_expire_days),
-            created_at=now
+            created_at=now,
+            family_id=uuid4()
         )
         
         return await self.token_repository.create(token_entity)
 
     async def refresh_access_token(self, refresh_token: str) -> TokenEntity:
-        """리프레시 토큰을 사용하여 새로운 액세스 토큰을 발급합니다."""
+        """리프레시 토큰을 사용하여 새로운 토큰 쌍을 발급합니다 (기존 토큰은 폐기)."""
+        now = datetime.now(timezone.utc)
+        rotated = await self.token_repository.rotate(
+            refresh_token,
+            new_access_token=self._generate_token(),
+            new_refresh_token=self._generate_token(),
+            access_token_expires=now + timedelta(minutes=self.access_token_expire_minutes),
+            refresh_token_expires=now + timedelta(days=self.refresh_token_expire_days),
+        )
+        if rotated:
+            return rotated
+
+        # 실패한 경우에만 원인을 판별하기 위해 추가 조회
         stored_token = await self.token_repository.get_by_refresh_token(refresh_token)
 
-        ic(stored_token)
-        
+        trace("token.refresh.rejected", token=stored_token)
+
         if not stored_token:
             raise InvalidTokenException()
-            
+
         if stored_token.is_revoked:
-            raise UnauthorizedException()
-            
-        if stored_token.is_refresh_token_expired():
-            raise TokenExpiredException()
-            
-        # 기존 토큰 무효화
-        stored_token.revoke()
-        await self.token_repository.create(stored_token)
-        
-        # 새로운 토큰 생성
-        return await self.create_tokens(stored_token.user_id)
+            # 이미 교체된 토큰이 다시 사용됨 -> 탈취로 간주하고 같은 family 전체 폐기
+            if stored_token.family_id:
+                await self.token_repository.revoke_token_family(stored_token.family_id)
+            raise TokenReuseDetectedException()
+
+        raise TokenExpiredException()
 
     async def revoke_all_user_tokens(self, user_id: UUID) -> None:
         """사용자의 모든 토큰을 무효화합니다."""
-        await self.token_repository.revoke_all_user_tokens(user_id)
+        await self.revoke_tokens_for_users([user_id])
+
+    async def revoke_tokens_for_users(self, user_ids: Sequence[UUID]) -> int:
+        """여러 사용자의 토큰을 한 번에 무효화하고, 모든 워커에 폐기 사실을 전파합니다."""
+        revoked_at = datetime.now(timezone.utc).timestamp()
+        revoked = await self.token_repository.revoke_tokens_for_users(user_ids)
+        if self.revocation_publisher:
+            await self.revocation_publisher.publish_user_revocation(user_ids, revoked_at)
+        return revoked
 
     async def validate_access_token(self, access_token: str) -> TokenEntity:
         """액세스 토큰의 유효성을 검증합니다."""
@@ -5,7 +5,8 @@ from fastapi import HTTPException
 from src.app.core.domain.entities.user import UserEntity
 from src.app.core.domain.value_objects import UserState, UserType
 from src.app.core.ports.user_port import UserRepositoryPort
-from icecream import ic
+from src.common.exception import SocialAccountConflictException
+from src.common.trace import trace
 
 class UserService:
     def __init__(self, user_repository: UserRepositoryPort):
@@ -47,7 +48,7 @@ class UserService:
         # 기존 소셜 계정 확인
         existing_user = await self.user_repository.get_by_social_account(provider, provider_id)
 
-        ic("add_social_account", existing_user)
+        trace("user.add_social_account.existing", user=existing_user)
 
         if existing_user and existing_user.user_id != user_id:
             raise HTTPException(status_code=400, detail=f"This {provider} account is already linked to another user")
@@ -56,14 +57,41 @@ class UserService:
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        ic("add_social_account get_by_id", user)
+        trace("user.add_social_account.loaded", user=user)
 
         user.add_social_account(provider, provider_id)
 
-        ic("add_social_account user", user)
+        trace("user.add_social_account.linked", user=user)
 
-        return await self.user_repository.update(user)
+        try:
+            return await self.user_repository.update(user)
+        except SocialAccountConflictException as e:
+            raise HTTPException(status_code=400, detail=str(e))
     
+    async def find_or_create_by_social_account(self, name: str, email: str, provider: str, provider_id: str) -> UserEntity:
+        """소셜 로그인 사용자를 조회하거나 생성하고, 소셜 계정을 연결합니다. (단일 upsert)"""
+        # 소셜 계정이 다른 이메일의 사용자에게 이미 연결되어 있으면 거부
+        linked_user = await self.user_repository.get_by_social_account(provider, provider_id)
+        if linked_user and linked_user.email != email:
+            raise HTTPException(status_code=400, detail=f"This {provider} account is already linked to another user")
+
+        now = datetime.now(timezone.utc)
+        user = UserEntity(
+            user_id=uuid4(),
+            name=name,
+            email=email,
+            user_type=UserType.USER.value,
+            created_at=now,
+            updated_at=now,
+            last_login=now,
+            state=UserState.ACTIVE.value,
+            social_accounts={provider: provider_id}
+        )
+        try:
+            return await self.user_repository.find_or_create_by_social_account(user, provider, provider_id)
+        except SocialAccountConflictException as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
     async def has_social_account(self, user_id: UUID, provider: str) -> bool:
         """사용자가 특정 소셜 계정을 가지고 있는지 확인합니다."""
         user = await self.user_repository.get_by_id(user_id)
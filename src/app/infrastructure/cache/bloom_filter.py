@@ -0,0 +1,56 @@
+# src/app/infrastructure/cache/bloom_filter.py
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    프로세스 내 Bloom filter.
+    - capacity개를 넣었을 때 false positive 비율이 error_rate가 되도록 비트 수(m)와 해시 수(k)를 산정
+    - false negative는 없으므로 "없음" 판정은 그대로 신뢰하고, "있음"일 때만 원본 저장소로 확인
+    - 삭제는 지원하지 않으므로 만료된 항목은 새 필터로 재구성하여 정리
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    @staticmethod
+    def _hashes(item: str):
+        # blake2b 128bit digest를 두 개의 64bit 해시로 나누어 double hashing (h1 + i * h2)
+        digest = int.from_bytes(hashlib.blake2b(item.encode(), digest_size=16).digest(), "little")
+        return digest & 0xFFFFFFFFFFFFFFFF, (digest >> 64) | 1
+
+    def add(self, item: str) -> None:
+        h1, h2 = self._hashes(item)
+        bits, size = self._bits, self.size
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % size
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        h1, h2 = self._hashes(item)
+        bits, size = self._bits, self.size
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+    def estimated_false_positive_rate(self) -> float:
+        """현재 들어간 항목 수 기준 이론상 false positive 비율"""
+        return (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
@@ -0,0 +1,59 @@
+# src/app/infrastructure/cache/local_cache.py
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+_MISSING = object()
+
+
+class LocalTTLCache:
+    """
+    프로세스 내 LRU + TTL 캐시.
+    - maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - 항목별 만료 시각(epoch seconds) 지정 가능, 조회 시점에 만료 검사
+    단일 이벤트 루프에서 동기적으로만 접근하므로 별도 lock을 두지 않는다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            return default
+
+        expires_at, value = item
+        if expires_at <= time.time():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        expires_at: Optional[float] = None,
+    ) -> None:
+        if expires_at is None:
+            ttl = self.ttl if ttl is None else ttl
+            expires_at = float("inf") if ttl is None else time.time() + ttl
+
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,28 +1,108 @@
 # src/app/infrastructure/cache/redis_client.py
 
-from redis import Redis
-from src.settings.environment import RedisEnvironment
+from typing import Dict, List, Optional, Set
+
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import RedisError
+
+from src.common.logger import UVICORN_LOGGER
+from src.settings.environment import get_settings
+
+
+class RedisClient:
+    """
+    프로세스 단위로 공유되는 비동기 Redis 클라이언트.
+    크기가 제한된 BlockingConnectionPool 위에서 동작하며 lifespan에서 생성/종료한다.
+    커넥션이 모두 사용 중이면 즉시 실패하지 않고 redis_pool_timeout초까지 반납을 기다린다.
+    """
+    _pool: Optional[BlockingConnectionPool] = None
+    _client: Optional[Redis] = None
+
+    @classmethod
+    def get_client(cls) -> Redis:
+        if cls._client is None:
+            settings = get_settings().redis
+            cls._pool = BlockingConnectionPool(
+                host=settings.redis_host,
+                port=int(settings.redis_port),
+                password=settings.redis_password or None,
+                db=int(settings.redis_db),
+                max_connections=settings.redis_max_connections,
+                timeout=settings.redis_pool_timeout,
+                socket_timeout=settings.redis_socket_timeout,
+                socket_connect_timeout=settings.redis_socket_connect_timeout,
+                health_check_interval=settings.redis_health_check_interval,
+                decode_responses=True,
+            )
+            cls._client = Redis(connection_pool=cls._pool)
+        return cls._client
+
+    @classmethod
+    def startup(cls) -> Redis:
+        return cls.get_client()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        if cls._client is not None:
+            await cls._client.aclose()
+            await cls._pool.disconnect()
+            cls._client = None
+            cls._pool = None
+
+    @classmethod
+    async def healthcheck(cls) -> bool:
+        try:
+            return bool(await cls.get_client().ping())
+        except (RedisError, OSError) as e:
+            UVICORN_LOGGER.error(f"Redis healthcheck failed: {e!r}")
+            return False
 
-redis_client = Redis(
-    host=RedisEnvironment.REDIS_HOST,
-    port=RedisEnvironment.REDIS_PORT,
-    password=RedisEnvironment.REDIS_PASSWORD,
-    db=0,
-    decode_responses=True
-)
 
 class RedisCache:
-    def __init__(self, client: Redis = redis_client):
-        self.client = client
+    def __init__(self, client: Optional[Redis] = None):
+        self.client = client or RedisClient.get_client()
 
-    async def get(self, key: str) -> str:
+    async def get(self, key: str) -> Optional[str]:
         return await self.client.get(key)
 
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        if not keys:
+            return []
+        return await self.client.mget(keys)
+
     async def set(self, key: str, value: str, expire: int = None):
         await self.client.set(key, value, ex=expire)
 
-    async def delete(self, key: str):
-        await self.client.delete(key)
+    async def mset(self, mapping: Dict[str, str], expire: int = None):
+        """여러 키를 한 번의 왕복으로 저장합니다. expire가 있으면 pipeline으로 SET EX"""
+        if not mapping:
+            return
+        if expire is None:
+            await self.client.mset(mapping)
+            return
+        pipe = self.pipeline()
+        for key, value in mapping.items():
+            pipe.set(key, value, ex=expire)
+        await pipe.execute()
+
+    async def delete(self, *keys: str):
+        if keys:
+            await self.client.delete(*keys)
 
     async def exists(self, key: str) -> bool:
-        return await self.client.exists(key)
\ No newline at end of file
+        return bool(await self.client.exists(key))
+
+    async def smembers(self, key: str) -> Set[str]:
+        return await self.client.smembers(key)
+
+    def register_script(self, script: str):
+        """Lua 스크립트 등록. 호출 시 EVALSHA로 실행되어 원자적으로 처리됨"""
+        return self.client.register_script(script)
+
+    def pubsub(self):
+        """채널 구독용 PubSub (구독 동안 커넥션 하나를 점유)"""
+        return self.client.pubsub(ignore_subscribe_messages=True)
+
+    def pipeline(self, transaction: bool = False):
+        """여러 명령을 한 번의 왕복으로 전송하기 위한 pipeline"""
+        return self.client.pipeline(transaction=transaction)
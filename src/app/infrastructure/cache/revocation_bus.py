@@ -0,0 +1,167 @@
+# src/app/infrastructure/cache/revocation_bus.py
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from src.app.core.ports.revocation_port import RevocationPublisherPort
+from src.app.infrastructure.cache.redis_client import RedisCache
+from src.common.logger import UVICORN_LOGGER
+from src.settings.environment import get_settings
+
+
+class RevocationType(str, Enum):
+    USER = "user"
+
+
+@dataclass(frozen=True)
+class RevocationMessage:
+    type: RevocationType
+    user_ids: Tuple[str, ...]
+    revoked_at: float
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "type": self.type.value,
+            "user_ids": list(self.user_ids),
+            "revoked_at": self.revoked_at,
+        })
+
+    @classmethod
+    def from_json(cls, data: str) -> "RevocationMessage":
+        payload = json.loads(data)
+        return cls(
+            type=RevocationType(payload["type"]),
+            user_ids=tuple(payload["user_ids"]),
+            revoked_at=float(payload["revoked_at"]),
+        )
+
+
+RevocationHandler = Callable[[RevocationMessage], None]
+
+
+class RevocationBus(RevocationPublisherPort):
+    """
+    토큰 폐기를 모든 워커 프로세스에 전파하는 Redis pub/sub 버스.
+    - publish: 사용자별 폐기 시각을 token:revoked_before 해시에 기록하고 채널에 발행 (한 번의 pipeline)
+    - 구독: 기동 시 해시에서 보관 기간 내 폐기 시각을 읽어 적용한 뒤 채널 메시지를 handler로 전달
+    연결이 끊기면 재구독하며, 그 사이 누락분은 해시를 다시 읽어 보정한다.
+    """
+    CUTOFF_KEY = "token:revoked_before"
+    _instance: Optional["RevocationBus"] = None
+
+    def __init__(
+        self,
+        cache: Optional[RedisCache] = None,
+        channel: Optional[str] = None,
+        retention: Optional[int] = None,
+    ):
+        self._cache = cache
+        self.channel = channel or get_settings().token.token_revocation_channel
+        self.retention = int(retention or get_settings().token.token_revocation_retention)
+        self.handlers: List[RevocationHandler] = []
+        self.received = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def cache(self) -> RedisCache:
+        if self._cache is None:
+            self._cache = RedisCache()
+        return self._cache
+
+    @classmethod
+    def get_instance(cls) -> "RevocationBus":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def startup(cls, handlers: Sequence[RevocationHandler] = ()) -> None:
+        instance = cls.get_instance()
+        instance.handlers.extend(handlers)
+        if instance._task is None:
+            instance._task = asyncio.create_task(instance._listen())
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        instance = cls._instance
+        if instance is None or instance._task is None:
+            return
+        instance._task.cancel()
+        try:
+            await instance._task
+        except asyncio.CancelledError:
+            pass
+        cls._instance = None
+
+    async def publish_user_revocation(self, user_ids: Sequence[UUID], revoked_at: float) -> None:
+        if not user_ids:
+            return
+        message = RevocationMessage(
+            type=RevocationType.USER,
+            user_ids=tuple(str(user_id) for user_id in user_ids),
+            revoked_at=revoked_at,
+        )
+        try:
+            pipe = self.cache.pipeline()
+            pipe.hset(self.CUTOFF_KEY, mapping={user_id: revoked_at for user_id in message.user_ids})
+            pipe.publish(self.channel, message.to_json())
+            await pipe.execute()
+        except (RedisError, OSError) as e:
+            UVICORN_LOGGER.warning(f"Failed to broadcast revocation for {len(user_ids)} users: {e!r}")
+
+    async def load_cutoffs(self) -> None:
+        """보관 기간 내의 폐기 시각을 handler에 적용하고, 지난 항목은 해시에서 제거"""
+        cutoffs = await self.cache.client.hgetall(self.CUTOFF_KEY)
+        oldest = time.time() - self.retention
+        stale = [user_id for user_id, revoked_at in cutoffs.items() if float(revoked_at) < oldest]
+        if stale:
+            await self.cache.client.hdel(self.CUTOFF_KEY, *stale)
+
+        by_time = {}
+        for user_id, revoked_at in cutoffs.items():
+            if float(revoked_at) >= oldest:
+                by_time.setdefault(float(revoked_at), []).append(user_id)
+        for revoked_at, user_ids in by_time.items():
+            self._dispatch(RevocationMessage(RevocationType.USER, tuple(user_ids), revoked_at))
+
+    def _dispatch(self, message: RevocationMessage) -> None:
+        self.received += 1
+        for handler in self.handlers:
+            try:
+                handler(message)
+            except Exception as e:
+                UVICORN_LOGGER.error(f"Revocation handler failed: {e!r}")
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while True:
+            pubsub = self.cache.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                await self.load_cutoffs()
+                backoff = 1.0
+                async for raw in pubsub.listen():
+                    if raw.get("type") != "message":
+                        continue
+                    try:
+                        self._dispatch(RevocationMessage.from_json(raw["data"]))
+                    except (ValueError, KeyError) as e:
+                        UVICORN_LOGGER.warning(f"Ignoring malformed revocation message: {e!r}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                UVICORN_LOGGER.warning(f"Revocation subscriber disconnected, retrying in {backoff}s: {e!r}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
@@ -0,0 +1,92 @@
+# src/app/infrastructure/http/http_client.py
+import time
+from typing import Any, Mapping, Optional
+
+import httpx
+
+from src.app.core.ports.http_client_port import HttpClientPort, HttpResponse
+from src.app.infrastructure.monitoring import prometheus as metrics
+from src.common.exception import ExternalServiceException
+from src.common.logger import UVICORN_LOGGER
+from src.settings.environment import get_settings
+
+
+class AsyncHttpClient(HttpClientPort):
+    """
+    프로세스 단위로 공유되는 keep-alive 커넥션 풀 기반의 비동기 HTTP 클라이언트.
+    lifespan에서 startup/shutdown 하며, 요청마다 커넥션을 새로 맺지 않는다.
+    """
+    _client: Optional[httpx.AsyncClient] = None
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self._own_client = client
+
+    @classmethod
+    def startup(cls, transport: Optional[httpx.AsyncBaseTransport] = None) -> httpx.AsyncClient:
+        if cls._client is None:
+            settings = get_settings().http
+            cls._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    settings.http_timeout,
+                    connect=settings.http_connect_timeout,
+                ),
+                limits=httpx.Limits(
+                    max_connections=settings.http_max_connections,
+                    max_keepalive_connections=settings.http_max_keepalive_connections,
+                    keepalive_expiry=settings.http_keepalive_expiry,
+                ),
+                transport=transport,
+            )
+        return cls._client
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._own_client is not None:
+            return self._own_client
+        # lifespan 밖(스크립트 등)에서 사용되는 경우를 위해 지연 생성
+        return self.startup()
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> HttpResponse:
+        return await self._request("GET", url, params=params, headers=headers, timeout=timeout)
+
+    async def post(
+        self,
+        url: str,
+        data: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> HttpResponse:
+        return await self._request("POST", url, data=data, headers=headers, timeout=timeout)
+
+    async def _request(self, method: str, url: str, timeout: Optional[float] = None, **kwargs) -> HttpResponse:
+        request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, timeout=request_timeout, **kwargs)
+        except httpx.HTTPError as e:
+            metrics.observe_upstream(method, url, "error", time.perf_counter() - started)
+            UVICORN_LOGGER.error(f"Outbound {method} {url} failed: {e!r}")
+            raise ExternalServiceException(f"{method} {url} failed") from e
+        metrics.observe_upstream(method, url, str(response.status_code), time.perf_counter() - started)
+
+        return HttpResponse(
+            status_code=response.status_code,
+            content=response.content,
+            headers=dict(response.headers),
+        )
+
+
+def get_http_client() -> HttpClientPort:
+    return AsyncHttpClient()
@@ -1,12 +1,17 @@
 # src/app/infrastructure/logging/logger.py
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-import json
+from typing import Any, Dict, Mapping, Optional, Tuple
 
-from src.settings.environment import LoggingEnvironment
+import orjson
+
+from src.settings.environment import get_settings
 
 class JsonFormatter(logging.Formatter):
     def format(self, record):
@@ -18,32 +23,185 @@ class JsonFormatter(logging.Formatter):
             "pathname": record.pathname,
             "lineno": record.lineno,
         }
-        return json.dumps(log_record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            log_record["fields"] = fields
+        if record.exc_info:
+            log_record["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(log_record, default=str).decode()
 
-def setup_logger(name: str) -> logging.Logger:
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, LoggingEnvironment.LOG_LEVEL.value))
 
-    # 파일 핸들러 설정
-    log_dir = Path(LoggingEnvironment.LOG_DIR.value)
-    log_dir.mkdir(exist_ok=True)
-    file_handler = RotatingFileHandler(
-        filename=log_dir / f"{name}.log",
-        maxBytes=LoggingEnvironment.LOG_FILE_MAX_BYTES.value,
-        backupCount=LoggingEnvironment.LOG_FILE_BACKUP_COUNT.value
-    )
-    file_handler.setFormatter(JsonFormatter())
+class DroppingQueueHandler(QueueHandler):
+    """
+    이벤트 루프 스레드에서는 레코드를 큐에 넣기만 한다.
+    - 큐가 가득 차면(디스크/파이프가 느린 경우) 기다리지 않고 버린 뒤 개수만 센다
+    - JSON 포맷팅/예외 traceback 문자열화는 listener 스레드에서 수행
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 인자가 나중에 바뀌어도 호출 시점의 메시지가 남도록 message만 확정 (포맷팅은 하지 않음)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+
+class LogPipeline:
+    """
+    api/database/auth 로거가 공유하는 단일 비동기 로깅 백엔드.
+    - 로거에는 DroppingQueueHandler만 붙고, 실제 파일/표준출력 기록은 QueueListener 스레드가 담당
+    - 로거별 파일({LOG_DIR}/{name}.log)은 이름 필터가 걸린 RotatingFileHandler로 분리
+    - 첫 로거 생성 시 시작, lifespan 종료(또는 프로세스 종료) 시 남은 레코드를 비우고 정지
+    - 정지해도 인스턴스와 로거에 붙은 handler는 유지: 이후 레코드는 큐에 쌓였다가
+      다음 lifespan 기동(startup) 또는 프로세스 종료 시 기록된다
+    """
+    _instance: Optional["LogPipeline"] = None
+
+    def __init__(self, queue_size: Optional[int] = None):
+        self.queue: queue.Queue = queue.Queue(
+            maxsize=int(queue_size or get_settings().logging.log_queue_size)
+        )
+        self.handler = DroppingQueueHandler(self.queue)
+        formatter = JsonFormatter()
+
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        self._formatter = formatter
+        self._file_handlers: Dict[str, RotatingFileHandler] = {}
+        self.listener = QueueListener(self.queue, console_handler, respect_handler_level=True)
+        self._running = False
+        self._start()
+
+    @classmethod
+    def get_instance(cls) -> "LogPipeline":
+        if cls._instance is None:
+            cls._instance = cls()
+            atexit.register(cls.shutdown)
+        return cls._instance
+
+    @classmethod
+    def startup(cls) -> None:
+        """shutdown()으로 정지한 listener 스레드를 다시 시작 (lifespan 재진입)"""
+        cls.get_instance()._start()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        instance = cls._instance
+        if instance is None:
+            return
+        if not instance._running:
+            # lifespan 종료 후에 쌓인 레코드는 프로세스 종료 시 기록
+            if instance.queue.empty():
+                return
+            instance._start()
+        # 큐에 남은 레코드를 모두 기록한 뒤 스레드 종료 (파일은 다음 기록 시 다시 열림)
+        instance.listener.stop()
+        instance._running = False
+        for handler in instance.listener.handlers:
+            handler.close()
+        if instance.handler.dropped:
+            sys.stderr.write(f"log pipeline dropped {instance.handler.dropped} records under back-pressure\n")
+
+    def _start(self) -> None:
+        if not self._running:
+            self.listener.start()
+            self._running = True
+
+    def add_file(self, name: str) -> None:
+        if name in self._file_handlers:
+            return
+        settings = get_settings().logging
+        log_dir = Path(settings.log_dir)
+        log_dir.mkdir(exist_ok=True)
+        file_handler = RotatingFileHandler(
+            filename=log_dir / f"{name}.log",
+            maxBytes=settings.log_file_max_bytes,
+            backupCount=settings.log_file_backup_count
+        )
+        file_handler.setFormatter(self._formatter)
+        file_handler.addFilter(logging.Filter(name))
+        self._file_handlers[name] = file_handler
+        # listener 스레드가 순회하는 tuple을 통째로 교체 (순회 중 변경 없음)
+        self.listener.handlers = self.listener.handlers + (file_handler,)
 
-    # 콘솔 핸들러 설정
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(JsonFormatter())
+    def stats(self) -> dict:
+        return {
+            "queued": self.queue.qsize(),
+            "capacity": self.queue.maxsize,
+            "dropped": self.handler.dropped,
+        }
+
+
+class StructuredLogger:
+    """
+    LoggerPort 구현. 메시지와 함께 kwargs를 구조화 필드(JSON의 "fields")로 기록한다.
+    - 레벨이 꺼져 있으면 isEnabledFor(캐시됨) 확인 후 즉시 반환 (필드 병합/레코드 생성 없음)
+    - bind()는 문맥을 튜플로 쌓아두기만 하고, 실제 병합은 기록될 때 수행
+    """
+    __slots__ = ("_logger", "_context")
+
+    def __init__(self, logger: logging.Logger, context: Tuple[Mapping[str, Any], ...] = ()):
+        self._logger = logger
+        self._context = context
+
+    def bind(self, **context) -> "StructuredLogger":
+        return StructuredLogger(self._logger, self._context + (context,))
+
+    def _log(self, level: int, message: str, kwargs: Dict[str, Any]) -> None:
+        exc_info = kwargs.pop("exc_info", None)
+        fields: Dict[str, Any] = {}
+        for context in self._context:
+            fields.update(context)
+        fields.update(kwargs)
+        # stacklevel=3: 호출한 곳(debug/info/...를 부른 코드)의 pathname/lineno를 기록
+        self._logger.log(level, message, exc_info=exc_info, extra={"fields": fields}, stacklevel=3)
+
+    def debug(self, message: str, **kwargs) -> None:
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, message, kwargs)
+
+    def info(self, message: str, **kwargs) -> None:
+        if self._logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, message, kwargs)
+
+    def warning(self, message: str, **kwargs) -> None:
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, message, kwargs)
+
+    def error(self, message: str, **kwargs) -> None:
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, message, kwargs)
+
+    def critical(self, message: str, **kwargs) -> None:
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._log(logging.CRITICAL, message, kwargs)
+
+
+def setup_logger(name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, get_settings().logging.log_level))
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    pipeline = LogPipeline.get_instance()
+    pipeline.add_file(name)
+    if pipeline.handler not in logger.handlers:
+        logger.addHandler(pipeline.handler)
+    # root 로거로 전파되어 이벤트 루프 스레드에서 다시 기록되지 않도록 차단
+    logger.propagate = False
 
     return logger
 
 # 로거 인스턴스 생성
 api_logger = setup_logger("api")
 db_logger = setup_logger("database")
-auth_logger = setup_logger("auth")
\ No newline at end of file
+auth_logger = setup_logger("auth")
@@ -0,0 +1,184 @@
+# src/app/infrastructure/monitoring/prometheus.py
+"""
+Prometheus 메트릭.
+- ENABLE_METRICS=false이면 prometheus_client를 import하지 않고 모든 메트릭이 no-op
+- PROMETHEUS_MULTIPROC_DIR을 지정하면 multiprocess 모드: 워커마다 mmap 파일에 기록하고
+  /metrics가 디렉터리의 모든 워커 값을 합산한다. 배포 시 워커 기동 전에 비어 있는 디렉터리여야 함
+- 요청 경로의 라벨 조합(child)은 처음 한 번만 만들고 dict에 보관하여 labels() 비용을 생략
+"""
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.settings.environment import get_settings
+
+_settings = get_settings().monitoring
+METRICS_ENABLED: bool = _settings.enable_metrics
+MULTIPROC_DIR: Optional[str] = (_settings.prometheus_multiproc_dir or None) if METRICS_ENABLED else None
+
+if MULTIPROC_DIR:
+    # prometheus_client는 import 시점에 이 환경변수로 값 저장 방식(mmap)을 결정
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", MULTIPROC_DIR)
+
+if METRICS_ENABLED:
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+else:
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# 요청/DB/외부 호출 지연 구간 (초)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# 요청당 SQL 문장 수 구간
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class _NoopMetric:
+    """메트릭 비활성화 시 사용하는 대체 객체. 호출부는 활성화 여부를 확인하지 않는다."""
+
+    def labels(self, *args, **kwargs) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def dec(self, amount: float = 1) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+    def observe(self, value: float) -> None:
+        pass
+
+
+_NOOP = _NoopMetric()
+
+
+def _counter(name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+    return Counter(name, documentation, labelnames) if METRICS_ENABLED else _NOOP
+
+
+def _histogram(name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+    return Histogram(name, documentation, labelnames, buckets=buckets) if METRICS_ENABLED else _NOOP
+
+
+def _gauge(name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+    # livesum: 살아 있는 워커의 값만 합산 (종료된 워커는 mark_process_dead로 제외)
+    return Gauge(name, documentation, labelnames, multiprocess_mode="livesum") if METRICS_ENABLED else _NOOP
+
+
+# -- HTTP --
+HTTP_REQUESTS = _counter("http_requests_total", "HTTP requests by route template and status", ("method", "route", "status"))
+HTTP_REQUEST_DURATION = _histogram("http_request_duration_seconds", "HTTP request latency by route template", ("method", "route"))
+HTTP_REQUESTS_IN_PROGRESS = _gauge("http_requests_in_progress", "HTTP requests currently being served", ("method",))
+
+# -- DB --
+DB_POOL_CHECKOUT_WAIT = _histogram("db_pool_checkout_wait_seconds", "Time to acquire a connection from the pool")
+DB_POOL_CHECKOUT_TIMEOUTS = _counter("db_pool_checkout_timeouts_total", "Pool checkouts that timed out")
+DB_POOL_CHECKED_OUT = _gauge("db_pool_checked_out", "Connections currently checked out of the pool")
+DB_SESSION_DURATION = _histogram("db_session_duration_seconds", "Session lifetime from open to close", ("outcome",))
+DB_STATEMENTS_PER_REQUEST = _histogram(
+    "db_statements_per_request", "SQL statements executed per HTTP request", ("method", "route"), buckets=STATEMENT_BUCKETS
+)
+DB_TIME_PER_REQUEST = _histogram("db_request_time_seconds", "Total SQL execution time per HTTP request", ("method", "route"))
+DB_REPEATED_STATEMENT_REQUESTS = _counter(
+    "db_repeated_statement_requests_total", "Requests that repeated one statement shape past the threshold", ("method", "route")
+)
+
+# -- 캐시: hit ratio = sum(rate(cache_requests_total{result!="miss"})) / sum(rate(cache_requests_total)) --
+CACHE_REQUESTS = _counter("cache_requests_total", "Cache lookups by cache and result", ("cache", "result"))
+USER_CACHE_LOCAL_HIT = CACHE_REQUESTS.labels("user", "local_hit")
+USER_CACHE_REDIS_HIT = CACHE_REQUESTS.labels("user", "redis_hit")
+USER_CACHE_MISS = CACHE_REQUESTS.labels("user", "miss")
+JWT_CACHE_HIT = CACHE_REQUESTS.labels("jwt_verify", "hit")
+JWT_CACHE_MISS = CACHE_REQUESTS.labels("jwt_verify", "miss")
+
+# -- JWT --
+JWT_VERIFICATIONS = _counter("jwt_verifications_total", "Service JWT verifications by result", ("result",))
+JWT_VERIFY_VALID = JWT_VERIFICATIONS.labels("valid")
+JWT_VERIFY_EXPIRED = JWT_VERIFICATIONS.labels("expired")
+JWT_VERIFY_INVALID = JWT_VERIFICATIONS.labels("invalid")
+JWT_VERIFY_REVOKED = JWT_VERIFICATIONS.labels("revoked")
+JWT_ISSUED = _counter("jwt_issued_total", "Service JWTs issued by signing algorithm", ("algorithm",))
+
+# -- OAuth upstream (Google token/userinfo/JWKS 호출) --
+UPSTREAM_REQUEST_DURATION = _histogram(
+    "upstream_request_duration_seconds", "Outbound HTTP latency by upstream host", ("host", "method", "outcome")
+)
+
+
+def observe_upstream(method: str, url: str, outcome: str, elapsed: float) -> None:
+    UPSTREAM_REQUEST_DURATION.labels(urlsplit(url).hostname or "", method, outcome).observe(elapsed)
+
+
+class PrometheusMiddleware:
+    """
+    요청 지연/건수/처리 중 요청 수를 기록하는 pure ASGI middleware.
+    BaseHTTPMiddleware와 달리 요청/응답을 감싸는 task를 만들지 않는다.
+    route 라벨은 경로가 아닌 route 템플릿(/api/v1/users/{user_id})이며, 매칭되지 않은 요청은
+    하나의 라벨로 모아 404 스캔이 시계열을 늘리지 못하게 한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._in_progress: Dict[str, Any] = {}
+        self._durations: Dict[Tuple[str, str], Any] = {}
+        self._requests: Dict[Tuple[str, str, int], Any] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_progress = self._in_progress.get(method)
+        if in_progress is None:
+            in_progress = self._in_progress[method] = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            # router가 매칭 시 scope에 남긴 route (같은 scope dict를 공유)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            self._child(self._durations, (method, path), HTTP_REQUEST_DURATION).observe(elapsed)
+            self._child(self._requests, (method, path, status), HTTP_REQUESTS).inc()
+
+    @staticmethod
+    def _child(children: dict, key: tuple, metric):
+        child = children.get(key)
+        if child is None:
+            child = children[key] = metric.labels(*key)
+        return child
+
+
+def render_metrics() -> bytes:
+    """노출 형식 본문. multiprocess 모드이면 디렉터리의 모든 워커 값을 합산"""
+    if not METRICS_ENABLED:
+        return b""
+    if MULTIPROC_DIR:
+        from prometheus_client import multiprocess
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def shutdown() -> None:
+    """워커 종료 시 livesum gauge 파일을 정리하여 합산에서 제외"""
+    if MULTIPROC_DIR:
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(os.getpid())
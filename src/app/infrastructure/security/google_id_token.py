@@ -0,0 +1,197 @@
+# src/app/infrastructure/security/google_id_token.py
+import asyncio
+import re
+import time
+from typing import Any, Dict, Mapping, Optional
+
+import jwt
+
+from src.app.core.ports.http_client_port import HttpClientPort
+from src.app.core.ports.id_token_port import IdTokenVerifierPort
+from src.app.infrastructure.http.http_client import AsyncHttpClient
+from src.common.exception import ExternalServiceException, InvalidTokenException
+from src.common.logger import UVICORN_LOGGER
+from src.settings.environment import get_settings
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def parse_max_age(headers: Mapping[str, str]) -> Optional[int]:
+    """Cache-Control max-age에서 Age를 뺀 남은 유효 시간(초)을 반환합니다."""
+    cache_control = headers.get("cache-control") or headers.get("Cache-Control") or ""
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    if not match:
+        return None
+    age = headers.get("age") or headers.get("Age") or 0
+    try:
+        return max(int(match.group(1)) - int(age), 0)
+    except ValueError:
+        return int(match.group(1))
+
+
+class JwksCache:
+    """
+    JWKS 공개키를 프로세스 메모리에 캐시한다.
+    - 만료 시간은 응답의 Cache-Control max-age를 따른다
+    - 만료 전에 백그라운드 태스크가 미리 갱신한다
+    - 모르는 kid가 들어오면(키 로테이션) 최소 간격을 지키며 즉시 갱신한다
+    """
+
+    def __init__(
+        self,
+        http_client: Optional[HttpClientPort],
+        jwks_url: Optional[str],
+        default_ttl: int = 3600,
+        min_refresh_interval: int = 30,
+        refresh_margin: int = 60,
+    ):
+        self.http_client = http_client
+        self.jwks_url = jwks_url
+        self.default_ttl = default_ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.refresh_margin = refresh_margin
+
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        self._expires_at: float = 0.0
+        self._last_fetch: float = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_jwks(cls, jwks: Mapping[str, Any]) -> "JwksCache":
+        """고정된 키셋으로 캐시를 만듭니다. (네트워크 없이 테스트/로컬 검증용)"""
+        cache = cls(http_client=None, jwks_url=None)
+        cache._load(jwks, ttl=None)
+        return cache
+
+    @property
+    def is_expired(self) -> bool:
+        return time.monotonic() >= self._expires_at
+
+    def is_due(self, margin: float = 0.0) -> bool:
+        """만료 margin초 전부터 갱신 대상"""
+        return time.monotonic() >= self._expires_at - margin
+
+    async def get_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        if self.jwks_url is not None and (self.is_expired or kid not in self._keys):
+            await self.refresh(force=kid not in self._keys)
+
+        key = self._keys.get(kid) if kid else None
+        if key is None:
+            raise InvalidTokenException(f"Unknown signing key: {kid}")
+        return key
+
+    async def refresh(self, force: bool = False, margin: float = 0.0) -> None:
+        """
+        만료(margin초 전 포함)되었거나 force일 때 JWKS를 다시 받는다.
+        백그라운드 갱신은 margin=refresh_margin으로 호출하여 만료 전에 미리 받아 둔다.
+        """
+        async with self._lock:
+            now = time.monotonic()
+            # 대기 중에 다른 코루틴이 이미 갱신했거나, 너무 잦은 강제 갱신은 건너뜀
+            if not self.is_due(margin) and (not force or now - self._last_fetch < self.min_refresh_interval):
+                return
+
+            response = await self.http_client.get(self.jwks_url)
+            if response.status_code != 200:
+                raise ExternalServiceException(f"JWKS fetch failed with status {response.status_code}")
+
+            max_age = parse_max_age(response.headers)
+            self._load(response.json(), ttl=self.default_ttl if max_age is None else max_age)
+
+    def _load(self, jwks: Mapping[str, Any], ttl: Optional[int]) -> None:
+        keys = {}
+        for jwk in jwks.get("keys", []):
+            try:
+                key = jwt.PyJWK(jwk)
+            except jwt.PyJWKError as e:
+                UVICORN_LOGGER.warning(f"Skipping unusable JWK {jwk.get('kid')}: {e}")
+                continue
+            if key.key_id:
+                keys[key.key_id] = key
+
+        now = time.monotonic()
+        self._keys = keys
+        self._last_fetch = now
+        self._expires_at = float("inf") if ttl is None else now + ttl
+
+    def start(self) -> None:
+        if self.jwks_url is not None and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh(margin=self.refresh_margin)
+                delay = self._expires_at - time.monotonic() - self.refresh_margin
+            except Exception as e:
+                UVICORN_LOGGER.error(f"JWKS background refresh failed: {e!r}")
+                delay = self.min_refresh_interval
+            await asyncio.sleep(max(delay, self.min_refresh_interval))
+
+
+class GoogleIdTokenVerifier(IdTokenVerifierPort):
+    ALGORITHMS = ["RS256"]
+    ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+    _jwks: Optional[JwksCache] = None
+
+    def __init__(self, jwks: Optional[JwksCache] = None, client_id: Optional[str] = None, leeway: int = 30):
+        self.jwks = jwks or self.get_jwks()
+        self.client_id = client_id or get_settings().google.google_client_id
+        self.leeway = leeway
+
+    @classmethod
+    def get_jwks(cls) -> JwksCache:
+        if cls._jwks is None:
+            cls._jwks = JwksCache(
+                http_client=AsyncHttpClient(),
+                jwks_url=get_settings().google.google_jwks_url,
+                default_ttl=get_settings().google.google_jwks_default_ttl,
+            )
+        return cls._jwks
+
+    @classmethod
+    def startup(cls) -> None:
+        cls.get_jwks().start()
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        if cls._jwks is not None:
+            await cls._jwks.stop()
+            cls._jwks = None
+
+    async def verify(self, id_token: str) -> Dict[str, Any]:
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except jwt.InvalidTokenError as e:
+            raise InvalidTokenException("Malformed id_token") from e
+
+        key = await self.jwks.get_key(header.get("kid"))
+        try:
+            return jwt.decode(
+                id_token,
+                key.key,
+                algorithms=self.ALGORITHMS,
+                audience=self.client_id,
+                issuer=self.ISSUERS,
+                leeway=self.leeway,
+                options={"require": ["exp", "iat", "sub"]},
+            )
+        except jwt.InvalidTokenError as e:
+            raise InvalidTokenException(f"Invalid id_token: {e}") from e
+
+
+def get_id_token_verifier() -> IdTokenVerifierPort:
+    return GoogleIdTokenVerifier()
@@ -0,0 +1,8 @@
+# src/app/infrastructure/security/hashing.py
+
+import hashlib
+
+
+def hash_token(token: str) -> bytes:
+    """토큰 원문을 고정 길이(32 bytes) SHA-256 digest로 변환합니다."""
+    return hashlib.sha256(token.encode()).digest()
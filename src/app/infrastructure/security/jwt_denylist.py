@@ -0,0 +1,178 @@
+# src/app/infrastructure/security/jwt_denylist.py
+
+import asyncio
+import time
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from src.app.infrastructure.cache.bloom_filter import BloomFilter
+from src.app.infrastructure.cache.redis_client import RedisCache
+from src.common.logger import UVICORN_LOGGER
+from src.settings.environment import get_settings
+
+
+class JwtDenylist:
+    """
+    폐기된 JWT(jti) 목록.
+    - 원본: token:jti:{jti} 키 (TTL = 토큰 남은 수명) + 폐기 순서를 기록하는 stream(token:jti:log)
+    - 워커별 Bloom filter를 앞에 두어 "폐기되지 않음"(대부분의 요청)은 네트워크 왕복 없이 판정
+    - Bloom filter가 "있을 수 있음"이라고 할 때만 Redis EXISTS로 확인 (false positive 걸러냄)
+    - stream의 마지막으로 읽은 ID 이후만 주기적으로 가져와 증분 갱신하고,
+      삭제가 불가능한 Bloom filter 특성상 주기적으로 보관 기간 내 항목으로 재구성
+    - 첫 재구성이 성공하기 전(기동 직후, 초기 Redis 로드 실패)에는 Bloom filter가 비어 있으므로
+      모든 jti를 Redis EXISTS로 확인 (Redis도 실패하면 폐기된 것으로 간주)
+    """
+    KEY = "token:jti:{}"
+    LOG_KEY = "token:jti:log"
+    PAGE_SIZE = 10000
+    _instance: Optional["JwtDenylist"] = None
+
+    def __init__(
+        self,
+        cache: Optional[RedisCache] = None,
+        capacity: Optional[int] = None,
+        error_rate: Optional[float] = None,
+        refresh_interval: Optional[float] = None,
+        rebuild_interval: Optional[float] = None,
+        retention: Optional[int] = None,
+    ):
+        self._cache = cache
+        settings = get_settings().token
+        self.capacity = int(capacity or settings.jwt_denylist_capacity)
+        self.error_rate = float(error_rate or settings.jwt_denylist_error_rate)
+        self.refresh_interval = float(refresh_interval or settings.jwt_denylist_refresh_interval)
+        self.rebuild_interval = float(rebuild_interval or settings.jwt_denylist_rebuild_interval)
+        self.retention = int(retention or settings.token_revocation_retention)
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        self._last_id = "0-0"
+        self._last_rebuild = 0.0
+        # 재구성이 한 번이라도 성공해야 Bloom filter의 "없음"을 믿을 수 있음
+        self._ready = False
+        self._task: Optional[asyncio.Task] = None
+        self.negatives = 0
+        self.positives = 0
+        self.false_positives = 0
+        self.errors = 0
+
+    @property
+    def cache(self) -> RedisCache:
+        if self._cache is None:
+            self._cache = RedisCache()
+        return self._cache
+
+    @classmethod
+    def get_instance(cls) -> "JwtDenylist":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def startup(cls) -> None:
+        instance = cls.get_instance()
+        if instance._task is None:
+            instance._task = asyncio.create_task(instance._run())
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        instance = cls._instance
+        if instance is None or instance._task is None:
+            return
+        instance._task.cancel()
+        try:
+            await instance._task
+        except asyncio.CancelledError:
+            pass
+        cls._instance = None
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """jti를 토큰 만료 시각까지 폐기 목록에 올림"""
+        now = time.time()
+        ttl = int(expires_at - now) + 1
+        if ttl <= 0:
+            return
+        self._bloom.add(jti)
+        pipe = self.cache.pipeline()
+        pipe.set(self.KEY.format(jti), 1, ex=ttl)
+        pipe.xadd(self.LOG_KEY, {"jti": jti})
+        _, entry_id = await pipe.execute()
+        # 보관 기간이 지난 기록은 stream에서 제거. ID는 Redis 서버 시각(ms)이므로
+        # 이 호스트의 시계가 아니라 방금 추가한 항목의 ID를 기준으로 계산
+        entry_ms = int(str(entry_id).split("-", 1)[0])
+        await self.cache.client.xtrim(self.LOG_KEY, minid=f"{entry_ms - self.retention * 1000}-0", approximate=True)
+
+    async def is_revoked(self, jti: Optional[str]) -> bool:
+        if not jti:
+            return False
+        if self._ready:
+            if jti not in self._bloom:
+                self.negatives += 1
+                return False
+            self.positives += 1
+        try:
+            revoked = await self.cache.exists(self.KEY.format(jti))
+        except (RedisError, OSError) as e:
+            # 확인할 수 없으면 폐기된 것으로 간주 (fail closed)
+            self.errors += 1
+            UVICORN_LOGGER.warning(f"JWT denylist lookup failed, treating token as revoked: {e!r}")
+            return True
+        if not revoked and self._ready:
+            self.false_positives += 1
+        return revoked
+
+    async def refresh(self) -> int:
+        """마지막으로 읽은 stream ID 이후 폐기된 jti만 Bloom filter에 추가"""
+        if (
+            time.time() - self._last_rebuild >= self.rebuild_interval
+            or self._bloom.count > self._bloom.capacity
+        ):
+            return await self.rebuild()
+        added, self._last_id = await self._read_log(self._bloom, self._last_id)
+        return added
+
+    async def rebuild(self) -> int:
+        """보관 기간 내 폐기 기록으로 Bloom filter를 새로 구성 (만료된 jti 정리)"""
+        started = time.time()
+        length = await self.cache.client.xlen(self.LOG_KEY)
+        bloom = BloomFilter(max(self.capacity, length * 2), self.error_rate)
+        added, last_id = await self._read_log(bloom, "0-0")
+        self._bloom, self._last_id, self._last_rebuild = bloom, last_id, started
+        self._ready = True
+        return added
+
+    async def _read_log(self, bloom: BloomFilter, last_id: str):
+        added = 0
+        while True:
+            entries = await self.cache.client.xrange(
+                self.LOG_KEY, min=f"({last_id}", max="+", count=self.PAGE_SIZE
+            )
+            for entry_id, fields in entries:
+                bloom.add(fields["jti"])
+                last_id = entry_id
+            added += len(entries)
+            if len(entries) < self.PAGE_SIZE:
+                return added, last_id
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                UVICORN_LOGGER.warning(f"JWT denylist refresh failed: {e!r}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def stats(self) -> dict:
+        return {
+            "entries": self._bloom.count,
+            "capacity": self._bloom.capacity,
+            "bloom_bytes": self._bloom.nbytes,
+            "estimated_fp_rate": self._bloom.estimated_false_positive_rate(),
+            "negatives": self.negatives,
+            "positives": self.positives,
+            "false_positives": self.false_positives,
+            "errors": self.errors,
+            "ready": self._ready,
+        }
@@ -0,0 +1,205 @@
+# src/app/infrastructure/security/key_ring.py
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+from src.app.infrastructure.monitoring import prometheus as metrics
+from src.settings.environment import get_settings
+
+SUPPORTED_ALGORITHMS = ("RS256", "EdDSA")
+
+
+class KeyStatus:
+    NEXT = "next"        # JWKS에 공개만 된 상태 (소비자가 미리 캐시하도록), 서명에는 사용하지 않음
+    ACTIVE = "active"    # 서명/검증에 사용. 가장 최근에 활성화된 키가 서명 키
+    RETIRED = "retired"  # JWKS/검증에서 제외
+
+
+@dataclass
+class SigningKey:
+    kid: str
+    algorithm: str
+    private_key: Any
+    status: str
+    created_at: str
+    activated_at: Optional[str] = None
+
+    @property
+    def public_key(self):
+        return self.private_key.public_key()
+
+    def public_jwk(self) -> Dict[str, Any]:
+        converter = RSAAlgorithm if self.algorithm == "RS256" else OKPAlgorithm
+        jwk = converter.to_jwk(self.public_key, as_dict=True)
+        jwk.update({"kid": self.kid, "alg": self.algorithm, "use": "sig"})
+        return jwk
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kid": self.kid,
+            "algorithm": self.algorithm,
+            "status": self.status,
+            "created_at": self.created_at,
+            "activated_at": self.activated_at,
+            "private_key": self.private_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            ).decode(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SigningKey":
+        return cls(
+            kid=data["kid"],
+            algorithm=data["algorithm"],
+            private_key=serialization.load_pem_private_key(data["private_key"].encode(), password=None),
+            status=data["status"],
+            created_at=data["created_at"],
+            activated_at=data.get("activated_at"),
+        )
+
+    @classmethod
+    def generate(cls, algorithm: str, status: str = KeyStatus.NEXT) -> "SigningKey":
+        if algorithm == "RS256":
+            private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        elif algorithm == "EdDSA":
+            private_key = ed25519.Ed25519PrivateKey.generate()
+        else:
+            raise ValueError(f"Unsupported algorithm: {algorithm} (supported: {SUPPORTED_ALGORITHMS})")
+        now = datetime.now(timezone.utc).isoformat()
+        return cls(
+            kid=uuid4().hex[:16],
+            algorithm=algorithm,
+            private_key=private_key,
+            status=status,
+            created_at=now,
+            activated_at=now if status == KeyStatus.ACTIVE else None,
+        )
+
+
+class KeyRing:
+    """
+    JWT 서명 키 묶음 (kid로 식별).
+    - 파일(JSON, PEM 개인키 포함)에 저장하며 여러 워커가 같은 파일을 읽는다
+    - 파일이 바뀌면(mtime) 다음 서명/알 수 없는 kid 조회 시 다시 읽어 회전을 반영
+    - 키 순환: generate(next, JWKS에 선공개) -> rotate(next를 active로, 새 next 생성) -> retire
+      소비자의 JWKS 캐시(max-age)보다 먼저 next 키가 공개되어 있어야 검증 실패가 없다
+    - 키 파일이 없으면 기존 HS256 공유 비밀키로 서명 (마이그레이션 기간 호환)
+    """
+    _instance: Optional["KeyRing"] = None
+
+    def __init__(self, path: Optional[str] = None, check_interval: float = 1.0):
+        self.path = Path(path or get_settings().secret.jwt_keyring_path)
+        self.keys: Dict[str, SigningKey] = {}
+        self._check_interval = check_interval
+        self._checked_at = 0.0
+        self._mtime: Optional[float] = None
+        self.reload()
+
+    @classmethod
+    def get_instance(cls) -> "KeyRing":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def reload(self) -> None:
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            self.keys, self._mtime = {}, None
+            return
+        data = json.loads(self.path.read_text())
+        self.keys = {item["kid"]: SigningKey.from_dict(item) for item in data.get("keys", [])}
+        self._mtime = mtime
+
+    def reload_if_changed(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self._check_interval:
+            return
+        self._checked_at = now
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+        if mtime != self._mtime:
+            self.reload()
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"keys": [key.to_dict() for key in self.keys.values()]}, indent=2))
+        os.chmod(tmp, 0o600)
+        # 다른 워커가 절반만 쓰인 파일을 읽지 않도록 rename으로 교체
+        os.replace(tmp, self.path)
+        self._mtime = self.path.stat().st_mtime
+
+    # -- 조회 --
+    def list(self) -> List[SigningKey]:
+        return sorted(self.keys.values(), key=lambda key: key.created_at)
+
+    @property
+    def signing_key(self) -> Optional[SigningKey]:
+        active = [key for key in self.keys.values() if key.status == KeyStatus.ACTIVE]
+        return max(active, key=lambda key: key.activated_at or key.created_at, default=None)
+
+    def get_verification_key(self, kid: str) -> Optional[SigningKey]:
+        key = self.keys.get(kid)
+        if key is None:
+            self.reload_if_changed()
+            key = self.keys.get(kid)
+        if key is None or key.status == KeyStatus.RETIRED:
+            return None
+        return key
+
+    def jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        return {"keys": [key.public_jwk() for key in self.list() if key.status != KeyStatus.RETIRED]}
+
+    # -- 서명 --
+    def encode(self, payload: Dict[str, Any]) -> str:
+        self.reload_if_changed()
+        key = self.signing_key
+        if key is None:
+            settings = get_settings().secret
+            metrics.JWT_ISSUED.labels(settings.algorithm).inc()
+            return jwt.encode(
+                payload, settings.secret_key, algorithm=settings.algorithm
+            )
+        metrics.JWT_ISSUED.labels(key.algorithm).inc()
+        return jwt.encode(payload, key.private_key, algorithm=key.algorithm, headers={"kid": key.kid})
+
+    # -- 순환 --
+    def generate(self, algorithm: str, activate: bool = False) -> SigningKey:
+        key = SigningKey.generate(algorithm, KeyStatus.ACTIVE if activate else KeyStatus.NEXT)
+        self.keys[key.kid] = key
+        return key
+
+    def rotate(self, algorithm: str) -> SigningKey:
+        """가장 오래된 next 키(없으면 새로 생성)를 서명 키로 활성화하고, 다음 순환용 next 키를 생성"""
+        pending = [key for key in self.list() if key.status == KeyStatus.NEXT]
+        key = pending[0] if pending else self.generate(algorithm)
+        key.status = KeyStatus.ACTIVE
+        key.activated_at = datetime.now(timezone.utc).isoformat()
+        if len(pending) <= 1:
+            self.generate(algorithm)
+        return key
+
+    def retire(self, kid: str) -> SigningKey:
+        key = self.keys.get(kid)
+        if key is None:
+            raise KeyError(kid)
+        if key is self.signing_key:
+            raise ValueError("Cannot retire the current signing key; rotate first")
+        key.status = KeyStatus.RETIRED
+        return key
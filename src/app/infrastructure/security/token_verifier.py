@@ -0,0 +1,138 @@
+# src/app/infrastructure/security/token_verifier.py
+
+import heapq
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import jwt
+
+from src.app.infrastructure.cache.local_cache import LocalTTLCache
+from src.app.infrastructure.security.hashing import hash_token
+from src.app.infrastructure.monitoring import prometheus as metrics
+from src.app.infrastructure.security.key_ring import KeyRing
+from src.common.exception import InvalidTokenException, TokenExpiredException
+from src.settings.environment import get_settings
+
+
+@dataclass(frozen=True)
+class VerifiedToken:
+    claims: Dict[str, Any]
+    body: bytes  # 응답에 그대로 실을 수 있도록 미리 직렬화한 본문
+
+
+class TokenVerifier:
+    """
+    서비스가 발급한 JWT를 검증한다.
+    - 키/알고리즘은 생성 시 한 번만 해석
+    - 검증에 성공한 토큰은 SHA-256 digest를 키로 LRU에 보관하고, exp 시각에 만료
+    - 응답 본문(render 결과)도 함께 캐시하여 hit 시 decode/직렬화를 모두 생략
+    - 사용자별 폐기 시각(cutoff, 초 단위) 이전에 발급(iat)된 토큰은 캐시 hit 여부와 관계없이 거부
+      cutoff는 LRU로 밀려나지 않으며 보관 기간(access 토큰 최대 수명)이 지나야 제거된다
+    - 헤더에 kid가 있으면 키 묶음에서 해당 공개키와 그 키의 알고리즘만으로 검증 (alg 혼동 방지)
+      kid가 없는 토큰은 JWT_ACCEPT_LEGACY_HS256일 때만 기존 공유 비밀키로 검증
+    """
+
+    def __init__(
+        self,
+        render: Callable[[Dict[str, Any]], bytes],
+        secret_key: Optional[str] = None,
+        algorithms: Optional[List[str]] = None,
+        cache_size: Optional[int] = None,
+        key_ring: Optional[KeyRing] = None,
+        accept_legacy: Optional[bool] = None,
+    ):
+        settings = get_settings()
+        self._render = render
+        self._key = secret_key or settings.secret.secret_key
+        self._algorithms = algorithms or [settings.secret.algorithm]
+        self._key_ring = key_ring or KeyRing.get_instance()
+        self._accept_legacy = (
+            settings.secret.jwt_accept_legacy_hs256 if accept_legacy is None else accept_legacy
+        )
+        self._cache = LocalTTLCache(
+            maxsize=cache_size or settings.secret.jwt_verify_cache_size
+        )
+        # user_id -> 폐기 시각(epoch seconds, 정수). 보관 기간 동안 폐기된 사용자 수만큼만 커짐
+        self._revocation_retention = settings.token.token_revocation_retention
+        self._revoked_before: Dict[str, int] = {}
+        # (보관 만료 시각, user_id) min-heap. 오래된 cutoff부터 꺼내 제거
+        self._revoked_expiry: List[Tuple[float, str]] = []
+        self.hits = 0
+        self.misses = 0
+        self.revoked = 0
+
+    def verify(self, token: str) -> VerifiedToken:
+        cache_key = hash_token(token)
+        verified = self._cache.get(cache_key)
+        if verified is not None:
+            self.hits += 1
+            metrics.JWT_CACHE_HIT.inc()
+            self._check_revocation(verified.claims)
+            metrics.JWT_VERIFY_VALID.inc()
+            return verified
+
+        self.misses += 1
+        metrics.JWT_CACHE_MISS.inc()
+        try:
+            claims = self._decode(token)
+        except jwt.ExpiredSignatureError as e:
+            metrics.JWT_VERIFY_EXPIRED.inc()
+            raise TokenExpiredException() from e
+        except jwt.InvalidTokenError as e:
+            metrics.JWT_VERIFY_INVALID.inc()
+            raise InvalidTokenException() from e
+
+        self._check_revocation(claims)
+        verified = VerifiedToken(claims=claims, body=self._render(claims))
+        # exp가 없는 토큰은 만료 시점을 알 수 없으므로 캐시하지 않음
+        if "exp" in claims:
+            self._cache.set(cache_key, verified, expires_at=float(claims["exp"]))
+        metrics.JWT_VERIFY_VALID.inc()
+        return verified
+
+    def _decode(self, token: str) -> Dict[str, Any]:
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None:
+            if not self._accept_legacy:
+                raise jwt.InvalidTokenError("Token without kid is not accepted")
+            return jwt.decode(token, self._key, algorithms=self._algorithms)
+
+        key = self._key_ring.get_verification_key(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown kid: {kid}")
+        return jwt.decode(token, key.public_key, algorithms=[key.algorithm])
+
+    def revoke_users(self, user_ids: Iterable[str], revoked_at: float) -> None:
+        # iat은 초 단위 정수이므로 cutoff도 초 단위로 내림.
+        # 폐기와 같은 초에 발급된 토큰(재로그인)은 거부하지 않음
+        cutoff = int(revoked_at)
+        expires_at = cutoff + self._revocation_retention
+        for user_id in user_ids:
+            user_id = str(user_id)
+            # 더 늦은 폐기 시각만 반영 (메시지 순서가 뒤바뀌어도 안전)
+            if cutoff > self._revoked_before.get(user_id, 0):
+                self._revoked_before[user_id] = cutoff
+                heapq.heappush(self._revoked_expiry, (expires_at, user_id))
+        self._prune_revocations()
+
+    def _prune_revocations(self, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        expiry = self._revoked_expiry
+        while expiry and expiry[0][0] <= now:
+            expires_at, user_id = heapq.heappop(expiry)
+            # 이후에 더 늦은 cutoff로 갱신된 사용자는 그 항목이 만료될 때 제거
+            cutoff = self._revoked_before.get(user_id)
+            if cutoff is not None and cutoff + self._revocation_retention <= expires_at:
+                del self._revoked_before[user_id]
+
+    def _check_revocation(self, claims: Dict[str, Any]) -> None:
+        revoked_at = self._revoked_before.get(str(claims.get("user_id")))
+        # iat이 없는 토큰은 발급 시점을 알 수 없으므로 폐기 대상으로 간주
+        if revoked_at is not None and int(claims.get("iat", 0)) < revoked_at:
+            self.revoked += 1
+            metrics.JWT_VERIFY_REVOKED.inc()
+            raise InvalidTokenException()
+
+    def clear(self) -> None:
+        self._cache.clear()
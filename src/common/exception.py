@@ -39,6 +39,10 @@ class InvalidTokenException(TokenException):
     """Token is invalid or malformed"""
 
 
+class TokenReuseDetectedException(TokenException):
+    """An already rotated refresh token was presented again"""
+
+
 class UnauthorizedException(AuthenticationException):
     """User is not authorized to perform this action"""
 
@@ -55,5 +59,17 @@ class AccountDeactivatedException(AuthenticationException):
     """Account has been deactivated"""
 
 
+class SocialAccountConflictException(BaseException):
+    """Social account is linked to another user, or the user already links another account of the provider"""
+
+
 class DatabaseConnectionError(BaseException):
     """Database Connection Error"""
+
+
+class ExternalServiceException(BaseException):
+    """External service call failed or timed out"""
+
+
+class SchemaVersionMismatchError(BaseException):
+    """Database schema revision does not match the migration head"""
@@ -1,6 +1,6 @@
 # src/common/exception_handler.py
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from src.app.api.v1.schemas.response import ORJSONResponse
 from src.common.exception import (
     BaseException,
     EmptyFieldException,
@@ -9,11 +9,14 @@ from src.common.exception import (
     TokenException,
     TokenExpiredException,
     InvalidTokenException,
+    TokenReuseDetectedException,
     UnauthorizedException,
     PermissionDeniedException,
     AccountLockedException,
     AccountDeactivatedException,
-    DatabaseConnectionError
+    SocialAccountConflictException,
+    DatabaseConnectionError,
+    ExternalServiceException
 )
 import logging
 
@@ -35,6 +38,9 @@ def exception_handler(request: Request, exc: BaseException):
     elif isinstance(exc, TokenExpiredException):
         status_code = 401
         detail = "토큰이 만료되었습니다."
+    elif isinstance(exc, TokenReuseDetectedException):
+        status_code = 401
+        detail = "이미 사용된 리프레시 토큰입니다. 다시 로그인해 주세요."
     elif isinstance(exc, InvalidTokenException):
         status_code = 401
         detail = "토큰이 유효하지 않거나 형식이 잘못되었습니다."
@@ -50,15 +56,21 @@ def exception_handler(request: Request, exc: BaseException):
     elif isinstance(exc, AccountDeactivatedException):
         status_code = 403
         detail = "계정이 비활성화되었습니다."
+    elif isinstance(exc, SocialAccountConflictException):
+        status_code = 400
+        detail = str(exc) or "이미 다른 사용자에게 연결된 소셜 계정입니다."
     elif isinstance(exc, DatabaseConnectionError):
         status_code = 500
         detail = "데이터베이스 연결 오류가 발생했습니다."
+    elif isinstance(exc, ExternalServiceException):
+        status_code = 502
+        detail = "외부 서비스 호출 중 오류가 발생했습니다."
     else:
         # 기본적으로 500 에러 반환
         status_code = 500
         detail = "내부 서버 오류가 발생했습니다."
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "error": {
@@ -0,0 +1,38 @@
+# src/common/trace.py
+
+import logging
+import sys
+
+from src.settings.environment import get_settings
+
+# 기동 시 한 번만 판정. 비활성 상태에서 trace()는 인자를 받기만 하는 빈 함수이며
+# 포맷팅/호출 위치 조회(소스 inspection)가 전혀 일어나지 않는다.
+TRACE_ENABLED: bool = bool(get_settings().logging.debug_trace)
+
+_logger = logging.getLogger("trace")
+
+
+def _noop(event: str, /, **fields) -> None:
+    return None
+
+
+def _emit(event: str, /, **fields) -> None:
+    # 포맷팅은 logging이 실제로 출력할 때만 수행 (%-style lazy)
+    _logger.debug("%s %r", event, fields)
+
+
+def _configure() -> None:
+    _logger.setLevel(logging.DEBUG)
+    if not _logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(asctime)s TRACE %(message)s"))
+        _logger.addHandler(handler)
+    _logger.propagate = False
+
+
+if TRACE_ENABLED:
+    _configure()
+
+# 사용법: trace("token.refresh.lookup", token_id=stored.id)
+# 인자 생성 자체가 비싼 경우에는 `if TRACE_ENABLED:`로 감싸서 호출
+trace = _emit if TRACE_ENABLED else _noop
@@ -1,45 +1,83 @@
-import uvicorn
+import time
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .settings.config import lifespan, logger
+from .settings.config import lifespan
 from .settings.dispatch import DispatcherLoader
-from icecream import ic
+from .app.infrastructure.cache.redis_client import RedisClient
+from .app.api.v1.schemas.response import ORJSONResponse
+
+CORS_ALLOW_ORIGINS = [
+    "http://facreport.iptime.org:8007",
+    "http://localhost:8007",
+    "http://facreport.iptime.org:8000",
+    "http://facreport.iptime.org:8001",
+    "http://facreport.iptime.org:8002",
+    "http://localhost:8001",
+]
+
+
+async def health_check():
+    redis_ok = await RedisClient.healthcheck()
+    return {
+        "status": "ok" if redis_ok else "degraded",
+        "redis": "ok" if redis_ok else "unavailable",
+    }
+
 
-class AuthApplication:
+async def auth_check():
+    return {"message": "Auth API is running"}
 
+
+def freeze_routes(app: FastAPI) -> None:
+    """
+    조립이 끝난 route table을 tuple로 고정.
+    Starlette는 요청마다 route를 순서대로 비교하므로, 이후 실수로 router가 다시 등록되어
+    table이 커지는 일이 없도록 추가 시도(append)를 즉시 실패시킨다.
+    """
+    app.router.routes = tuple(app.router.routes)
+
+
+def create_app() -> FastAPI:
+    """
+    애플리케이션 팩토리. router/middleware/exception handler를 정확히 한 번 조립하고
+    route 수와 조립 시간을 app.state.assembly에 기록한다 (lifespan 기동 시 로그 출력).
+    """
+    started = time.perf_counter()
     app = FastAPI(
         title="Auth API",
         description="Auth API",
         lifespan=lifespan,
-        docs_url="/docs"
+        docs_url="/docs",
+        default_response_class=ORJSONResponse
     )
 
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["http://facreport.iptime.org:8007", "http://localhost:8007", "http://facreport.iptime.org:8000", "http://facreport.iptime.org:8001", "http://facreport.iptime.org:8002", "http://localhost:8001"],
+        allow_origins=CORS_ALLOW_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
-    @app.get("/health")
-    async def health_check():
-        return {"status": "ok"}
-    
-    @app.get("/api/v1/auth")
-    async def auth_check():
-        return {"message": "Auth API is running"}
+    app.add_api_route("/health", health_check, methods=["GET"])
+    app.add_api_route("/api/v1/auth", auth_check, methods=["GET"])
+    DispatcherLoader.execute(app)
+    freeze_routes(app)
+
+    app.state.assembly = {
+        "routes": len(app.routes),
+        "assembly_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+    return app
 
-    def __call__(self, *args, **kwargs):
-        logger.info("AuthApplication called")
-        
-        DispatcherLoader.execute(self.app)
-        return self.app
 
-app = AuthApplication()
+app = create_app()
 
 def start():
+    # 워커는 uvicorn이 src.main을 import하므로 개발용 실행 시에만 로드
+    import uvicorn
     uvicorn.run("src.main:app", host="0.0.0.0", port=8000, reload=True)
 
 if __name__ == "__main__":
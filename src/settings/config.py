@@ -1,52 +1,76 @@
-import sys
-import os
-from loguru import logger
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from .dispatch import DispatcherLoader
 from src.app.adapters.persistence.session import AsyncRelationDataBaseTemplate
+from src.app.adapters.persistence.schema_check import check_schema
+from src.app.adapters.persistence.repositories.token_write_behind import TokenWriteBehind
+from src.app.adapters.persistence.repositories.token_cleanup import TokenCleanupJob
+from src.app.infrastructure.cache.redis_client import RedisClient
+from src.app.infrastructure.cache.revocation_bus import RevocationBus
+from src.app.api.v1.dependencies.token import apply_revocation
+from src.app.infrastructure.http.http_client import AsyncHttpClient
+from src.app.infrastructure.security.google_id_token import GoogleIdTokenVerifier
+from src.app.infrastructure.security.jwt_denylist import JwtDenylist
+from src.app.infrastructure.logging.logger import LogPipeline, api_logger as logger
+from src.app.infrastructure.monitoring import prometheus as metrics
 from src.common.logger import UVICORN_LOGGER
 from src.common.exception import DatabaseConnectionError
-from src.app.adapters.persistence.base import Base
+from src.settings.environment import get_settings
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    database = AsyncRelationDataBaseTemplate()
+    # 이전 lifespan 종료 시 정지한 로깅 listener를 다시 시작 (최초 기동에서는 이미 실행 중)
+    LogPipeline.startup()
+    # 클래스 단위 싱글턴을 그대로 사용 (lifespan에 다시 진입해도 인스턴스를 새로 만들지 않음)
+    database = AsyncRelationDataBaseTemplate
     try:
         await database.healthcheck()
     except DatabaseConnectionError as e:
         UVICORN_LOGGER.error(f"Startup failed: {e}")
         raise e
 
-    # 데이터베이스 엔진 가져오기
-    engine = database.get_engine()
+    # 스키마 생성은 배포 시 `poetry run migrate`로 한 번만 수행.
+    # 워커마다 create_all(테이블별 catalog 조회)을 돌리지 않고 alembic revision만 확인
+    await check_schema(database.get_engine())
 
-    # 비동기적으로 테이블 생성
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database tables created successfully.")
+    # 조립은 create_app()에서 한 번만 수행. 여기서는 결과만 보고
+    assembly = getattr(app.state, "assembly", None)
+    if assembly:
+        logger.info(f"Application assembled: {assembly['routes']} routes in {assembly['assembly_ms']}ms")
 
-    DispatcherLoader.execute(app)
-
-    yield
+    # Redis 커넥션 풀 생성 (Redis 장애 시에도 기동은 계속)
+    RedisClient.startup()
+    if not await RedisClient.healthcheck():
+        UVICORN_LOGGER.warning("Redis is unavailable at startup")
+    # 다른 워커/레플리카의 토큰 폐기를 구독하여 검증 캐시에 즉시 반영
+    RevocationBus.startup(handlers=[apply_revocation])
+    # 폐기된 jti Bloom filter 구성 및 증분 갱신 시작
+    JwtDenylist.startup()
 
+    # 외부 API 호출용 keep-alive 커넥션 풀 생성
+    AsyncHttpClient.startup()
+    # Google JWKS 공개키 백그라운드 갱신 시작
+    GoogleIdTokenVerifier.startup()
+    token_settings = get_settings().token
+    if token_settings.use_redis() and token_settings.token_write_behind:
+        TokenWriteBehind.startup()
+    # 만료 토큰 batch 정리 (advisory lock으로 레플리카 중 하나만 실행)
+    if token_settings.token_cleanup_enabled:
+        TokenCleanupJob.startup()
 
-# 여기서는 예시로 환경 변수를 사용.
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_SERIALIZE = os.getenv("LOG_SERIALIZE", "1")  # 1이면 serialize, 0이면 비활성화
-
-# 기존 로거 제거
-logger.remove()
+    yield
 
-# stdout로 로그 출력, JSON 직렬화 옵션(기본값: True/False)
-serialize = True if LOG_SERIALIZE == "1" else False
+    await TokenCleanupJob.shutdown()
+    await TokenWriteBehind.shutdown()
+    await RevocationBus.shutdown()
+    await JwtDenylist.shutdown()
+    await GoogleIdTokenVerifier.shutdown()
+    await AsyncHttpClient.shutdown()
+    await RedisClient.shutdown()
+    await AsyncRelationDataBaseTemplate.shutdown()
+    # multiprocess 모드: 이 워커의 in-progress/pool gauge를 합산에서 제외
+    metrics.shutdown()
+    # 큐에 남은 로그를 모두 기록하고 listener 스레드 정지
+    LogPipeline.shutdown()
 
-logger.add(
-    sys.stdout,
-    serialize=serialize,
-    level=LOG_LEVEL,
-    backtrace=True,
-    diagnose=True  # 에러 발생 시 traceback 상세 출력
-)
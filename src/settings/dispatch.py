@@ -8,6 +8,21 @@ from src.app.api.v1.endpoints.users import (
 from src.app.api.v1.endpoints.auth_google import (
     auth_google_router
 )
+from src.app.api.v1.endpoints.diagnostics import (
+    diagnostics_router
+)
+from src.app.api.v1.endpoints.admin import (
+    admin_router
+)
+from src.app.api.v1.endpoints.jwks import (
+    jwks_router
+)
+from src.app.api.v1.endpoints.metrics import (
+    metrics_router
+)
+from src.app.adapters.persistence.query_stats import QueryStatsMiddleware
+from src.app.infrastructure.monitoring.prometheus import METRICS_ENABLED, PrometheusMiddleware
+from src.settings.environment import get_settings
 
 
 class AbstractDispatcher(metaclass=ABCMeta):
@@ -22,7 +37,10 @@ class AbstractDispatcher(metaclass=ABCMeta):
 class RouterDispatcher(AbstractDispatcher):
     _ALLOWED_ROUTERS = [
         user_router,
-        auth_google_router
+        auth_google_router,
+        diagnostics_router,
+        admin_router,
+        jwks_router
     ]
 
     def execute(self):
@@ -47,10 +65,28 @@ class ExceptionDispatcher(AbstractDispatcher):
         self.app.add_exception_handler(BaseException, exception_handler)
 
 
+class MonitoringDispatcher(AbstractDispatcher):
+    """
+        요청 단위 SQL 계측 middleware, ENABLE_METRICS일 때만 /metrics와 요청 계측 middleware를 등록
+    """
+    def execute(self):
+        if get_settings().database.rdb_query_stats:
+            self.app.add_middleware(QueryStatsMiddleware)
+        if not METRICS_ENABLED:
+            return
+        self.app.include_router(metrics_router)
+        # 마지막에 추가된 middleware가 가장 바깥: CORS 등을 포함한 전체 처리 시간을 측정
+        self.app.add_middleware(PrometheusMiddleware)
+
+
 class DispatcherLoader:
-    _DISPATCHERS = [RouterDispatcher,OrmDispatcher, ExceptionDispatcher]
+    _DISPATCHERS = [RouterDispatcher, OrmDispatcher, ExceptionDispatcher, MonitoringDispatcher]
 
     @classmethod
     def execute(cls, app: FastAPI):
+        # 같은 앱에 router/handler가 중복 등록되지 않도록 한 번만 실행
+        if getattr(app.state, "dispatched", False):
+            return
         for dispatch in cls._DISPATCHERS:
             dispatch(app).execute()
+        app.state.dispatched = True
@@ -1,106 +1,244 @@
-from enum import Enum
-from kombu.utils.url import safequote
+"""
+설정은 get_settings()로 접근한다.
+- 프로세스 당 한 번만 생성(lru_cache)하고, 그룹(database, redis, ...)은 처음 접근할 때 .env/환경변수에서 읽는다
+- import 시점에는 파일을 읽거나 값을 검증하지 않으므로 워커/alembic/스크립트 기동 비용이 없다
+- 환경변수 이름은 기존과 같으며(대소문자 무시) 환경변수가 .env 값보다 우선한다
+"""
+from functools import cached_property, lru_cache
+from typing import Optional
+from urllib.parse import quote
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class _EnvSettings(BaseSettings):
+    model_config = SettingsConfigDict(extra="ignore", frozen=True)
+
+
+class DatabaseSettings(_EnvSettings):
+    rdb_lib: str = 'postgresql+asyncpg'
+    rdb_host: str = 'postgres:5432'
+    rdb_port: int = 5432
+    rdb_user: str = 'postgres'
+    rdb_pass: str = 'postgres'
+    rdb_db: str = 'auth-db'
+    rdb_driver: str = 'postgresql+asyncpg'
+    rdb_echo: bool = False
+    rdb_pool_size: int = 10
+    rdb_max_overflow: int = 20
+    rdb_pool_timeout: float = 10.0
+    rdb_pool_recycle: int = 1800
+    rdb_pool_pre_ping: bool = True
+    # asyncpg prepared statement 캐시 크기 (pgbouncer transaction 모드에서는 0)
+    rdb_statement_cache_size: int = 100
+    # 기동 시 alembic head 확인: strict(불일치 시 기동 거부) | warn | off
+    schema_check_mode: str = 'strict'
+    # 요청 단위 SQL 계측, 한 요청에서 같은 형태의 문장이 이 횟수 이상 실행되면 경고 (0이면 경고 안 함)
+    rdb_query_stats: bool = True
+    rdb_repeated_statement_threshold: int = 5
+
+    def get_url_connection(self):
+        from sqlalchemy.engine import URL
+        from src.common.trace import trace
+        trace("rdb.url", lib=self.rdb_lib, host=self.rdb_host)
 
-from dotenv import dotenv_values
-from sqlalchemy.engine import URL
-from icecream import ic
+        return URL.create(
+            drivername=self.rdb_lib,
+            host=self.rdb_host,
+            port=self.rdb_port,
+            username=self.rdb_user,
+            password=self.rdb_pass,
+            database=self.rdb_db,
+            query={
+                "driver": self.rdb_driver
+            },
+        )
 
-config = dotenv_values()
+    def get_engine_options(self) -> dict:
+        return {
+            "echo": self.rdb_echo,
+            "pool_size": self.rdb_pool_size,
+            "max_overflow": self.rdb_max_overflow,
+            "pool_timeout": self.rdb_pool_timeout,
+            "pool_recycle": self.rdb_pool_recycle,
+            "pool_pre_ping": self.rdb_pool_pre_ping,
+            "connect_args": {"statement_cache_size": self.rdb_statement_cache_size},
+        }
+
+    def get_async_url_connection(self) -> str:
+        return f"{self.rdb_lib}://{self.rdb_user}:{self.rdb_pass}@{self.rdb_host}:{self.rdb_port}/{self.rdb_db}"
+
+    def get_sync_url_connection(self) -> str:
+        """alembic 등 동기 드라이버(psycopg2)용 접속 URL"""
+        return f"postgresql+psycopg2://{self.rdb_user}:{self.rdb_pass}@{self.rdb_host}:{self.rdb_port}/{self.rdb_db}"
+
+
+class RedisSettings(_EnvSettings):
+    redis_host: str = '192.168.0.23'
+    redis_port: int = 6379
+    redis_password: str = ''
+    redis_db: int = 0
+    redis_max_connections: int = 50
+    # 풀의 커넥션이 모두 사용 중일 때 반납을 기다리는 최대 시간(초). 넘으면 ConnectionError
+    redis_pool_timeout: float = 1.0
+    redis_socket_timeout: float = 0.5
+    redis_socket_connect_timeout: float = 2.0
+    redis_health_check_interval: int = 30
+
+    def get_url(self) -> str:
+        return f"redis://:{quote(self.redis_password, safe='')}@{self.redis_host}:{self.redis_port}/{self.redis_db}"
+
+
+class TokenSettings(_EnvSettings):
+    # 토큰 저장소: database | redis
+    token_store: str = 'database'
+    # redis 저장소 사용 시 Postgres에 비동기 감사 기록 여부
+    token_write_behind: bool = True
+    token_write_behind_queue_size: int = 10000
+    token_write_behind_batch_size: int = 100
+    # 만료 토큰 정리 작업: 주기(초), batch 크기, batch 지연 한도(초)와 초과 시 쉬는 시간(초)
+    token_cleanup_enabled: bool = True
+    token_cleanup_interval: float = 3600
+    token_cleanup_batch_size: int = 5000
+    token_cleanup_max_batch_latency: float = 0.5
+    token_cleanup_pause: float = 5.0
+    # tokens 일 단위 파티션: 미리 만들어 둘 일수, 만료 후 보관 일수
+    token_partition_premake_days: int = 14
+    token_partition_retention_days: int = 1
+    # 토큰 폐기 브로드캐스트 채널과 폐기 시각(cutoff) 보관 기간(초, access JWT 최대 수명 이상)
+    token_revocation_channel: str = 'auth:revocations'
+    token_revocation_retention: int = 10800
+    # JWT jti denylist: 워커별 Bloom filter 용량/오탐률, 증분 갱신 주기(초), 전체 재구성 주기(초)
+    jwt_denylist_capacity: int = 100000
+    jwt_denylist_error_rate: float = 0.001
+    jwt_denylist_refresh_interval: float = 1.0
+    jwt_denylist_rebuild_interval: float = 1800
+
+    def use_redis(self) -> bool:
+        return self.token_store == "redis"
+
+
+class CacheSettings(_EnvSettings):
+    user_cache_enabled: bool = True
+    user_cache_maxsize: int = 10000
+    # 프로세스 내 캐시 TTL(초): 다른 워커의 변경이 반영되기까지의 최대 지연
+    user_cache_ttl: float = 5.0
+    user_cache_redis_enabled: bool = False
+    user_cache_redis_ttl: int = 300
+
+
+class DeploySettings(_EnvSettings):
+    project_state: str = 'PROD'
+
+    def is_dev(self) -> bool:
+        return self.project_state == "DEV"
+
+
+class LoggingSettings(_EnvSettings):
+    log_level: str = 'INFO'
+    log_format: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    log_dir: str = 'logs'
+    log_file_max_bytes: int = 10485760  # 10MB
+    log_file_backup_count: int = 5
+    # 비동기 로깅 큐 크기. 가득 차면 레코드를 버리고 개수만 집계
+    log_queue_size: int = 10000
+    # 개발용 상세 trace 출력 (운영에서는 false: trace 호출이 no-op)
+    debug_trace: bool = False
+
+
+class GoogleSettings(_EnvSettings):
+    google_client_id: str = '1234567890'
+    google_client_secret: str = '1234567890'
+    google_redirect_uri: str = 'http://facreport.iptime.org:8000/api/v1/auth/google/callback'
+    frontend_redirect_url: str = 'http://facreport.iptime.org:8000'
+    google_token_url: str = 'https://oauth2.googleapis.com/token'
+    google_userinfo_url: str = 'https://www.googleapis.com/oauth2/v2/userinfo'
+    google_jwks_url: str = 'https://www.googleapis.com/oauth2/v3/certs'
+    google_jwks_default_ttl: int = 3600
+    # id_token 검증 실패 시 userinfo API로 재조회할지 여부
+    google_userinfo_fallback: bool = True
+
+
+class HttpClientSettings(_EnvSettings):
+    http_timeout: float = 5.0
+    http_connect_timeout: float = 3.0
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+
+
+class MonitoringSettings(_EnvSettings):
+    # Monitoring
+    enable_metrics: bool = True
+    # 여러 워커로 실행할 때 메트릭을 합산할 전용 디렉터리 (비우면 단일 프로세스 모드)
+    prometheus_multiproc_dir: str = ''
 
 
-class DataBaseEnviornment(Enum):
-    RDB_LIB: str = config.get('RDB_LIB', 'postgresql+asyncpg')
-    RDB_HOST: str = config.get('RDB_HOST', 'postgres:5432')
-    RDB_PORT: int = config.get('RDB_PORT', 5432)
-    RDB_USER: str = config.get('RDB_USER', 'postgres')
-    RDB_PASS: str = config.get('RDB_PASS', 'postgres')
-    RDB_DB: str = config.get('RDB_DB', 'auth-db')
-    RDB_DRIVER: str = config.get('RDB_DRIVER', 'postgresql+asyncpg')
+class SecretKeySettings(_EnvSettings):
+    secret_key: str = 'REPLACE_THIS_WITH_YOUR_SECURE_SECRET_KEY'
+    algorithm: str = 'HS256'
+    jwt_verify_cache_size: int = 10000
+    # 비대칭 서명 키 묶음 파일. 없으면 SECRET_KEY(HS256)로 서명
+    jwt_keyring_path: str = 'keys/jwt_keyring.json'
+    jwt_key_algorithm: str = 'RS256'
+    # kid가 없는 기존 HS256 토큰 검증 허용 여부 (전환 기간 동안만 true)
+    jwt_accept_legacy_hs256: bool = True
+    # /.well-known/jwks.json Cache-Control max-age(초). next 키는 최소 이 시간 전에 공개되어야 함
+    jwks_max_age: int = 900
 
-    @classmethod
-    def get_url_connection(cls):
-        ic(cls.RDB_LIB.value)
-        ic(cls.RDB_HOST.value)
-        ic(cls.RDB_LIB)
-        ic(cls.RDB_HOST)
 
-        return URL.create(
-            drivername=cls.RDB_LIB.value,
-            host=cls.RDB_HOST.value,
-            port=int(cls.RDB_PORT.value),
-            username=cls.RDB_USER.value,
-            password=cls.RDB_PASS.value,
-            database=cls.RDB_DB.value,
-            query={
-                "driver": cls.RDB_DRIVER.value
-            },
-        )
-    
-    @classmethod
-    def get_async_url_connection(cls):
-        return f"{cls.RDB_LIB.value}://{cls.RDB_USER.value}:{cls.RDB_PASS.value}@{cls.RDB_HOST.value}:{cls.RDB_PORT.value}/{cls.RDB_DB.value}"
-
-class RedisEnvironment(Enum):
-    REDIS_HOST: str = config.get('REDIS_HOST', '192.168.0.23')
-    REDIS_PORT: int = int(config.get('REDIS_PORT', 6379))
-    REDIS_PASSWORD: str = config['REDIS_PASSWORD']
-    REDIS_DB: int = int(config.get('REDIS_DB', 0))
-
-    @classmethod
-    def get_url(cls) -> str:
-        return f"redis://:{safequote(cls.REDIS_PASSWORD.value)}@{cls.REDIS_HOST.value}:{cls.REDIS_PORT.value}/{cls.REDIS_DB.value}"
-
-    @classmethod
-    def get_url_connection(cls):
-        return URL.create(
-            drivername="redis",
-            host=cls.REDIS_HOST.value,
-            port=int(cls.REDIS_PORT.value),
-            password=cls.REDIS_PASSWORD.value,
-            database=cls.REDIS_DB.value,
-        )
+class Settings:
+    """설정 그룹 묶음. 각 그룹은 처음 접근할 때 한 번만 읽고 검증한다."""
 
+    def __init__(self, env_file: Optional[str] = None):
+        self.env_file = env_file
 
-class DeployEnviorment(Enum):
-    PROJECT_STATE: str = config['PROJECT_STATE']
+    def _load(self, settings_class):
+        return settings_class(_env_file=self.env_file)
 
-    @classmethod
-    def is_dev(cls) -> bool:
-        return cls.PROJECT_STATE.value == "DEV"
+    @cached_property
+    def database(self) -> DatabaseSettings:
+        return self._load(DatabaseSettings)
 
-class LoggingEnvironment(Enum):
-    LOG_LEVEL: str = config.get('LOG_LEVEL', 'INFO')
-    LOG_FORMAT: str = config.get('LOG_FORMAT', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    LOG_DIR: str = config.get('LOG_DIR', 'logs')
-    LOG_FILE_MAX_BYTES: int = int(config.get('LOG_FILE_MAX_BYTES', 10485760))  # 10MB
-    LOG_FILE_BACKUP_COUNT: int = int(config.get('LOG_FILE_BACKUP_COUNT', 5))
-    
+    @cached_property
+    def redis(self) -> RedisSettings:
+        return self._load(RedisSettings)
 
-class GoogleEnvironment(Enum):
-    GOOGLE_CLIENT_ID: str = config.get('GOOGLE_CLIENT_ID', '1234567890')
-    GOOGLE_CLIENT_SECRET: str = config.get('GOOGLE_CLIENT_SECRET', '1234567890')
-    GOOGLE_REDIRECT_URI: str = config.get('GOOGLE_REDIRECT_URI', 'http://facreport.iptime.org:8000/api/v1/auth/google/callback')
-    FRONTEND_REDIRECT_URL: str = config.get('FRONTEND_REDIRECT_URL', 'http://facreport.iptime.org:8000')
+    @cached_property
+    def token(self) -> TokenSettings:
+        return self._load(TokenSettings)
 
+    @cached_property
+    def cache(self) -> CacheSettings:
+        return self._load(CacheSettings)
 
-class MonitoringEnvironment(Enum):
-    # Monitoring
-    ENABLE_METRICS: bool = config.get('ENABLE_METRICS', True)
-    PROMETHEUS_MULTIPROC_DIR: str = config.get('PROMETHEUS_MULTIPROC_DIR', "/tmp")
-
-    @classmethod
-    def get_prometheus_multiproc_dir(cls) -> str:
-        return cls.PROMETHEUS_MULTIPROC_DIR.value
-    
-    
-class SecretKeyEnvironment(Enum):
-    SECRET_KEY: str = config.get('SECRET_KEY', 'REPLACE_THIS_WITH_YOUR_SECURE_SECRET_KEY')
-    ALGORITHM: str = config.get('ALGORITHM', 'HS256')
-
-    @classmethod
-    def get_secret_key(cls) -> str:
-        return cls.SECRET_KEY.value
-    
-    @classmethod
-    def get_algorithm(cls) -> str:
-        return cls.ALGORITHM.value
\ No newline at end of file
+    @cached_property
+    def deploy(self) -> DeploySettings:
+        return self._load(DeploySettings)
+
+    @cached_property
+    def logging(self) -> LoggingSettings:
+        return self._load(LoggingSettings)
+
+    @cached_property
+    def google(self) -> GoogleSettings:
+        return self._load(GoogleSettings)
+
+    @cached_property
+    def http(self) -> HttpClientSettings:
+        return self._load(HttpClientSettings)
+
+    @cached_property
+    def monitoring(self) -> MonitoringSettings:
+        return self._load(MonitoringSettings)
+
+    @cached_property
+    def secret(self) -> SecretKeySettings:
+        return self._load(SecretKeySettings)
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    # 기존 dotenv_values()와 같이 작업 디렉터리에서 상위로 올라가며 .env를 찾음
+    from dotenv import find_dotenv
+    return Settings(env_file=find_dotenv(usecwd=True) or None)
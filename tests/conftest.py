@@ -0,0 +1,58 @@
+import asyncio
+import os
+import time
+import uuid
+
+# 설정은 처음 접근할 때 읽으므로 src를 import하기 전에 지정
+os.environ["DEBUG_TRACE"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.app.core.domain.value_objects import UserType
+from src.app.infrastructure.cache.redis_client import RedisCache
+from src.app.infrastructure.security.jwt_denylist import JwtDenylist
+from src.app.infrastructure.security.key_ring import KeyRing
+
+
+@pytest.fixture
+def denylist(monkeypatch):
+    """
+    fakeredis 위에서 한 번 재구성한(ready) 폐기 목록. Redis가 없어도 인증 경로가 fail closed 되지 않도록
+    lifespan을 다시 거쳐도 같은 인스턴스를 반환
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+    instance = JwtDenylist(cache=RedisCache(fakeredis.FakeAsyncRedis(decode_responses=True)))
+    asyncio.run(instance.rebuild())
+    monkeypatch.setattr(JwtDenylist, "_instance", instance)
+    monkeypatch.setattr(JwtDenylist, "get_instance", classmethod(lambda cls: instance))
+    return instance
+
+
+@pytest.fixture
+def app(denylist):
+    from src.main import create_app
+    return create_app()
+
+
+@pytest.fixture
+def client(app):
+    # lifespan(스키마 확인, Redis 등)은 실행하지 않음
+    return TestClient(app)
+
+
+@pytest.fixture
+def access_token():
+    def issue(user_type: UserType = UserType.USER) -> str:
+        now = int(time.time())
+        return KeyRing.get_instance().encode({
+            "sub": f"g-{uuid.uuid4().hex}",
+            "user_id": str(uuid.uuid4()),
+            "name": "test user",
+            "email": "test@example.com",
+            "user_type": user_type.value,
+            "jti": uuid.uuid4().hex,
+            "iat": now,
+            "exp": now + 60,
+        })
+    return issue
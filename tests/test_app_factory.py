@@ -0,0 +1,30 @@
+import pytest
+from fastapi import APIRouter
+from fastapi.testclient import TestClient
+
+
+def test_route_table_is_stable_across_requests_and_lifespan(app, access_token):
+    routes = len(app.router.routes)
+    assert routes == app.state.assembly["routes"]
+
+    for _ in range(2):
+        # lifespan 재진입 (워커 재기동과 같은 경로)
+        with TestClient(app) as client:
+            client.cookies.set("access_token", access_token())
+            for _ in range(20):
+                assert client.get("/api/v1/auth").status_code == 200
+                assert client.get("/api/v1/users/me").status_code == 200
+                assert client.get("/api/v1/unknown").status_code == 404
+        assert len(app.router.routes) == routes
+
+
+def test_frozen_route_table_rejects_new_routers(app):
+    router = APIRouter(prefix="/api/v1/late")
+    router.add_api_route("", lambda: None, methods=["GET"])
+    routes = len(app.router.routes)
+
+    with pytest.raises(AttributeError):
+        app.include_router(router)
+    with pytest.raises(AttributeError):
+        app.add_api_route("/late", lambda: None, methods=["GET"])
+    assert len(app.router.routes) == routes
@@ -0,0 +1,141 @@
+import asyncio
+import time
+from urllib.parse import parse_qs
+
+import httpx
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from src.app.api.v1.dependencies.token import get_token_verifier
+from src.app.api.v1.dependencies.user import get_user_service
+from src.app.core.services.user_service import UserService
+from src.app.infrastructure.http.http_client import AsyncHttpClient, get_http_client
+from src.app.infrastructure.security.google_id_token import GoogleIdTokenVerifier, JwksCache, get_id_token_verifier
+from src.settings.environment import get_settings
+
+
+class InMemorySocialUserRepository:
+    def __init__(self):
+        self.users = {}
+
+    async def get_by_social_account(self, provider, provider_id):
+        return self.users.get((provider, provider_id))
+
+    async def find_or_create_by_social_account(self, user, provider, provider_id):
+        return self.users.setdefault((provider, provider_id), user)
+
+
+class StubGoogle:
+    """토큰 교환/userinfo 요청을 기록하고 고정 응답을 돌려주는 구글 OAuth 스텁 (httpx.MockTransport)"""
+
+    def __init__(self, token_response: dict, userinfo: dict = None):
+        self.token_response = token_response
+        self.userinfo = userinfo
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        google = get_settings().google
+        if request.method == "POST" and str(request.url) == google.google_token_url:
+            return httpx.Response(200, json=self.token_response)
+        if request.method == "GET" and str(request.url) == google.google_userinfo_url and self.userinfo:
+            return httpx.Response(200, json=self.userinfo)
+        return httpx.Response(404)
+
+    def paths(self):
+        return [(request.method, str(request.url)) for request in self.requests]
+
+
+GOOGLE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+GOOGLE_JWKS = {"keys": [{**jwt.algorithms.RSAAlgorithm.to_jwk(GOOGLE_KEY.public_key(), as_dict=True), "kid": "key-1"}]}
+
+
+def sign_id_token(**overrides) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": get_settings().google.google_client_id,
+        "sub": "google-1",
+        "email": "stub@example.com",
+        "name": "stub user",
+        "iat": now,
+        "exp": now + 3600,
+        **overrides,
+    }
+    return jwt.encode(claims, GOOGLE_KEY, algorithm="RS256", headers={"kid": "key-1"})
+
+
+def call_callback(app, google: StubGoogle, repository=None) -> httpx.Response:
+    repository = repository or InMemorySocialUserRepository()
+    outbound = httpx.AsyncClient(transport=httpx.MockTransport(google))
+    app.dependency_overrides[get_http_client] = lambda: AsyncHttpClient(outbound)
+    app.dependency_overrides[get_user_service] = lambda: UserService(repository)
+    app.dependency_overrides[get_id_token_verifier] = lambda: GoogleIdTokenVerifier(JwksCache.from_jwks(GOOGLE_JWKS))
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        try:
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                return await client.get("/api/v1/auth/google/callback", params={"code": "auth-code", "state": "kr"})
+        finally:
+            await outbound.aclose()
+    return asyncio.run(scenario())
+
+
+def test_callback_exchanges_code_and_sets_cookie(app):
+    google = StubGoogle(
+        token_response={"access_token": "google-access"},
+        userinfo={"id": "google-1", "email": "stub@example.com", "name": "stub user"},
+    )
+    repository = InMemorySocialUserRepository()
+
+    response = call_callback(app, google, repository)
+
+    settings = get_settings().google
+    assert response.status_code == 302
+    assert response.headers["location"] == settings.frontend_redirect_url
+    assert google.paths() == [("POST", settings.google_token_url), ("GET", settings.google_userinfo_url)]
+    assert parse_qs(google.requests[0].content.decode())["code"] == ["auth-code"]
+    assert google.requests[1].headers["authorization"] == "Bearer google-access"
+
+    user = repository.users[("google", "google-1")]
+    claims = get_token_verifier().verify(response.cookies["access_token"]).claims
+    assert claims["user_id"] == str(user.user_id)
+    assert claims["email"] == "stub@example.com"
+
+
+def test_verified_id_token_skips_userinfo(app):
+    google = StubGoogle(token_response={"access_token": "google-access", "id_token": sign_id_token()})
+
+    response = call_callback(app, google)
+
+    assert response.status_code == 302
+    assert google.paths() == [("POST", get_settings().google.google_token_url)]
+    assert get_token_verifier().verify(response.cookies["access_token"]).claims["sub"] == "google-1"
+
+
+def test_invalid_id_token_falls_back_to_userinfo(app):
+    google = StubGoogle(
+        token_response={"access_token": "google-access", "id_token": sign_id_token(aud="another-client")},
+        userinfo={"id": "google-1", "email": "stub@example.com", "name": "stub user"},
+    )
+
+    response = call_callback(app, google)
+
+    assert response.status_code == 302
+    assert google.paths()[-1] == ("GET", get_settings().google.google_userinfo_url)
+
+
+def test_invalid_id_token_is_rejected_without_fallback(app, monkeypatch):
+    # 설정 그룹은 처음 접근할 때 읽어 캐시하므로, 환경변수를 바꾼 뒤 캐시된 그룹을 비움 (테스트 후 복원)
+    monkeypatch.setenv("GOOGLE_USERINFO_FALLBACK", "false")
+    monkeypatch.delitem(vars(get_settings()), "google")
+    google = StubGoogle(
+        token_response={"access_token": "google-access", "id_token": sign_id_token(aud="another-client")},
+        userinfo={"id": "google-1", "email": "stub@example.com", "name": "stub user"},
+    )
+
+    response = call_callback(app, google)
+
+    assert response.status_code == 400
+    assert google.paths() == [("POST", get_settings().google.google_token_url)]
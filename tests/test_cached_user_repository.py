@@ -0,0 +1,72 @@
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from src.app.adapters.persistence.repositories.cached_user_repository import CachedUserRepository, UserCache
+from src.app.core.domain.entities.user import UserEntity
+from src.app.core.domain.value_objects import UserState, UserType
+
+
+class SlowUserRepository:
+    """get_by_id가 released 이벤트가 설정될 때까지 DB 조회 도중에 머무는 저장소"""
+
+    def __init__(self, user: UserEntity):
+        self.user = user
+        self.loading = asyncio.Event()
+        self.released = asyncio.Event()
+
+    async def get_by_id(self, user_id):
+        loaded = replace(self.user)
+        self.loading.set()
+        await self.released.wait()
+        return loaded
+
+    async def update(self, user: UserEntity):
+        self.user = replace(user)
+        return replace(user)
+
+
+def make_user() -> UserEntity:
+    now = datetime.now(timezone.utc)
+    return UserEntity(
+        user_id=uuid4(), name="cached user", email="cached@example.com", user_type=UserType.USER.value,
+        created_at=now, updated_at=now, last_login=now, state=UserState.ACTIVE.value, social_accounts={},
+    )
+
+
+def test_update_during_load_is_not_overwritten_by_stale_read():
+    async def scenario():
+        user = make_user()
+        repository = SlowUserRepository(user)
+        cached = CachedUserRepository(repository, UserCache())
+
+        # 캐시 miss로 DB 조회가 시작된 사이에 상태 변경이 커밋되고 캐시가 무효화됨
+        load = asyncio.create_task(cached.get_by_id(user.user_id))
+        await repository.loading.wait()
+        await cached.update(replace(user, state=UserState.HIDDEN.value))
+        repository.released.set()
+
+        # 먼저 시작한 조회는 조회 시점의 값을 돌려주지만 캐시에는 남기지 않음
+        assert (await load).state == UserState.ACTIVE.value
+        assert (await cached.get_by_id(user.user_id)).state == UserState.HIDDEN.value
+        assert cached.cache._invalidations == {}
+
+    asyncio.run(scenario())
+
+
+def test_load_without_interleaving_is_cached():
+    async def scenario():
+        user = make_user()
+        repository = SlowUserRepository(user)
+        repository.released.set()
+        cache = UserCache()
+        cached = CachedUserRepository(repository, cache)
+
+        await cached.get_by_id(user.user_id)
+        await cached.get_by_id(user.user_id)
+
+        assert cache.misses == 1
+        assert cache.local_hits == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from src.app.infrastructure.http.http_client import AsyncHttpClient
+from src.app.infrastructure.security.google_id_token import GoogleIdTokenVerifier, JwksCache
+from src.common.exception import InvalidTokenException
+
+CLIENT_ID = "client-id.apps.googleusercontent.com"
+JWKS_URL = "https://jwks.test/oauth2/v3/certs"
+
+
+class SigningKey:
+    def __init__(self, kid: str):
+        self.kid = kid
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def jwk(self) -> dict:
+        jwk = jwt.algorithms.RSAAlgorithm.to_jwk(self.private_key.public_key(), as_dict=True)
+        return {**jwk, "kid": self.kid, "use": "sig", "alg": "RS256"}
+
+    def sign(self, **overrides) -> str:
+        now = int(time.time())
+        claims = {
+            "iss": "https://accounts.google.com",
+            "aud": CLIENT_ID,
+            "sub": "google-1",
+            "email": "google@example.com",
+            "name": "google user",
+            "iat": now,
+            "exp": now + 3600,
+            **overrides,
+        }
+        return jwt.encode(claims, self.private_key, algorithm="RS256", headers={"kid": self.kid})
+
+
+KEY = SigningKey("key-1")
+
+
+def verify(token: str, jwks: JwksCache = None) -> dict:
+    verifier = GoogleIdTokenVerifier(jwks or JwksCache.from_jwks({"keys": [KEY.jwk()]}), client_id=CLIENT_ID)
+    return asyncio.run(verifier.verify(token))
+
+
+def test_valid_id_token_verifies_locally():
+    claims = verify(KEY.sign())
+    assert claims["sub"] == "google-1"
+    assert claims["email"] == "google@example.com"
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"aud": "another-client"},
+        {"iss": "https://evil.example.com"},
+        {"iat": int(time.time()) - 7200, "exp": int(time.time()) - 3600},
+    ],
+    ids=["audience", "issuer", "expired"],
+)
+def test_rejects_wrong_audience_issuer_and_expired(overrides):
+    with pytest.raises(InvalidTokenException):
+        verify(KEY.sign(**overrides))
+
+
+def test_rejects_token_signed_by_another_key_with_same_kid():
+    with pytest.raises(InvalidTokenException):
+        verify(SigningKey(KEY.kid).sign())
+
+
+def test_unknown_kid_refetches_jwks_once():
+    rotated = SigningKey("key-2")
+    served = {"keys": [KEY.jwk()]}
+    fetches = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        fetches.append(request)
+        return httpx.Response(200, json=served, headers={"cache-control": "public, max-age=3600"})
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            jwks = JwksCache(AsyncHttpClient(client), JWKS_URL, min_refresh_interval=30)
+            verifier = GoogleIdTokenVerifier(jwks, client_id=CLIENT_ID)
+            await verifier.verify(KEY.sign())
+            assert len(fetches) == 1
+
+            # 구글이 키를 교체: 최소 간격이 지난 뒤 새 kid가 동시에 들어와도 JWKS는 한 번만 다시 받음
+            served["keys"].append(rotated.jwk())
+            jwks._last_fetch -= jwks.min_refresh_interval
+            results = await asyncio.gather(verifier.verify(rotated.sign()), verifier.verify(rotated.sign()))
+            assert [claims["sub"] for claims in results] == ["google-1", "google-1"]
+            assert len(fetches) == 2
+
+            # 최소 간격 안에서는 모르는 kid가 와도 다시 받지 않음
+            with pytest.raises(InvalidTokenException):
+                await verifier.verify(SigningKey("key-3").sign())
+            assert len(fetches) == 2
+
+    asyncio.run(scenario())
@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+from scripts.check_importtime import TARGET, budget_ms, measure
+
+
+def test_startup_import_path_has_no_forbidden_modules():
+    # 새 인터프리터에서 `python -X importtime -c "import src.main"`을 실행
+    report = measure(runs=1)
+
+    assert report.forbidden == []
+
+
+@pytest.mark.skipif(
+    "IMPORT_BUDGET_MS" not in os.environ,
+    reason="wall-clock 측정은 호스트 부하에 따라 흔들리므로 IMPORT_BUDGET_MS를 지정할 때만 실행",
+)
+def test_startup_import_time_within_budget():
+    report = measure(runs=5)
+
+    assert report.best_ms <= budget_ms(), f"import {TARGET} took {report.best_ms:.1f} ms (runs: {report.totals_ms})"
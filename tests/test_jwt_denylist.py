@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.app.infrastructure.cache.redis_client import RedisCache
+from src.app.infrastructure.security.jwt_denylist import JwtDenylist
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class DownRedisCache(RedisCache):
+    """모든 조회가 연결 오류로 실패하는 Redis"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def exists(self, key: str) -> bool:
+        self.calls += 1
+        raise RedisConnectionError("redis is down")
+
+
+def run(scenario):
+    async def wrapper():
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        try:
+            return await scenario(JwtDenylist(cache=RedisCache(client)), client)
+        finally:
+            await client.aclose()
+    return asyncio.run(wrapper())
+
+
+def test_cold_start_checks_redis_before_first_rebuild():
+    async def scenario(denylist, client):
+        # 다른 인스턴스가 폐기한 jti: 이 인스턴스의 Bloom filter에는 아직 없음
+        await client.set(JwtDenylist.KEY.format("revoked"), 1, ex=60)
+        assert denylist.stats()["ready"] is False
+        assert await denylist.is_revoked("revoked") is True
+        assert await denylist.is_revoked("unknown") is False
+        assert denylist.negatives == 0
+    run(scenario)
+
+
+def test_cold_start_fails_closed_when_redis_is_down():
+    denylist = JwtDenylist(cache=DownRedisCache())
+    assert asyncio.run(denylist.is_revoked("any")) is True
+    assert denylist.errors == 1
+
+
+def test_bloom_miss_skips_redis_after_rebuild():
+    async def scenario(denylist, client):
+        await denylist.revoke("revoked", time.time() + 60)
+        await denylist.rebuild()
+        assert denylist.stats()["ready"] is True
+        assert await denylist.is_revoked("revoked") is True
+        # 재구성 이후에는 Redis가 죽어도 Bloom filter의 "없음"만으로 통과
+        await client.aclose()
+        denylist._cache = DownRedisCache()
+        assert await denylist.is_revoked("unknown") is False
+        assert denylist._cache.calls == 0
+        assert denylist.negatives == 1
+    run(scenario)
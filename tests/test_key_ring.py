@@ -0,0 +1,80 @@
+import time
+import uuid
+
+import jwt
+import pytest
+
+from src.app.infrastructure.security.key_ring import KeyRing, KeyStatus
+from src.app.infrastructure.security.token_verifier import TokenVerifier
+from src.common.exception import InvalidTokenException
+from src.settings.environment import get_settings
+
+
+def claims() -> dict:
+    now = int(time.time())
+    return {"user_id": str(uuid.uuid4()), "jti": uuid.uuid4().hex, "iat": now, "exp": now + 600}
+
+
+def make_verifier(key_ring: KeyRing) -> TokenVerifier:
+    return TokenVerifier(render=lambda claims: b"{}", key_ring=key_ring, accept_legacy=False)
+
+
+def test_rotated_key_signs_with_kid_and_verifies(tmp_path):
+    key_ring = KeyRing(path=str(tmp_path / "keyring.json"))
+    active = key_ring.rotate("RS256")
+    key_ring.save()
+
+    token = key_ring.encode(claims())
+
+    assert jwt.get_unverified_header(token)["kid"] == active.kid
+    assert make_verifier(key_ring).verify(token).claims["jti"]
+    # 다음 순환 키는 서명 전에 JWKS로 먼저 공개됨
+    statuses = {key.kid: key.status for key in key_ring.list()}
+    assert sorted(statuses.values()) == [KeyStatus.ACTIVE, KeyStatus.NEXT]
+    assert {jwk["kid"] for jwk in key_ring.jwks()["keys"]} == set(statuses)
+
+
+def test_other_worker_picks_up_rotation_and_retirement(tmp_path):
+    path = str(tmp_path / "keyring.json")
+    key_ring = KeyRing(path=path)
+    old = key_ring.rotate("EdDSA")
+    key_ring.save()
+    worker = KeyRing(path=path, check_interval=0)
+    old_token = key_ring.encode(claims())
+
+    new = key_ring.rotate("EdDSA")
+    key_ring.retire(old.kid)
+    key_ring.save()
+    new_token = key_ring.encode(claims())
+    # 다른 워커는 다음 서명/JWKS 응답 시 파일 변경(mtime)을 확인하여 회전을 반영
+    worker.reload_if_changed()
+
+    verifier = make_verifier(worker)
+    assert jwt.get_unverified_header(new_token)["kid"] == new.kid
+    assert verifier.verify(new_token).claims["jti"]
+    with pytest.raises(InvalidTokenException):
+        verifier.verify(old_token)
+
+
+def test_signing_key_cannot_be_retired(tmp_path):
+    key_ring = KeyRing(path=str(tmp_path / "keyring.json"))
+    active = key_ring.rotate("RS256")
+    with pytest.raises(ValueError):
+        key_ring.retire(active.kid)
+
+
+def test_jwks_endpoint_is_cacheable(client, tmp_path, monkeypatch):
+    key_ring = KeyRing(path=str(tmp_path / "keyring.json"))
+    key_ring.rotate("RS256")
+    key_ring.save()
+    monkeypatch.setattr(KeyRing, "_instance", key_ring)
+
+    response = client.get("/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == f"public, max-age={get_settings().secret.jwks_max_age}"
+    assert [jwk["kid"] for jwk in response.json()["keys"]] == [key.kid for key in key_ring.list()]
+    assert all("d" not in jwk for jwk in response.json()["keys"])
+
+    revalidated = client.get("/.well-known/jwks.json", headers={"If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
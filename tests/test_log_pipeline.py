@@ -0,0 +1,33 @@
+import logging
+
+from src.app.infrastructure.logging.logger import LogPipeline, api_logger
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_records_after_shutdown_are_written_on_restart():
+    pipeline = LogPipeline.get_instance()
+    collected = _Collect()
+    pipeline.listener.handlers = pipeline.listener.handlers + (collected,)
+    try:
+        LogPipeline.shutdown()
+        api_logger.warning("logged while stopped")
+
+        # 인스턴스와 로거의 handler는 그대로이므로 레코드는 버려지지 않고 큐에 남음
+        assert LogPipeline.get_instance() is pipeline
+        assert pipeline.handler in api_logger.handlers
+        assert pipeline.queue.qsize() == 1
+
+        LogPipeline.startup()
+        LogPipeline.shutdown()
+        assert "logged while stopped" in collected.messages
+    finally:
+        pipeline.listener.handlers = tuple(h for h in pipeline.listener.handlers if h is not collected)
+        LogPipeline.startup()
@@ -0,0 +1,62 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.app.infrastructure.monitoring import prometheus as metrics
+
+pytestmark = pytest.mark.skipif(not metrics.METRICS_ENABLED, reason="ENABLE_METRICS=false")
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/metrics-test/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    app.add_middleware(metrics.PrometheusMiddleware)
+    return app
+
+
+def requests_total(method: str, route: str, status: str) -> float:
+    from prometheus_client import REGISTRY
+    value = REGISTRY.get_sample_value("http_requests_total", {"method": method, "route": route, "status": status})
+    return value or 0.0
+
+
+def get_all(*paths: str):
+    async def scenario():
+        transport = httpx.ASGITransport(app=make_app())
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return [(await client.get(path)).status_code for path in paths]
+    return asyncio.run(scenario())
+
+
+def test_requests_are_labelled_by_route_template():
+    route = "/metrics-test/items/{item_id}"
+    before = requests_total("GET", route, "200")
+
+    assert get_all("/metrics-test/items/1", "/metrics-test/items/2") == [200, 200]
+
+    assert requests_total("GET", route, "200") == before + 2
+    assert requests_total("GET", "/metrics-test/items/1", "200") == 0
+
+
+def test_unmatched_paths_share_one_label():
+    before = requests_total("GET", metrics.UNMATCHED_ROUTE, "404")
+
+    assert get_all("/metrics-test/scan/a", "/metrics-test/scan/b", "/metrics-test/scan/c") == [404, 404, 404]
+
+    assert requests_total("GET", metrics.UNMATCHED_ROUTE, "404") == before + 3
+    assert requests_total("GET", "/metrics-test/scan/a", "404") == 0
+
+
+def test_metrics_endpoint_exposes_request_counters(client):
+    client.get("/metrics")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == metrics.CONTENT_TYPE_LATEST
+    assert 'http_requests_total{method="GET",route="/metrics",status="200"}' in response.text
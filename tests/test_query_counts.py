@@ -0,0 +1,69 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from src.app.adapters.persistence.query_stats import _START_KEY, track_queries
+from src.app.adapters.persistence.session import AsyncRelationDataBaseTemplate
+from src.app.api.v1.dependencies.user import get_user_service
+
+# 서비스 호출당 허용하는 최대 SQL 문장 수 (scripts/check_query_counts.py와 같은 기준: 사용자 캐시가 켜진 기본 설정)
+# 이메일 중복 확인, INSERT, 소셜 계정 동기화, 재조회
+CREATE_USER_BUDGET = 4
+# 소셜 계정 중복 확인, 사용자 조회, UPDATE, 소셜 계정 동기화(DELETE/INSERT), 재조회
+ADD_SOCIAL_ACCOUNT_BUDGET = 6
+
+
+def run(coro):
+    async def wrapper():
+        try:
+            return await coro
+        finally:
+            # 테스트마다 event loop가 달라지므로 풀을 닫아 다음 테스트가 새 커넥션을 쓰도록 함
+            await AsyncRelationDataBaseTemplate.shutdown()
+    return asyncio.run(wrapper())
+
+
+async def _create_user_and_link_account():
+    email = f"query-count-{uuid.uuid4().hex[:12]}@example.com"
+    user = None
+    try:
+        async with AsyncRelationDataBaseTemplate.get_session() as session:
+            # 엔드포인트와 같은 조립 (USER_CACHE_ENABLED이면 CachedUserRepository)
+            service = await get_user_service(session)
+            with track_queries() as created:
+                user = await service.create_user("query count", email)
+            with track_queries() as linked:
+                await service.add_social_account(user.user_id, "google", f"g-{uuid.uuid4().hex}")
+        return created, linked
+    finally:
+        if user is not None:
+            async with AsyncRelationDataBaseTemplate.get_session() as session:
+                await session.execute(text("DELETE FROM users WHERE user_id = :user_id"), {"user_id": user.user_id})
+
+
+def test_user_service_statement_budgets():
+    created, linked = run(_create_user_and_link_account())
+
+    assert 0 < created.statements <= CREATE_USER_BUDGET, created.shapes
+    assert 0 < linked.statements <= ADD_SOCIAL_ACCOUNT_BUDGET, linked.shapes
+
+
+async def _fail_then_succeed():
+    async with AsyncRelationDataBaseTemplate.get_engine().connect() as conn:
+        with track_queries() as stats:
+            with pytest.raises(DBAPIError):
+                await conn.execute(text("SELECT 1 / 0"))
+            leftover = list((await conn.get_raw_connection()).info.get(_START_KEY) or [])
+            await conn.rollback()
+            await conn.execute(text("SELECT 1"))
+    return stats, leftover
+
+
+def test_failed_statement_does_not_leave_start_time():
+    stats, leftover = run(_fail_then_succeed())
+
+    assert leftover == []
+    assert stats.statements == 2
@@ -0,0 +1,113 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.app.adapters.persistence.repositories.redis_token_repository import RedisTokenRepository
+from src.app.core.domain.entities.token import TokenEntity
+from src.app.infrastructure.cache.redis_client import RedisCache
+from src.app.infrastructure.security.hashing import hash_token
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def run(scenario):
+    async def wrapper():
+        # rotate는 Lua 스크립트이므로 fakeredis의 Lua 지원(lupa)이 필요
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        try:
+            return await scenario(RedisTokenRepository(RedisCache(client)), client)
+        finally:
+            await client.aclose()
+    return asyncio.run(wrapper())
+
+
+def issue(user_id=None) -> TokenEntity:
+    now = datetime.now(timezone.utc)
+    return TokenEntity(
+        user_id=user_id or uuid4(),
+        access_token=f"access-{uuid4().hex}",
+        refresh_token=f"refresh-{uuid4().hex}",
+        access_token_expires=now + timedelta(minutes=30),
+        refresh_token_expires=now + timedelta(days=7),
+        created_at=now,
+    )
+
+
+def test_create_and_lookup_through_async_cache():
+    async def scenario(repository, client):
+        token = await repository.create(issue())
+        by_access = await repository.get_by_access_token(token.access_token)
+        by_refresh = await repository.get_by_refresh_token(token.refresh_token)
+        ttl = await client.ttl(RedisTokenRepository.ACCESS_KEY.format(by_refresh.access_token))
+        return token, by_access, by_refresh, ttl
+
+    token, by_access, by_refresh, ttl = run(scenario)
+
+    assert by_access.user_id == by_refresh.user_id == token.user_id
+    assert by_access.family_id == token.family_id
+    assert 0 < ttl <= 30 * 60
+
+
+def test_revoke_all_user_tokens():
+    async def scenario(repository, client):
+        user_id = uuid4()
+        tokens = [await repository.create(issue(user_id)) for _ in range(2)]
+        revoked = await repository.revoke_tokens_for_users([user_id])
+        return revoked, [await repository.get_by_access_token(t.access_token) for t in tokens]
+
+    revoked, stored = run(scenario)
+
+    assert revoked == 2
+    assert all(token.is_revoked for token in stored)
+
+
+def test_rotate_revokes_old_token_once():
+    async def scenario(repository, client):
+        old = await repository.create(issue())
+        new = issue(old.user_id)
+        args = (new.access_token, new.refresh_token, new.access_token_expires, new.refresh_token_expires)
+        rotated = await repository.rotate(old.refresh_token, *args)
+        reused = await repository.rotate(old.refresh_token, *args)
+        refresh_hash = hash_token(new.refresh_token).hex()
+        return (
+            old, rotated, reused,
+            await repository.get_by_access_token(old.access_token),
+            await client.smembers(RedisTokenRepository.USER_KEY.format(old.user_id)),
+            await client.smembers(RedisTokenRepository.FAMILY_KEY.format(old.family_id)),
+            refresh_hash,
+        )
+
+    old, rotated, reused, old_access, user_set, family_set, refresh_hash = run(scenario)
+
+    assert rotated.user_id == old.user_id and rotated.family_id == old.family_id
+    assert reused is None
+    assert old_access.is_revoked
+    assert refresh_hash in user_set and refresh_hash in family_set
+
+
+def test_rotate_skips_record_changed_after_read():
+    async def scenario(repository, client):
+        old = await repository.create(issue())
+        get = repository.cache.get
+
+        async def get_then_revoke(key):
+            # GET과 스크립트 실행 사이에 다른 요청이 같은 family를 폐기한 경우
+            raw = await get(key)
+            await repository.revoke_token_family(old.family_id)
+            return raw
+
+        repository.cache.get = get_then_revoke
+        new = issue(old.user_id)
+        rotated = await repository.rotate(
+            old.refresh_token, new.access_token, new.refresh_token,
+            new.access_token_expires, new.refresh_token_expires,
+        )
+        repository.cache.get = get
+        return rotated, await repository.get_by_access_token(new.access_token)
+
+    rotated, issued = run(scenario)
+
+    assert rotated is None
+    assert issued is None
@@ -0,0 +1,55 @@
+import time
+import uuid
+
+import pytest
+
+from src.app.infrastructure.security.key_ring import KeyRing
+from src.app.infrastructure.security.token_verifier import TokenVerifier
+from src.common.exception import InvalidTokenException
+
+
+def make_verifier() -> TokenVerifier:
+    return TokenVerifier(render=lambda claims: b"{}")
+
+
+def encode(user_id: str, iat: int) -> str:
+    return KeyRing.get_instance().encode({"user_id": user_id, "jti": uuid.uuid4().hex, "iat": iat, "exp": iat + 600})
+
+
+def test_cutoff_is_whole_seconds():
+    verifier = make_verifier()
+    user_id = str(uuid.uuid4())
+    now = int(time.time())
+    before, same_second = encode(user_id, now - 1), encode(user_id, now)
+
+    verifier.revoke_users([user_id], now + 0.7)
+
+    with pytest.raises(InvalidTokenException):
+        verifier.verify(before)
+    # 폐기 직후 같은 초에 재발급된 토큰은 통과
+    assert verifier.verify(same_second).claims["user_id"] == user_id
+
+
+def test_cutoffs_are_not_evicted_by_volume():
+    verifier = make_verifier()
+    now = time.time()
+    first = str(uuid.uuid4())
+    verifier.revoke_users([first], now)
+    # 이전 LRU 크기(100,000)를 넘는 사용자를 폐기해도 먼저 폐기한 사용자의 cutoff가 유지됨
+    verifier.revoke_users((str(uuid.uuid4()) for _ in range(150_000)), now)
+
+    with pytest.raises(InvalidTokenException):
+        verifier.verify(encode(first, int(now) - 1))
+
+
+def test_cutoffs_are_pruned_after_retention():
+    verifier = make_verifier()
+    now = int(time.time())
+    stale, renewed = str(uuid.uuid4()), str(uuid.uuid4())
+    verifier.revoke_users([stale, renewed], now)
+    verifier.revoke_users([renewed], now + 60)
+
+    verifier._prune_revocations(now=now + verifier._revocation_retention)
+
+    assert stale not in verifier._revoked_before
+    assert verifier._revoked_before[renewed] == now + 60
@@ -0,0 +1,50 @@
+import inspect
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator
+
+from src.common import trace as trace_module
+
+_INSPECT_FUNCTIONS = ("stack", "currentframe", "getframeinfo", "getouterframes", "getsource", "getsourcelines")
+
+
+@contextmanager
+def count_frame_inspection(monkeypatch) -> Iterator[Counter]:
+    """호출 위치/소스 조회(inspect.*, sys._getframe) 호출 횟수를 함수 이름별로 집계"""
+    calls: Counter = Counter()
+    original_getframe = sys._getframe
+
+    def _getframe(depth: int = 0):
+        calls["sys._getframe"] += 1
+        # 감싼 함수 한 단계를 건너뛰어 호출부가 기대하는 frame을 반환
+        return original_getframe(depth + 1)
+
+    def spy(name, func):
+        def wrapper(*args, **kwargs):
+            calls[f"inspect.{name}"] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    with monkeypatch.context() as patch:
+        patch.setattr(sys, "_getframe", _getframe)
+        for name in _INSPECT_FUNCTIONS:
+            patch.setattr(inspect, name, spy(name, getattr(inspect, name)))
+        yield calls
+
+
+def test_trace_is_noop_when_disabled():
+    assert trace_module.TRACE_ENABLED is False
+    assert trace_module.trace is trace_module._noop
+
+
+def test_users_me_does_not_inspect_frames_when_trace_disabled(client, access_token, monkeypatch):
+    client.cookies.set("access_token", access_token())
+    # 첫 요청은 pydantic/typing의 지연 초기화(TypeAdapter 생성 등)가 frame을 조회하므로 제외
+    assert client.get("/api/v1/users/me").status_code == 200
+
+    with count_frame_inspection(monkeypatch) as calls:
+        response = client.get("/api/v1/users/me")
+
+    assert response.status_code == 200
+    assert dict(calls) == {}
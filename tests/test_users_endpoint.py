@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from src.app.api.v1.dependencies.logger import get_auth_logger
+from src.app.api.v1.dependencies.user import get_user_service
+from src.app.core.domain.entities.user import UserEntity
+from src.app.core.domain.value_objects import UserState, UserType
+from src.app.core.services.user_service import UserService
+
+
+class InMemoryUserRepository:
+    def __init__(self, *users: UserEntity):
+        self.users = {user.user_id: user for user in users}
+
+    async def get_by_id(self, user_id):
+        return self.users.get(user_id)
+
+    async def update(self, user: UserEntity):
+        self.users[user.user_id] = user
+        return user
+
+
+class RecordingLogger:
+    def __init__(self):
+        self.records = []
+
+    def _record(self, level, message, fields):
+        self.records.append((level, message, fields))
+
+    def debug(self, message: str, **kwargs) -> None:
+        self._record("DEBUG", message, kwargs)
+
+    def info(self, message: str, **kwargs) -> None:
+        self._record("INFO", message, kwargs)
+
+    def warning(self, message: str, **kwargs) -> None:
+        self._record("WARNING", message, kwargs)
+
+    def error(self, message: str, **kwargs) -> None:
+        self._record("ERROR", message, kwargs)
+
+    def critical(self, message: str, **kwargs) -> None:
+        self._record("CRITICAL", message, kwargs)
+
+
+def test_change_user_state_returns_200_and_logs_state_name(app, client):
+    now = datetime.now(timezone.utc)
+    user = UserEntity(
+        user_id=uuid4(), name="state user", email="state@example.com", user_type=UserType.USER.value,
+        created_at=now, updated_at=now, last_login=now, state=UserState.ACTIVE.value,
+    )
+    repository = InMemoryUserRepository(user)
+    logger = RecordingLogger()
+    app.dependency_overrides[get_user_service] = lambda: UserService(repository)
+    app.dependency_overrides[get_auth_logger] = lambda: logger
+
+    response = client.patch(f"/api/v1/users/{user.user_id}/state", params={"state": UserState.HIDDEN.value})
+
+    assert response.status_code == 200
+    assert response.json()["data"]["user_id"] == str(user.user_id)
+    assert repository.users[user.user_id].state == UserState.HIDDEN.value
+    assert logger.records == [
+        ("INFO", "Changing user state", {"user_id": str(user.user_id), "new_state": "HIDDEN"}),
+        ("INFO", "User state changed", {"user_id": str(user.user_id), "new_state": "HIDDEN"}),
+    ]